@@ -1,48 +1,161 @@
 """CLI: python -m evaluator.cli evaluate --file repos.xlsx"""
 
+import importlib
 import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Iterable, Iterator, NamedTuple
 
 import typer
-from dotenv import load_dotenv
 
-load_dotenv()
-
-from .context_collector import collect_context
 from .logger import get_logger, log_repo_error
-from .pipeline_runner import run_pipeline, _find_entrypoint, _repo_uses_azure_ingestion
-from .repo_cloner import clone_repo
-from .scoring import load_config, compute_final_score_as_average, metric_value, BOOL_METRICS, DEFAULT_MAX_SCORE
-from .spreadsheet import (
-    load_input,
-    get_repo_rows,
-    build_result_row,
-    write_results,
-    RESULT_COLUMNS,
-    REPO_URL_COL,
-)
-from .detectors import (
-    run_checks,
-    compute_dimension_scores,
-    build_deterministic_summary,
-    build_deterministic_evaluation_report_compact,
-)
-from .llm_evaluator import get_run_command_from_readme, generate_evaluation_summary_llm, format_docker_results_for_summary
-from .security_scorer import compute_security_score
 from .utils import ensure_dirs, get_output_dir
 
+# Evaluation modules pull in pandas, openpyxl, openai and yaml; they are imported on first use so that
+# `--help` and argument errors stay fast. Names resolve as module attributes (PEP 562 __getattr__).
+_LAZY_IMPORTS = {
+    "collect_context": ".context_collector",
+    "run_pipeline": ".pipeline_runner",
+    "_find_entrypoint": ".pipeline_runner",
+    "_repo_uses_azure_ingestion": ".pipeline_runner",
+    "set_runner_slots": ".pipeline_runner",
+    "clone_repo": ".repo_cloner",
+    "evict_clone_cache": ".repo_cloner",
+    "repo_name_from_url": ".repo_cloner",
+    "load_config": ".scoring",
+    "compute_final_score_as_average": ".scoring",
+    "metric_value": ".scoring",
+    "BOOL_METRICS": ".scoring",
+    "DEFAULT_MAX_SCORE": ".scoring",
+    "iter_input_rows": ".spreadsheet",
+    "get_repo_rows": ".spreadsheet",
+    "build_result_row": ".spreadsheet",
+    "write_results": ".spreadsheet",
+    "RESULT_COLUMNS": ".spreadsheet",
+    "REPO_URL_COL": ".spreadsheet",
+    "run_checks": ".detectors",
+    "compute_dimension_scores": ".detectors",
+    "build_deterministic_summary": ".detectors",
+    "build_deterministic_evaluation_report_compact": ".detectors",
+    "get_run_command_from_readme": ".llm_evaluator",
+    "generate_evaluation_summary_llm": ".llm_evaluator",
+    "generate_evaluation_summary_llm_batch": ".llm_evaluator",
+    "format_docker_results_for_summary": ".llm_evaluator",
+    "batch_api_enabled": ".llm_batch",
+    "generate_evaluation_summaries_batch_api": ".llm_batch",
+    "compute_security_score": ".security_scorer",
+}
+
+if TYPE_CHECKING:
+    from .context_collector import collect_context
+    from .detectors import (
+        build_deterministic_evaluation_report_compact,
+        build_deterministic_summary,
+        compute_dimension_scores,
+        run_checks,
+    )
+    from .llm_evaluator import (
+        format_docker_results_for_summary,
+        generate_evaluation_summary_llm,
+        generate_evaluation_summary_llm_batch,
+        get_run_command_from_readme,
+    )
+    from .llm_batch import batch_api_enabled, generate_evaluation_summaries_batch_api
+    from .pipeline_runner import _find_entrypoint, _repo_uses_azure_ingestion, run_pipeline, set_runner_slots
+    from .repo_cloner import clone_repo, evict_clone_cache, repo_name_from_url
+    from .scoring import BOOL_METRICS, DEFAULT_MAX_SCORE, compute_final_score_as_average, load_config, metric_value
+    from .security_scorer import compute_security_score
+    from .spreadsheet import (
+        REPO_URL_COL,
+        RESULT_COLUMNS,
+        build_result_row,
+        get_repo_rows,
+        iter_input_rows,
+        write_results,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _load_evaluation_modules() -> None:
+    """Bind all lazily imported names as module globals (names already set, e.g. patched in tests, are kept)."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
+
 log = get_logger(__name__)
 app = typer.Typer(help="Repository evaluator for Python Data Engineering challenges.")
 
 _DEFAULT_FILE = Path("input/repos.xlsx")
 _DEFAULT_OUTPUT = "repos_evaluated.xlsx"
 
+# One lock per clone directory: rows pointing at the same repo must not clone/run in the same dir concurrently.
+_repo_locks: dict[str, threading.Lock] = {}
+_repo_locks_guard = threading.Lock()
+
+
+def _llm_concurrency() -> int:
+    """Max concurrent LLM requests (LLM_MAX_CONCURRENCY, default 4)."""
+    try:
+        return max(1, int(os.environ.get("LLM_MAX_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
 
-def _run_evaluate(file: Path, output_name: str) -> None:
+def _clone_workers() -> int:
+    """Repos cloned ahead of the one being evaluated in sequential mode (CLONE_WORKERS, default 4)."""
+    try:
+        return max(1, int(os.environ.get("CLONE_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+def _llm_batch_size() -> int:
+    """Repos per LLM summary request (LLM_SUMMARY_BATCH_SIZE, default 1 = one request per repo)."""
+    try:
+        return max(1, int(os.environ.get("LLM_SUMMARY_BATCH_SIZE", "1")))
+    except ValueError:
+        return 1
+
+
+class _ReportJob(NamedTuple):
+    """Everything the report stage needs for one repo once clone, pipeline and checks are done."""
+
+    original_row: dict
+    check_results: dict
+    result: dict
+    docker_results: str
+
+
+def _repo_lock(repo_url: str) -> threading.Lock:
+    name = repo_name_from_url(repo_url)
+    with _repo_locks_guard:
+        lock = _repo_locks.get(name)
+        if lock is None:
+            lock = _repo_locks[name] = threading.Lock()
+        return lock
+
+
+def _run_evaluate(file: Path, output_name: str, jobs: int = 1) -> None:
     """Shared evaluation logic (used by default callback and evaluate command)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _load_evaluation_modules()
     ensure_dirs()
     try:
-        df = load_input(file)
+        _, input_rows = iter_input_rows(file)
     except FileNotFoundError as e:
         log.error("%s", e)
         raise typer.Exit(1)
@@ -50,7 +163,8 @@ def _run_evaluate(file: Path, output_name: str) -> None:
         log.error("%s", e)
         raise typer.Exit(1)
 
-    rows = get_repo_rows(df)
+    # Streamed from a read-only workbook; only rows with a repo_url are kept in memory.
+    rows = get_repo_rows(input_rows)
     if not rows:
         log.warning("No rows with repo_url found in %s", file)
         raise typer.Exit(0)
@@ -66,15 +180,57 @@ def _run_evaluate(file: Path, output_name: str) -> None:
         except ValueError:
             pass
 
-    result_rows = []
-    for i, row in enumerate(rows):
-        url = row.get(REPO_URL_COL, "")
-        log.info("Evaluating %s (%s/%s)", url, i + 1, len(rows))
-        result = _evaluate_one(url, row, weights, max_score, summary_max_chars)
-        result_rows.append(result)
+    shallow = os.environ.get("CLONE_SHALLOW", "").strip().lower() in ("1", "true", "yes")
+    evict_clone_cache()
+
+    # Duplicate URLs are evaluated once; their result is copied to every row that lists them.
+    unique_rows, sources = _dedupe_rows(rows)
+    if len(unique_rows) < len(rows):
+        log.info("%s duplicate repo URL row(s) will reuse an earlier evaluation", len(rows) - len(unique_rows))
+    total = len(unique_rows)
+    jobs = max(1, min(jobs, total))
+    set_runner_slots(jobs)
 
+    # LLM report calls only depend on data already collected, so they run in their own pool and overlap
+    # the next repos' clone/pipeline; the pool size bounds concurrent requests to the provider.
+    llm_workers = _llm_concurrency()
+    batch_size = _llm_batch_size()
     out_path = get_output_dir() / output_name
-    write_results(result_rows, out_path)
+    static_workers = _static_workers()
+    with (
+        ThreadPoolExecutor(max_workers=llm_workers) as llm_executor,
+        ThreadPoolExecutor(max_workers=jobs) as executor,
+        ProcessPoolExecutor(max_workers=static_workers) if static_workers else nullcontext() as static_executor,
+    ):
+        if jobs == 1:
+            evaluated = _evaluate_sequential_with_prefetch(
+                unique_rows, weights, max_score, summary_max_chars, shallow, static_executor
+            )
+        else:
+
+            def evaluate_row(indexed: tuple[int, dict]) -> dict | _ReportJob:
+                i, row = indexed
+                return _evaluate_one_safe(
+                    row.get(REPO_URL_COL, ""),
+                    row,
+                    weights,
+                    max_score,
+                    summary_max_chars,
+                    i,
+                    total,
+                    shallow=shallow,
+                    static_executor=static_executor,
+                )
+
+            # Each repo is dominated by I/O (clone, Docker run, LLM); map() yields in input order.
+            evaluated = executor.map(evaluate_row, enumerate(unique_rows))
+        batch_api = batch_api_enabled()
+        pending = _submit_reports(evaluated, llm_executor, batch_size, summary_max_chars, batch_api=batch_api)
+        # Rows are written as soon as they (and every row before them) are done. At most batch_size - 1
+        # queued rows wait for their batch to be submitted, so the lookahead must cover whole batches;
+        # with the Batch API the single job is submitted after the last row, so nothing may block before it.
+        resolved = _resolve_in_order(pending, lookahead=total if batch_api else llm_workers * batch_size)
+        write_results(_fan_out_duplicates(rows, sources, resolved), out_path)
     log.info("Done. Results written to %s", out_path)
 
 
@@ -87,20 +243,22 @@ def main(
     output_name: str = typer.Option(
         _DEFAULT_OUTPUT, "--output", "-o", help="Output Excel filename"
     ),
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1, help="Number of repos evaluated concurrently")] = 1,
 ):
     """Repository evaluator: clone repos, run pipelines, score with LLM. Run with no args or use 'evaluate' subcommand."""
     if ctx.invoked_subcommand is not None:
         return
-    _run_evaluate(file, output_name)
+    _run_evaluate(file, output_name, jobs)
 
 
 @app.command()
 def evaluate(
     file: Path = typer.Option(..., "--file", "-f", path_type=Path, help="Input Excel file with repo_url column"),
     output_name: str = typer.Option(_DEFAULT_OUTPUT, "--output", "-o", help="Output Excel filename"),
+    jobs: Annotated[int, typer.Option("--jobs", "-j", min=1, help="Number of repos evaluated concurrently")] = 1,
 ):
     """Read spreadsheet, clone repos, run pipelines, evaluate with LLM, write results."""
-    _run_evaluate(file, output_name)
+    _run_evaluate(file, output_name, jobs)
 
 
 def _get_run_command_from_readme_at(repo_path: Path) -> str | None:
@@ -115,10 +273,132 @@ def _get_run_command_from_readme_at(repo_path: Path) -> str | None:
         return None
 
 
-def _evaluate_one(repo_url: str, original_row: dict, weights: dict, max_score: float, summary_max_chars: int = 1800) -> dict:
-    """Run clone -> pipeline -> context -> LLM -> score; merge into one result row."""
-    # Start with original row; fill result columns from pipeline + LLM + scoring
-    metrics = {
+def _repo_url_key(url: str) -> str:
+    """Normalize a repo URL for duplicate detection (whitespace, trailing slash, .git suffix)."""
+    return str(url).strip().rstrip("/").removesuffix(".git")
+
+
+def _dedupe_rows(rows: list[dict]) -> tuple[list[dict], list[int]]:
+    """Return (first row per distinct repo URL, index into that list for every input row)."""
+    first_index: dict[str, int] = {}
+    unique_rows: list[dict] = []
+    sources: list[int] = []
+    for row in rows:
+        key = _repo_url_key(row.get(REPO_URL_COL, ""))
+        if key not in first_index:
+            first_index[key] = len(unique_rows)
+            unique_rows.append(row)
+        sources.append(first_index[key])
+    return unique_rows, sources
+
+
+def _fan_out_duplicates(rows: list[dict], sources: list[int], unique_results: Iterable[dict]) -> Iterator[dict]:
+    """Yield one result row per input row, reusing the evaluation of an earlier row with the same repo URL."""
+    results_iter = iter(unique_results)
+    last_use = {u: i for i, u in enumerate(sources)}
+    kept: dict[int, dict] = {}
+    next_unique = 0
+    for i, (row, u) in enumerate(zip(rows, sources)):
+        if u == next_unique:
+            out = next(results_iter)
+            next_unique += 1
+            if last_use[u] > i:
+                kept[u] = {col: out.get(col) for col in RESULT_COLUMNS}
+        else:
+            out = build_result_row(row, kept[u])
+            if last_use[u] == i:
+                del kept[u]
+        yield out
+
+
+def _resolve_in_order(pending: Iterable[dict | Future], lookahead: int) -> Iterator[dict]:
+    """Yield result rows in input order, keeping up to lookahead unfinished LLM futures in flight."""
+    queue: deque = deque()
+    for item in pending:
+        queue.append(item)
+        while queue and (len(queue) > lookahead or not isinstance(queue[0], Future) or queue[0].done()):
+            head = queue.popleft()
+            yield head.result() if isinstance(head, Future) else head
+    for head in queue:
+        yield head.result() if isinstance(head, Future) else head
+
+
+def _evaluate_sequential_with_prefetch(
+    rows: list[dict],
+    weights: dict,
+    max_score: float,
+    summary_max_chars: int,
+    shallow: bool,
+    static_executor: Executor | None = None,
+) -> Iterator[dict | _ReportJob]:
+    """Evaluate rows one at a time while background threads clone the next rows' repos (network-bound, so in parallel)."""
+    urls = [row.get(REPO_URL_COL, "") for row in rows]
+    total = len(rows)
+    window = _clone_workers()
+    clone_futures: dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers=window) as prefetcher:
+        for i, row in enumerate(rows):
+            url = urls[i]
+            if url not in clone_futures:
+                clone_futures[url] = prefetcher.submit(clone_repo, url, shallow=shallow)
+            # Never prefetch into a clone dir that is in use or already queued: it would pull under that run.
+            # Rows are considered in order, so same-dir repos are still cloned in row order.
+            busy = {repo_name_from_url(u) for u in clone_futures}
+            for next_url in urls[i + 1 : i + 1 + window]:
+                name = repo_name_from_url(next_url)
+                if next_url not in clone_futures and name not in busy:
+                    clone_futures[next_url] = prefetcher.submit(clone_repo, next_url, shallow=shallow)
+                busy.add(name)
+            yield _evaluate_one_safe(
+                url,
+                row,
+                weights,
+                max_score,
+                summary_max_chars,
+                i,
+                total,
+                shallow=shallow,
+                clone_future=clone_futures.pop(url),
+                static_executor=static_executor,
+            )
+
+
+def _evaluate_one_safe(
+    repo_url: str,
+    original_row: dict,
+    weights: dict,
+    max_score: float,
+    summary_max_chars: int,
+    index: int,
+    total: int,
+    shallow: bool = False,
+    clone_future: Future | None = None,
+    static_executor: Executor | None = None,
+) -> dict | _ReportJob:
+    """Evaluate one row in a worker thread; an unexpected error yields a zero-score row instead of aborting the batch."""
+    log.info("Evaluating %s (%s/%s)", repo_url, index + 1, total)
+    try:
+        with _repo_lock(repo_url):
+            return _evaluate_one(
+                repo_url,
+                original_row,
+                weights,
+                max_score,
+                summary_max_chars,
+                shallow=shallow,
+                clone_future=clone_future,
+                static_executor=static_executor,
+            )
+    except Exception as e:
+        log_repo_error(log, repo_url, "evaluate", str(e))
+        metrics = _empty_metrics()
+        metrics["summary"] = f"Evaluation failed: {str(e)[:300]}. Score reflects no evaluation."
+        return build_result_row(original_row, _metrics_to_result(metrics, weights, max_score))
+
+
+def _empty_metrics() -> dict:
+    """Metrics for a repo before (or without) evaluation: everything failed / zero."""
+    return {
         "pipeline_runs": False,
         "gold_generated": False,
         "medallion_architecture": 0,
@@ -133,18 +413,41 @@ def _evaluate_one(repo_url: str, original_row: dict, weights: dict, max_score: f
         "summary": "",
     }
 
-    repo_path = clone_repo(repo_url)
+
+def _evaluate_one(
+    repo_url: str,
+    original_row: dict,
+    weights: dict,
+    max_score: float,
+    summary_max_chars: int = 1800,
+    shallow: bool = False,
+    clone_future: Future | None = None,
+    static_executor: Executor | None = None,
+) -> dict | _ReportJob:
+    """
+    Run clone -> pipeline -> context -> score. Returns the finished row when the repo could not be evaluated,
+    otherwise a _ReportJob for the LLM report stage (see _submit_reports), which runs off this thread.
+    clone_future: clone already submitted in the background (prefetch); its result is used instead of cloning here.
+    static_executor: process pool for the CPU-bound checks/scoring stage; None runs it in this thread.
+    """
+    # Start with original row; fill result columns from pipeline + LLM + scoring
+    metrics = _empty_metrics()
+
+    repo_path = clone_future.result() if clone_future is not None else clone_repo(repo_url, shallow=shallow)
     if repo_path is None:
         log_repo_error(log, repo_url, "clone", "Clone failed")
         metrics["summary"] = "Clone failed (e.g. broken link, private repo, or network error). Score reflects no evaluation."
         return build_result_row(original_row, _metrics_to_result(metrics, weights, max_score))
 
     run_command_override = None
+    readme_asked = False
     if os.environ.get("USE_README_RUN_COMMAND", "").strip().lower() in ("1", "true", "yes"):
         run_command_override = _get_run_command_from_readme_at(repo_path)
+        readme_asked = True
         if run_command_override:
             log.info("Using run command from README: %s", run_command_override)
-    if run_command_override is None and _find_entrypoint(repo_path) is None:
+    # Fallback only if the README was not already asked: a second identical LLM call would give the same answer.
+    if not readme_asked and _find_entrypoint(repo_path) is None:
         run_command_override = _get_run_command_from_readme_at(repo_path)
         if run_command_override:
             log.info(
@@ -160,13 +463,17 @@ def _evaluate_one(repo_url: str, original_row: dict, weights: dict, max_score: f
     metrics["gold_generated"] = run_result.get("gold_generated", False)
 
     context = collect_context(repo_path, run_result)
-    # Deterministic presence-based scoring from boolean checks
-    check_results = run_checks(repo_path)
-    dimension_scores = compute_dimension_scores(check_results)
+    # Deterministic presence-based scoring from boolean checks (CPU-bound: optionally in a worker process)
+    if static_executor is not None:
+        static = static_executor.submit(_static_stage, str(repo_path)).result()
+    else:
+        static = _static_stage(str(repo_path))
+    check_results = static["check_results"]
+    dimension_scores = static["dimension_scores"]
     for k, v in dimension_scores.items():
         metrics[k] = v
-    metrics["cloud_ingestion"] = 100 if _repo_uses_azure_ingestion(repo_path) else 0
-    metrics["security_practices_score"] = compute_security_score(repo_path)
+    metrics["cloud_ingestion"] = static["cloud_ingestion"]
+    metrics["security_practices_score"] = static["security_practices_score"]
     metrics["summary"] = build_deterministic_summary(
         check_results,
         dimension_scores,
@@ -181,16 +488,109 @@ def _evaluate_one(repo_url: str, original_row: dict, weights: dict, max_score: f
 
     result = _metrics_to_result(metrics, weights, max_score)
     docker_results_text = format_docker_results_for_summary(run_result)
-    llm_summary = generate_evaluation_summary_llm(
-        check_results, result, max_chars=summary_max_chars, docker_results=docker_results_text
-    )
+    return _ReportJob(original_row, check_results, result, docker_results_text)
+
+
+def _static_stage(repo_path: str) -> dict:
+    """Deterministic checks and scores for a cloned repo. Module-level and picklable so it can run in a process pool."""
+    _load_evaluation_modules()
+    path = Path(repo_path)
+    check_results = run_checks(path)
+    return {
+        "check_results": check_results,
+        "dimension_scores": compute_dimension_scores(check_results),
+        "cloud_ingestion": 100 if _repo_uses_azure_ingestion(path) else 0,
+        "security_practices_score": compute_security_score(path),
+    }
+
+
+def _static_workers() -> int:
+    """Worker processes for the static-analysis stage (STATIC_ANALYSIS_WORKERS, default 0 = run in the calling thread)."""
+    try:
+        return max(0, int(os.environ.get("STATIC_ANALYSIS_WORKERS", "0")))
+    except ValueError:
+        return 0
+
+
+def _submit_reports(
+    evaluated: Iterable[dict | _ReportJob],
+    llm_executor: ThreadPoolExecutor,
+    batch_size: int,
+    summary_max_chars: int,
+    batch_api: bool = False,
+) -> Iterator[dict | Future]:
+    """
+    Report stage: submit LLM evaluation reports to llm_executor, one request per repo or batch_size repos
+    per request, or (batch_api) all repos as one Batch API job once the last repo is evaluated.
+    Yields, in input order, finished rows or Futures of rows.
+    """
+    batch: list[tuple[_ReportJob, Future]] = []
+    for item in evaluated:
+        if not isinstance(item, _ReportJob):
+            yield item
+        elif batch_api:
+            row_future = Future()
+            batch.append((item, row_future))
+            yield row_future
+        elif batch_size <= 1:
+            yield llm_executor.submit(_add_evaluation_report, item, summary_max_chars)
+        else:
+            row_future = Future()
+            batch.append((item, row_future))
+            yield row_future
+            if len(batch) >= batch_size:
+                llm_executor.submit(_add_evaluation_reports_batch, batch, summary_max_chars)
+                batch = []
+    if batch:
+        summarize = generate_evaluation_summaries_batch_api if batch_api else generate_evaluation_summary_llm_batch
+        llm_executor.submit(_add_evaluation_reports_batch, batch, summary_max_chars, summarize)
+
+
+def _finish_row(job: _ReportJob, llm_summary: str | None, summary_max_chars: int) -> dict:
+    """Attach the LLM report, or the deterministic compact report when the LLM gave none."""
+    result = job.result
     if llm_summary is not None:
         result["evaluation_report"] = llm_summary
     else:
         result["evaluation_report"] = build_deterministic_evaluation_report_compact(
-            check_results, result, max_chars=summary_max_chars
+            job.check_results, result, max_chars=summary_max_chars
+        )
+    return build_result_row(job.original_row, result)
+
+
+def _add_evaluation_report(job: _ReportJob, summary_max_chars: int) -> dict:
+    """LLM evaluation report for one repo (or deterministic fallback); only needs data already collected."""
+    try:
+        llm_summary = generate_evaluation_summary_llm(
+            job.check_results, job.result, max_chars=summary_max_chars, docker_results=job.docker_results
         )
-    return build_result_row(original_row, result)
+    except Exception as e:
+        log.warning("LLM evaluation report failed: %s", e)
+        llm_summary = None
+    return _finish_row(job, llm_summary, summary_max_chars)
+
+
+def _add_evaluation_reports_batch(
+    batch: list[tuple[_ReportJob, Future]],
+    summary_max_chars: int,
+    summarize: Callable[..., list[str | None]] | None = None,
+) -> None:
+    """One LLM request (or Batch API job, via summarize) for several repos; resolves each row's Future."""
+    items: list[dict[str, Any]] = [
+        {"check_results": job.check_results, "scores": job.result, "docker_results": job.docker_results}
+        for job, _ in batch
+    ]
+    try:
+        summaries = (summarize or generate_evaluation_summary_llm_batch)(items, max_chars=summary_max_chars)
+    except Exception as e:
+        log.warning("Batched LLM evaluation report failed: %s", e)
+        summaries = []
+    summaries = list(summaries) + [None] * (len(batch) - len(summaries))
+    for (job, row_future), llm_summary in zip(batch, summaries):
+        try:
+            row_future.set_result(_finish_row(job, llm_summary, summary_max_chars))
+        except Exception as e:
+            row_future.set_exception(e)
 
 
 def _metrics_to_result(metrics: dict, weights: dict, max_score: float) -> dict:
@@ -1,22 +1,31 @@
 """Collect evidence for LLM: README, tree, sla_calculation.py, main pipeline, execution summary."""
 
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from .logger import get_logger
+from .utils import SKIP_DIRS
 
 log = get_logger(__name__)
 
 MAX_CHARS_PER_FILE = 4000
 TREE_DEPTH = 3
+# Upper bound on directory entries visited per repo, so huge repos cost bounded work.
+MAX_FS_ENTRIES = 2000
+# Build/dependency output: shown by name but never descended into.
+HEAVY_DIRS = frozenset({"node_modules", "dist", "build", ".tox", ".mypy_cache", ".pytest_cache", "target"})
 
 
 def _read_limited(path: Path) -> str:
-    """Read file content capped at MAX_CHARS_PER_FILE."""
+    """Read file content capped at MAX_CHARS_PER_FILE; only the bytes that can fit are read from disk."""
     if not path.is_file():
         return ""
     try:
-        text = path.read_text(encoding="utf-8", errors="replace")
+        # 4 bytes per char is the UTF-8 worst case; one extra char tells whether the file was longer.
+        with open(path, "rb") as f:
+            data = f.read((MAX_CHARS_PER_FILE + 1) * 4)
+        text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
         if len(text) > MAX_CHARS_PER_FILE:
             text = text[:MAX_CHARS_PER_FILE] + "\n... [truncated]"
         return text
@@ -25,84 +34,104 @@ def _read_limited(path: Path) -> str:
         return f"[read error: {e}]"
 
 
-def _naming_audit(repo_path: Path) -> str:
-    """Collect file and folder names for naming-conventions evaluation."""
-    lines = []
-    # Top-level and one level of folders
-    try:
-        for p in sorted(repo_path.iterdir(), key=lambda x: (x.is_file(), x.name.lower())):
-            if p.name.startswith(".") and p.name != ".git":
-                continue
-            if p.name in ("venv", ".venv", "__pycache__", "node_modules"):
-                continue
-            if p.is_dir():
-                lines.append(f"folder: {p.name}/")
-                for q in sorted(p.iterdir(), key=lambda x: (x.is_file(), x.name.lower())):
-                    if q.name.startswith(".") or q.name in ("__pycache__",):
-                        continue
-                    lines.append(f"  {q.name}" + ("/" if q.is_dir() else ""))
-            else:
-                lines.append(f"file: {p.name}")
-    except PermissionError:
-        lines.append("[permission denied]")
-    # Python files under common dirs
-    py_files = []
-    for base in ["src", "ingestion", "tests", "."]:
-        d = repo_path / base if base != "." else repo_path
-        if not d.is_dir() and base != ".":
-            continue
-        for f in d.rglob("*.py"):
+# Names hidden from the project tree / naming audit; dot entries are hidden too, except HIDDEN_ALLOW.
+HIDDEN_ALLOW = frozenset({".git"})
+_TREE_SKIP = frozenset({"venv", ".venv", "__pycache__"})
+_AUDIT_SKIP = _TREE_SKIP | {"node_modules"}
+
+
+def _sorted_entries(path: str) -> list[os.DirEntry]:
+    """Directory entries, folders first, then case-insensitive by name (type from readdir, no stat)."""
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+
+
+def _collect_fs(repo_path: Path, max_depth: int = TREE_DEPTH) -> tuple[str, str, Optional[set[str]]]:
+    """
+    Single directory walk producing the project tree (max_depth levels), the naming audit
+    (top-level entries with one level of folder contents, Python files, data/ files) and the set of
+    relative file paths seen (None if the walk was truncated, i.e. the set may be incomplete).
+    Each directory is listed at most once; symlinks and HEAVY_DIRS are not followed, and the walk
+    stops after MAX_FS_ENTRIES entries.
+    """
+    root = str(repo_path)
+    seen = 0
+    tree_lines: list[str] = []
+    audit_lines: list[str] = []
+    py_files: list[str] = []
+    data_files: list[str] = []
+    files: set[str] = set()
+
+    def walk(
+        path: str, rel: str, depth: int, prefix: str, in_tree: bool, in_audit: bool, in_py: bool, in_data: bool
+    ) -> None:
+        nonlocal seen
+        if seen >= MAX_FS_ENTRIES:
+            return
+        try:
+            entries = _sorted_entries(path)
+        except PermissionError:
+            if in_tree:
+                tree_lines.append(prefix + "[permission denied]")
+            if in_audit:
+                audit_lines.append("[permission denied]" if depth == 0 else "  [permission denied]")
+            return
+        except OSError:
+            return
+        for i, entry in enumerate(entries):
+            if seen >= MAX_FS_ENTRIES:
+                return
+            seen += 1
+            name = entry.name
+            child_rel = f"{rel}/{name}" if rel else name
+            hidden = name[:1] == "." and name not in HIDDEN_ALLOW
             try:
-                rel = f.relative_to(repo_path)
-                s = str(rel).replace("\\", "/")
-                if "venv" in s or "__pycache__" in s or ".venv" in s:
-                    continue
-                py_files.append(s)
-            except ValueError:
-                pass
-    if py_files:
-        lines.append("\nPython files:")
-        for x in sorted(set(py_files))[:80]:
-            lines.append(f"  {x}")
-    # Data files under data/
-    data_dir = repo_path / "data"
-    if data_dir.is_dir():
-        data_files = []
-        for f in data_dir.rglob("*"):
-            if f.is_file():
-                try:
-                    rel = f.relative_to(repo_path)
-                    data_files.append(str(rel).replace("\\", "/"))
-                except ValueError:
-                    pass
-        if data_files:
-            lines.append("\nData files:")
-            for x in sorted(data_files)[:50]:
-                lines.append(f"  {x}")
-    return "\n".join(lines) if lines else "(none)"
-
-
-def _tree(dir_path: Path, prefix: str = "", depth: int = 0, max_depth: int = 3) -> str:
-    if depth >= max_depth:
-        return ""
-    lines = []
-    try:
-        entries = sorted(dir_path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
-        for i, p in enumerate(entries):
-            is_last = i == len(entries) - 1
-            name = p.name
-            if p.name.startswith(".") and p.name != ".git":
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file(follow_symlinks=False)
+            except OSError:
                 continue
-            if p.name == "venv" or p.name == ".venv" or p.name == "__pycache__":
+            show_in_tree = in_tree and not hidden and name not in _TREE_SKIP
+            if show_in_tree:
+                is_last = i == len(entries) - 1
+                tree_lines.append(prefix + ("└── " if is_last else "├── ") + name)
+            show_in_audit = in_audit and not hidden and name not in _AUDIT_SKIP
+            if in_audit and depth == 0:
+                if show_in_audit:
+                    audit_lines.append(f"folder: {name}/" if is_dir else f"file: {name}")
+            elif in_audit and not name.startswith(".") and name != "__pycache__":
+                audit_lines.append(f"  {name}" + ("/" if is_dir else ""))
+            if is_file:
+                files.add(child_rel)
+                if in_py and name.endswith(".py"):
+                    py_files.append(child_rel)
+                if in_data:
+                    data_files.append(child_rel)
                 continue
-            branch = "└── " if is_last else "├── "
-            lines.append(prefix + branch + name)
-            if p.is_dir() and depth + 1 < max_depth:
-                ext = "    " if is_last else "│   "
-                lines.append(_tree(p, prefix + ext, depth + 1, max_depth))
-    except PermissionError:
-        lines.append(prefix + "[permission denied]")
-    return "\n".join(lines)
+            if not is_dir or name in HEAVY_DIRS:
+                continue
+            child_tree = show_in_tree and depth + 1 < max_depth
+            child_py = in_py and name not in SKIP_DIRS
+            child_data = in_data or (depth == 0 and name == "data")
+            child_audit = show_in_audit and depth == 0
+            if child_tree or child_audit or child_py or child_data:
+                ext = "    " if i == len(entries) - 1 else "│   "
+                walk(entry.path, child_rel, depth + 1, prefix + ext, child_tree, child_audit, child_py, child_data)
+
+    walk(root, "", 0, "", True, True, True, False)
+    truncated = seen >= MAX_FS_ENTRIES
+    if truncated:
+        tree_lines.append(f"... [truncated after {MAX_FS_ENTRIES} entries]")
+
+    if py_files:
+        audit_lines.append("\nPython files:")
+        for x in sorted(py_files)[:80]:
+            audit_lines.append(f"  {x}")
+    if data_files:
+        audit_lines.append("\nData files:")
+        for x in sorted(data_files)[:50]:
+            audit_lines.append(f"  {x}")
+    naming_audit = "\n".join(audit_lines) if audit_lines else "(none)"
+    return "\n".join(tree_lines), naming_audit, None if truncated else files
 
 
 def collect_context(repo_path: Path, execution_result: dict) -> dict[str, Any]:
@@ -120,23 +149,23 @@ def collect_context(repo_path: Path, execution_result: dict) -> dict[str, Any]:
         "execution_summary": {},
     }
 
-    readme = repo_path / "README.md"
-    if readme.exists():
-        context["readme"] = _read_limited(readme)
+    context["project_tree"], context["naming_audit"], files = _collect_fs(repo_path, max_depth=TREE_DEPTH)
+
+    def present(rel: str) -> bool:
+        # Answer from the walk's listing; stat only if the walk was cut short.
+        return rel in files if files is not None else (repo_path / rel).is_file()
 
-    context["project_tree"] = _tree(repo_path, max_depth=TREE_DEPTH)
-    context["naming_audit"] = _naming_audit(repo_path)
+    if present("README.md"):
+        context["readme"] = _read_limited(repo_path / "README.md")
 
     for sla_rel in ["sla_calculation.py", "src/sla/sla_calculation.py"]:
-        sla = repo_path / sla_rel
-        if sla.exists():
-            context["sla_calculation"] = _read_limited(sla)
+        if present(sla_rel):
+            context["sla_calculation"] = _read_limited(repo_path / sla_rel)
             break
 
     for rel in ["main.py", "run_pipeline.py", "src/main.py", "src/run_pipeline.py"]:
-        p = repo_path / rel
-        if p.exists():
-            context["main_pipeline"] = _read_limited(p)
+        if present(rel):
+            context["main_pipeline"] = _read_limited(repo_path / rel)
             break
 
     context["execution_summary"] = {
@@ -148,11 +177,16 @@ def collect_context(repo_path: Path, execution_result: dict) -> dict[str, Any]:
         "error": execution_result.get("error"),
     }
 
+    # The context is not modified after this point; render once for every LLM call/retry that needs it.
+    context["_rendered"] = context_to_string(context)
     return context
 
 
 def context_to_string(context: dict[str, Any]) -> str:
-    """Format context dict as a single string for the LLM prompt."""
+    """Format context dict as a single string for the LLM prompt (cached by collect_context under '_rendered')."""
+    rendered = context.get("_rendered")
+    if rendered is not None:
+        return rendered
     parts = [
         "=== README.md ===",
         context.get("readme", "") or "(none)",
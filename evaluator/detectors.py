@@ -1,21 +1,35 @@
 """
 Deterministic presence-based checks for repository evaluation.
-Each check is a boolean function of repo_path. Scores are computed from
-passed checks using fixed weights so the same structure always gets the same score.
+Each check is a boolean function of a RepoIndex built by one walk of repo_path.
+Scores are computed from passed checks using fixed weights so the same structure
+always gets the same score.
 """
 
 from __future__ import annotations
 
 import fnmatch
+import hashlib
+import os
 import re
+import stat
+import string
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from .logger import get_logger
+from .utils import SKIP_DIRS, iter_repo_files
 from .pipeline_runner import _repo_uses_azure_ingestion
 
 log = get_logger(__name__)
 
+# RepoIndex.fingerprint -> check results, so an unchanged checkout is not checked twice.
+_CHECK_RESULTS_CACHE: dict[str, dict[str, bool]] = {}
+
+# Detectors are independent; file reads in one overlap with matching in another.
+CHECK_WORKERS = min(8, os.cpu_count() or 4)
+
 # Registry: (dimension, check_id, weight). Weights per dimension are normalized to 0-100.
 CHECK_REGISTRY: list[tuple[str, str, int]] = [
     # Medallion architecture (5 checks, 20 each)
@@ -53,188 +67,311 @@ CHECK_REGISTRY: list[tuple[str, str, int]] = [
     ("sensitive_data_exposure_score", "no_pii_in_medallion_data_files", 50),
 ]
 
+# CHECK_REGISTRY grouped once at import: dimension -> [(check_id, weight)] and dimension -> total weight.
+_CHECKS_BY_DIMENSION: dict[str, list[tuple[str, int]]] = {}
+for _dimension, _check_id, _weight in CHECK_REGISTRY:
+    _CHECKS_BY_DIMENSION.setdefault(_dimension, []).append((_check_id, _weight))
+_DIMENSION_TOTALS: dict[str, int] = {dim: sum(w for _c, w in checks) for dim, checks in _CHECKS_BY_DIMENSION.items()}
+del _dimension, _check_id, _weight
+
+
+# Longest prefix of any file kept in memory by RepoIndex.text.
+_READ_CAP = 100_000
+
+
+def _read_prefix(path: str, size: int) -> str:
+    """
+    First _READ_CAP chars of a file of the given size, newlines normalized. Not cached across runs:
+    RepoIndex keeps each text for its own run, and an unchanged repo never gets here (_CHECK_RESULTS_CACHE).
+    """
+    if size == 0:
+        return ""
+    # 4 bytes per char is the UTF-8 worst case, so this is always enough for _READ_CAP chars.
+    with open(path, "rb") as f:
+        data = f.read(_READ_CAP * 4)
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")[:_READ_CAP]
+
 
 def _read_file_safe(path: Path, max_size: int = 50_000) -> str:
     try:
-        if not path.is_file():
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
             return ""
-        return path.read_text(encoding="utf-8", errors="replace")[:max_size]
+        return _read_prefix(str(path), st.st_size)[:max_size]
     except Exception:
         return ""
 
 
-def _has_raw_layer(repo_path: Path) -> bool:
-    return (repo_path / "data" / "raw").is_dir()
-
+MEDALLION_LAYERS = ("raw", "bronze", "silver", "gold")
 
-def _has_bronze_layer(repo_path: Path) -> bool:
-    return (repo_path / "data" / "bronze").is_dir()
+# Content patterns, compiled once at import rather than looked up per file.
+_BUSINESS_HOURS_RE = re.compile(r"business.?hour|sla|resolution.?hour", re.IGNORECASE)
+_SLA_COLS_RE = re.compile(r"sla|resolution|business.?hour|is_sla_met", re.IGNORECASE)
+_LAYER_WORDS_RE = re.compile(r"bronze|silver|gold", re.IGNORECASE)
+_README_RUN_RE = re.compile(r"run|usage|quick.?start|how to|install|setup", re.IGNORECASE)
+# A docstring quote or an annotated parameter, whichever comes first.
+_DOCSTRING_OR_HINT_RE = re.compile(r"\"\"\"|'''|def\s+\w+\([^)]*:\s*[\w\[\]]+")
+# Translation table that deletes every snake_case character; a valid name translates to "".
+_SNAKE_DELETE = str.maketrans("", "", string.ascii_lowercase + string.digits + "_")
+_MAIN_FILES = ("main.py", "src/main.py", "run_pipeline.py")
 
 
-def _has_silver_layer(repo_path: Path) -> bool:
-    return (repo_path / "data" / "silver").is_dir()
-
+@dataclass
+class RepoIndex:
+    """
+    Everything the detectors need, collected in a single walk of the repo.
+    Paths are relative to root and use forward slashes; venv, __pycache__,
+    node_modules and dot-directories are pruned during the walk.
+    """
 
-def _has_gold_layer(repo_path: Path) -> bool:
-    return (repo_path / "data" / "gold").is_dir()
+    root: Path
+    root_files: set[str] = field(default_factory=set)
+    root_dirs: set[str] = field(default_factory=set)
+    data_dirs: set[str] = field(default_factory=set)
+    py_files: list[str] = field(default_factory=list)
+    data_files_by_layer: dict[str, list[str]] = field(default_factory=dict)
+    data_suffixes_by_layer: dict[str, set[str]] = field(default_factory=dict)
+    readme_text: str = ""
+    main_texts: dict[str, str] = field(default_factory=dict)
+    gitignore: re.Pattern[str] | None = None
+    # Digest of every walked file's (path, mtime_ns, size) plus the directory set.
+    fingerprint: str = ""
+    files: set[str] = field(default_factory=set, repr=False)
+    dirs: set[str] = field(default_factory=set, repr=False)
+    _stats: dict[str, tuple[int, int]] = field(default_factory=dict, repr=False)
+    _texts: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def is_file(self, rel: str) -> bool:
+        """Existence check answered from the walk instead of a stat() call."""
+        return rel in self.files
+
+    def is_dir(self, rel: str) -> bool:
+        """Existence check answered from the walk instead of a stat() call."""
+        return rel in self.dirs
+
+    def text(self, rel: str) -> str:
+        """Contents of a file under root (read once, first 100k chars; "" if not indexed)."""
+        if rel not in self._texts:
+            text = ""
+            if rel in self._stats:
+                # The walk already stat'ed this file; reuse that instead of stat'ing again.
+                try:
+                    text = _read_prefix(os.path.join(self.root, rel), self._stats[rel][1])
+                except OSError:
+                    pass
+            elif self.is_file(rel):
+                text = _read_file_safe(self.root / rel, max_size=_READ_CAP)
+            self._texts[rel] = text
+        return self._texts[rel]
+
+    def py_under(self, *prefixes: str) -> list[str]:
+        """Python files whose relative path starts with one of the given dir prefixes."""
+        dirs = tuple(f"{d}/" for d in prefixes)
+        return [p for p in self.py_files if p.startswith(dirs)]
+
+
+def _list_dir(path: Path) -> tuple[set[str], set[str]]:
+    """Return (file names, dir names) directly under path; dirs are followed if symlinked."""
+    files: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, dirs
 
 
-def _pipeline_orchestrates_layers(repo_path: Path) -> bool:
-    main_content = _read_file_safe(repo_path / "main.py") + _read_file_safe(repo_path / "src" / "main.py") + _read_file_safe(repo_path / "run_pipeline.py")
-    return "bronze" in main_content.lower() and "silver" in main_content.lower() and "gold" in main_content.lower()
+def build_repo_index(repo_path: Path) -> RepoIndex:
+    """Walk repo_path once and collect the file lists and texts used by all detectors."""
+    repo_path = Path(repo_path)
+    index = RepoIndex(root=repo_path)
+    index.root_files, root_dirs = _list_dir(repo_path)
+    index.root_dirs = {d for d in root_dirs if not d.startswith(".") and d not in SKIP_DIRS}
+    if "data" in root_dirs:
+        _, index.data_dirs = _list_dir(repo_path / "data")
+    index.files = set(index.root_files)
+    index.dirs = index.root_dirs | {f"data/{d}" for d in index.data_dirs}
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(repo_path.resolve()).encode())
+    prefix_len = len(str(repo_path)) + 1
+    for entry in iter_repo_files(repo_path, skip_hidden=True):
+        rel = entry.path[prefix_len:].replace(os.sep, "/")
+        try:
+            st = entry.stat(follow_symlinks=False)
+            index._stats[rel] = (st.st_mtime_ns, st.st_size)
+            digest.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{rel}\0?\n".encode())
+        index.files.add(rel)
+        parent = rel.rpartition("/")[0]
+        while parent and parent not in index.dirs:
+            index.dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+        if entry.name.endswith(".py"):
+            index.py_files.append(rel)
+        parts = rel.split("/", 2)
+        if len(parts) == 3 and parts[0] == "data":
+            index.data_files_by_layer.setdefault(parts[1], []).append(rel)
+            _, dot, ext = entry.name.rpartition(".")
+            if dot:
+                index.data_suffixes_by_layer.setdefault(parts[1], set()).add(ext.lower())
+    index.py_files.sort()
+    digest.update("\0".join(sorted(index.dirs | index.root_files)).encode())
+    index.fingerprint = digest.hexdigest()
+    for files in index.data_files_by_layer.values():
+        files.sort()
+
+    if index.is_file("README.md"):
+        index.readme_text = index.text("README.md")
+    for rel in _MAIN_FILES:
+        if index.is_file(rel):
+            index.main_texts[rel] = index.text(rel)
+    index.gitignore = _compile_gitignore(_load_gitignore_patterns(repo_path))
+    return index
+
+
+def _has_raw_layer(index: RepoIndex) -> bool:
+    return index.is_dir("data/raw")
+
+
+def _has_bronze_layer(index: RepoIndex) -> bool:
+    return index.is_dir("data/bronze")
+
+
+def _has_silver_layer(index: RepoIndex) -> bool:
+    return index.is_dir("data/silver")
+
+
+def _has_gold_layer(index: RepoIndex) -> bool:
+    return index.is_dir("data/gold")
+
+
+def _pipeline_orchestrates_layers(index: RepoIndex) -> bool:
+    seen: set[str] = set()
+    for text in index.main_texts.values():
+        # One case-insensitive pass per file, stopping once all three layers have been named.
+        for m in _LAYER_WORDS_RE.finditer(text, 0, 50_000):
+            seen.add(m.group().lower())
+            if len(seen) == 3:
+                return True
+    return False
 
 
-def _has_sla_calculation_file(repo_path: Path) -> bool:
-    return (repo_path / "sla_calculation.py").is_file() or (repo_path / "src" / "sla" / "sla_calculation.py").is_file()
+def _has_sla_calculation_file(index: RepoIndex) -> bool:
+    return index.is_file("sla_calculation.py") or index.is_file("src/sla/sla_calculation.py")
 
 
-def _gold_has_csv_reports(repo_path: Path) -> bool:
-    gold = repo_path / "data" / "gold"
-    if not gold.is_dir():
-        return False
-    return any(f.suffix.lower() == ".csv" for f in gold.rglob("*") if f.is_file())
+def _gold_has_csv_reports(index: RepoIndex) -> bool:
+    return "csv" in index.data_suffixes_by_layer.get("gold", ())
 
 
-def _gold_has_parquet(repo_path: Path) -> bool:
-    gold = repo_path / "data" / "gold"
-    if not gold.is_dir():
-        return False
-    return any(f.suffix.lower() == ".parquet" for f in gold.rglob("*") if f.is_file())
+def _gold_has_parquet(index: RepoIndex) -> bool:
+    return "parquet" in index.data_suffixes_by_layer.get("gold", ())
 
 
-def _code_references_business_hours_or_sla(repo_path: Path) -> bool:
-    for py in repo_path.rglob("*.py"):
-        if "__pycache__" in str(py) or "venv" in str(py):
-            continue
-        content = _read_file_safe(py)
-        if re.search(r"business.?hour|sla|resolution.?hour", content, re.IGNORECASE):
+def _code_references_business_hours_or_sla(index: RepoIndex) -> bool:
+    for py in index.py_files:
+        if _BUSINESS_HOURS_RE.search(index.text(py), 0, 50_000):
             return True
     return False
 
 
-def _gold_has_sla_related_columns(repo_path: Path) -> bool:
-    for path in [repo_path / "src" / "gold", repo_path / "gold", repo_path / "src"]:
-        if not path.is_dir():
-            continue
-        for py in path.rglob("*.py"):
-            content = _read_file_safe(py)
-            if re.search(r"sla|resolution|business.?hour|is_sla_met", content, re.IGNORECASE):
-                return True
+def _gold_has_sla_related_columns(index: RepoIndex) -> bool:
+    for py in index.py_under("src", "gold"):
+        if _SLA_COLS_RE.search(index.text(py), 0, 50_000):
+            return True
     return False
 
 
-def _has_main_or_run_pipeline(repo_path: Path) -> bool:
-    return (repo_path / "main.py").is_file() or (repo_path / "run_pipeline.py").is_file() or (repo_path / "src" / "main.py").is_file()
+def _has_main_or_run_pipeline(index: RepoIndex) -> bool:
+    return index.is_file("main.py") or index.is_file("run_pipeline.py") or index.is_file("src/main.py")
 
 
-def _has_requirements_txt(repo_path: Path) -> bool:
-    return (repo_path / "requirements.txt").is_file()
+def _has_requirements_txt(index: RepoIndex) -> bool:
+    return index.is_file("requirements.txt")
 
 
-def _has_config_or_env_example(repo_path: Path) -> bool:
-    return (repo_path / "config.py").is_file() or (repo_path / ".env.example").is_file() or (repo_path / ".env.sample").is_file() or (repo_path / "config.yaml").is_file() or (repo_path / "src" / "utils" / "config.py").is_file()
+def _has_config_or_env_example(index: RepoIndex) -> bool:
+    return any(index.is_file(f) for f in ("config.py", ".env.example", ".env.sample", "config.yaml", "src/utils/config.py"))
 
 
-def _has_clear_entrypoint(repo_path: Path) -> bool:
-    from .pipeline_runner import _find_entrypoint
-    return _find_entrypoint(repo_path) is not None
+def _has_clear_entrypoint(index: RepoIndex) -> bool:
+    from .pipeline_runner import MODULE_ENTRYPOINTS, ROOT_ENTRYPOINTS
+    return any(index.is_file(rel) for rel in ROOT_ENTRYPOINTS + MODULE_ENTRYPOINTS)
 
 
-def _has_readme(repo_path: Path) -> bool:
-    return (repo_path / "README.md").is_file()
+def _has_readme(index: RepoIndex) -> bool:
+    return index.is_file("README.md")
 
 
-def _readme_mentions_run_or_usage(repo_path: Path) -> bool:
-    content = _read_file_safe(repo_path / "README.md")
-    return bool(re.search(r"run|usage|quick.?start|how to|install|setup", content, re.IGNORECASE))
+def _readme_mentions_run_or_usage(index: RepoIndex) -> bool:
+    return bool(_README_RUN_RE.search(index.readme_text, 0, 50_000))
 
 
-def _readme_substantive(repo_path: Path) -> bool:
-    content = _read_file_safe(repo_path / "README.md")
-    return len(content.strip()) >= 200
+def _readme_substantive(index: RepoIndex) -> bool:
+    return len(index.readme_text[:50_000].strip()) >= 200
 
 
-def _has_src_or_ingestion_structure(repo_path: Path) -> bool:
-    return (repo_path / "src").is_dir() or (repo_path / "ingestion").is_dir()
+def _has_src_or_ingestion_structure(index: RepoIndex) -> bool:
+    return index.is_dir("src") or index.is_dir("ingestion")
 
 
-def _has_docstrings_or_type_hints(repo_path: Path) -> bool:
-    for base in [repo_path / "src", repo_path / "ingestion", repo_path]:
-        if not base.is_dir():
-            continue
-        for py in list(base.rglob("*.py"))[:15]:
-            if "__pycache__" in str(py) or "venv" in str(py):
-                continue
-            content = _read_file_safe(py)
-            if '"""' in content or "'''" in content or re.search(r"def\s+\w+\([^)]*:\s*[\w\[\]]+", content):
+def _has_docstrings_or_type_hints(index: RepoIndex) -> bool:
+    for files in (index.py_under("src"), index.py_under("ingestion"), index.py_files):
+        for py in files[:15]:
+            if _DOCSTRING_OR_HINT_RE.search(index.text(py), 0, 50_000):
                 return True
     return False
 
 
-def _no_hardcoded_credentials_in_code(repo_path: Path) -> bool:
-    from .security_scorer import _has_hardcoded_credentials, _read_file_safe as _sec_read
-    for py in repo_path.rglob("*.py"):
-        if "__pycache__" in str(py) or "venv" in str(py) or ".venv" in str(py):
-            continue
-        try:
-            rel = py.relative_to(repo_path)
-            if any(p.startswith(".") for p in rel.parts):
-                continue
-        except ValueError:
-            continue
-        if _has_hardcoded_credentials(_sec_read(py)):
+def _no_hardcoded_credentials_in_code(index: RepoIndex) -> bool:
+    from .security_scorer import _has_hardcoded_credentials
+    for py in index.py_files:
+        if _has_hardcoded_credentials(index.text(py)):
             return False
     return True
 
 
-def _folders_lowercase_or_snake(repo_path: Path) -> bool:
-    for p in repo_path.iterdir():
-        if not p.is_dir() or p.name.startswith(".") or p.name in ("venv", ".venv", "__pycache__", "node_modules"):
-            continue
-        if p.name != p.name.lower() or " " in p.name:
-            return False
-        if not re.match(r"^[a-z][a-z0-9_]*$", p.name):
-            return False
-    return True
+def _is_snake(name: str) -> bool:
+    """True if name matches ^[a-z][a-z0-9_]*$ (checked without the regex engine)."""
+    return name.isascii() and "a" <= name[:1] <= "z" and not name.translate(_SNAKE_DELETE)
+
+
+def _folders_lowercase_or_snake(index: RepoIndex) -> bool:
+    return all(_is_snake(name) for name in index.root_dirs)
 
 
 # Conventional Python file names that are allowed even though they don't match snake_case.
 _PYTHON_CONVENTIONAL_STEMS = frozenset({"__init__", "__main__"})
 
 
-def _python_files_snake_case(repo_path: Path) -> bool:
-    for base in [repo_path / "src", repo_path / "ingestion", repo_path]:
-        if not base.is_dir():
+def _python_files_snake_case(index: RepoIndex) -> bool:
+    for py in index.py_files:
+        name = py.rsplit("/", 1)[-1][:-3]
+        if name in _PYTHON_CONVENTIONAL_STEMS:
             continue
-        for py in base.rglob("*.py"):
-            if "__pycache__" in str(py) or "venv" in str(py):
-                continue
-            name = py.stem
-            if name in _PYTHON_CONVENTIONAL_STEMS:
-                continue
-            if not re.match(r"^[a-z][a-z0-9_]*$", name):
-                return False
+        if not _is_snake(name):
+            return False
     return True
 
 
-def _data_paths_use_layer_names(repo_path: Path) -> bool:
-    data = repo_path / "data"
-    if not data.is_dir():
+def _data_paths_use_layer_names(index: RepoIndex) -> bool:
+    if "data" not in index.root_dirs:
         return True
-    layers = {"raw", "bronze", "silver", "gold"}
-    for f in data.rglob("*"):
-        if f.is_file():
-            try:
-                rel = f.relative_to(data)
-                if rel.parts and rel.parts[0].lower() in layers:
-                    return True
-            except ValueError:
-                pass
-    return False
+    return any(layer.lower() in MEDALLION_LAYERS for layer in index.data_files_by_layer)
 
 
-def _has_common_folders(repo_path: Path) -> bool:
-    names = {p.name.lower() for p in repo_path.iterdir() if p.is_dir() and not p.name.startswith(".")}
+def _has_common_folders(index: RepoIndex) -> bool:
+    names = {name.lower() for name in index.root_dirs}
     return bool(names & {"src", "data", "config", "tests"})
 
 
@@ -246,29 +383,29 @@ _EMAIL_RE = re.compile(
 _PHONE_RE = re.compile(
     r"(?:\+\d{1,3}[-.\s]?\d{2,}(?:[-.\s]?\d{2,}){2,}|\(\d{3}\)\s*\d{3}[-.]?\d{4})\b"
 )
-
-
-def _no_pii_in_source_files(repo_path: Path) -> bool:
+# Email or phone in a single pass over the text.
+_PII_COMBINED_RE = re.compile(f"(?:{_EMAIL_RE.pattern})|(?:{_PHONE_RE.pattern})")
+try:  # optional: RE2 scans in linear time without backtracking (the pattern has no RE2-unsupported syntax)
+    import re2
+
+    _PII_FINDITER = re2.compile(_PII_COMBINED_RE.pattern).finditer
+except Exception:
+    _PII_FINDITER = _PII_COMBINED_RE.finditer
+# Phone-like matches near these markers are reference numbers (ISBN, DOI, URLs), not PII.
+_PII_CONTEXT_CHARS = 50
+_PII_CONTEXT_MARKERS = ("ISBN", "DOI", "http://", "https://")
+# US-style (NXX) NXX-XXXX: valid area and central-office codes never start with 0 or 1.
+_NANP_RE = re.compile(r"\((\d{3})\)\s*(\d{3})[-.]?(\d{4})")
+# Data files are scanned in chunks; a match ending this close to a chunk edge is re-checked with more text.
+_PII_SCAN_CHUNK = 64 * 1024
+_PII_SCAN_OVERLAP = 1024
+
+
+def _no_pii_in_source_files(index: RepoIndex) -> bool:
     """Return True if no email or phone PII is found in Python source files under src/, ingestion/, or root."""
-    def scan_file(py: Path) -> bool:
-        content = _read_file_safe(py)
-        if _EMAIL_RE.search(content):
-            return False
-        if _PHONE_RE.search(content):
-            return False
-        return True
-
-    for base in [repo_path / "src", repo_path / "ingestion"]:
-        if not base.is_dir():
-            continue
-        for py in base.rglob("*.py"):
-            path_str = str(py)
-            if "__pycache__" in path_str or "venv" in path_str or ".venv" in path_str:
-                continue
-            if not scan_file(py):
-                return False
-    for py in repo_path.glob("*.py"):
-        if not scan_file(py):
+    root_py = [p for p in index.py_files if "/" not in p]
+    for py in index.py_under("src", "ingestion") + root_py:
+        if _text_has_pii(index.text(py)[:50_000]):
             return False
     return True
 
@@ -288,49 +425,186 @@ def _load_gitignore_patterns(repo_path: Path) -> list[str]:
     return patterns
 
 
-def _is_gitignored(repo_path: Path, file_path: Path, patterns: list[str]) -> bool:
-    """Return True if file_path (under repo_path) is matched by any .gitignore pattern."""
-    try:
-        rel = file_path.relative_to(repo_path)
-    except ValueError:
-        return False
-    path_posix = rel.as_posix()
+def _compile_gitignore(patterns: list[str]) -> re.Pattern[str] | None:
+    """
+    Translate .gitignore patterns into one anchored alternation (None if there are none).
+    A plain pattern matches the path itself or anything under it. For patterns containing
+    ** (loose: fnmatch's * already crosses /), the path must start with the part before
+    the first ** and end with the part after the last one.
+    """
+    alternatives = []
     for pattern in patterns:
-        # Support ** by replacing with * for fnmatch (loose: * in fnmatch doesn't match /)
-        # So we use a simple prefix/suffix fallback for patterns containing **
         if "**" in pattern:
             parts = pattern.split("**")
             prefix = parts[0].rstrip("/")
             suffix = parts[-1].lstrip("/") if len(parts) > 1 else ""
-            if prefix and not path_posix.startswith(prefix + "/") and path_posix != prefix:
-                continue
-            if suffix and not path_posix.endswith(suffix) and not fnmatch.fnmatch(path_posix, "*" + suffix):
-                continue
-            return True
-        if fnmatch.fnmatch(path_posix, pattern):
-            return True
-        if fnmatch.fnmatch(path_posix, pattern.rstrip("/") + "/*"):
-            return True
-    return False
+            regex = f"(?={re.escape(prefix)}(?:/|\\Z))" if prefix else ""
+            if suffix:
+                regex += f"(?:(?s:.*{re.escape(suffix)})\\Z|{fnmatch.translate('*' + suffix)})"
+            alternatives.append(regex or "(?s:.*)")
+            continue
+        alternatives.append(fnmatch.translate(pattern))
+        alternatives.append(fnmatch.translate(pattern.rstrip("/") + "/*"))
+    if not alternatives:
+        return None
+    return re.compile("|".join(f"(?:{a})" for a in alternatives))
+
+
+def _is_gitignored(repo_path: Path, file_path: Path, matcher: re.Pattern[str] | None) -> bool:
+    """Return True if file_path (under repo_path) is matched by the compiled .gitignore patterns."""
+    if matcher is None:
+        return False
+    try:
+        rel = file_path.relative_to(repo_path)
+    except ValueError:
+        return False
+    return matcher.match(rel.as_posix()) is not None
+
+
+def _is_pii_match(text: str, start: int, end: int) -> bool:
+    """
+    False for phone-like matches that are clearly not personal data: numbers next to an
+    ISBN/DOI/URL or right after "#", invalid NANP codes (placeholders like (123) 456-7890)
+    and the reserved fictional 555-01XX block. Emails are always kept.
+    """
+    value = text[start:end]
+    if "@" in value:
+        return True
+    before = text[max(0, start - _PII_CONTEXT_CHARS) : start]
+    context = before + value + text[end : end + _PII_CONTEXT_CHARS]
+    if any(marker in context for marker in _PII_CONTEXT_MARKERS) or before.rstrip().endswith("#"):
+        return False
+    nanp = _NANP_RE.match(value)
+    if nanp:
+        area, office, line = nanp.groups()
+        if area[0] in "01" or office[0] in "01" or (office == "555" and line.startswith("01")):
+            return False
+    return True
+
+
+def _find_pii(text: str) -> tuple[int, int] | None:
+    """Span of the first email or phone match that survives _is_pii_match, or None."""
+    for m in _PII_FINDITER(text):
+        start, end = m.span()
+        if _is_pii_match(text, start, end):
+            return start, end
+    return None
 
 
 def _text_has_pii(text: str) -> bool:
     """Return True if text contains email or phone PII."""
-    if _EMAIL_RE.search(text):
-        return True
-    if _PHONE_RE.search(text):
-        return True
+    return _find_pii(text) is not None
+
+
+def _column_has_pii(pc: Any, column: Any) -> bool:
+    """Arrow regex kernel as a prefilter; only the matching values go through _is_pii_match."""
+    matches = pc.match_substring_regex(column, _PII_COMBINED_RE.pattern)
+    if not pc.any(matches).as_py():
+        return False
+    for value in pc.filter(column, matches).to_pylist():
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", errors="replace")
+        if _text_has_pii(value):
+            return True
     return False
 
 
 def _scan_json_or_csv_for_pii(file_path: Path, max_chars: int = 500_000) -> bool:
-    """Return True if file (JSON or CSV) contains PII. True = has PII (fail)."""
-    content = _read_file_safe(file_path, max_size=max_chars)
-    return _text_has_pii(content)
+    """
+    Return True if file (JSON or CSV) contains PII. True = has PII (fail).
+    Reads the first max_chars in chunks and stops at the first hit.
+    """
+    try:
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            buf = ""
+            remaining = max_chars
+            while True:
+                chunk = f.read(min(_PII_SCAN_CHUNK, remaining))
+                remaining -= len(chunk)
+                eof = not chunk or remaining <= 0
+                buf += chunk
+                span = _find_pii(buf)
+                if span and (eof or span[1] <= len(buf) - _PII_SCAN_OVERLAP):
+                    return True
+                if eof:
+                    return False
+                # Keep the tail (or an edge match and its context) so patterns spanning chunks are still seen.
+                buf = buf[max(0, span[0] - _PII_CONTEXT_CHARS):] if span else buf[-_PII_SCAN_OVERLAP:]
+    except OSError:
+        return False
+
+
+def _scan_csv_for_pii(file_path: Path) -> bool:
+    """
+    Return True if a CSV file contains PII. True = has PII (fail).
+    Streams the whole file in record batches through pyarrow's regex kernel (header
+    row included), stopping at the first match. Falls back to the chunked text scan
+    when pyarrow is unavailable or cannot parse the file.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return _scan_json_or_csv_for_pii(file_path)
+    try:
+        reader = pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(block_size=1 << 20, autogenerate_column_names=True),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        )
+        for batch in reader:
+            for column in batch.columns:
+                if not pa.types.is_string(column.type) and not pa.types.is_large_string(column.type):
+                    continue
+                if _column_has_pii(pc, column):
+                    return True
+        return False
+    except Exception as e:
+        log.debug("pyarrow could not stream %s (%s); scanning as text", file_path, e)
+        return _scan_json_or_csv_for_pii(file_path)
 
 
-def _scan_parquet_for_pii(file_path: Path) -> bool:
-    """Return True if Parquet file string columns contain PII. True = has PII (fail)."""
+def _scan_parquet_for_pii(file_path: Path, max_row_groups: int | None = None) -> bool:
+    """
+    Return True if Parquet file string columns contain PII. True = has PII (fail).
+    Text columns are scanned one row group at a time (at most max_row_groups) with
+    pyarrow's regex kernel, stopping at the first match; falls back to pandas when
+    pyarrow is unavailable.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        return _scan_parquet_for_pii_pandas(file_path)
+    try:
+        pf = pq.ParquetFile(file_path)
+        text_cols = [
+            f.name
+            for f in pf.schema_arrow
+            if pa.types.is_string(f.type)
+            or pa.types.is_large_string(f.type)
+            or pa.types.is_binary(f.type)
+            or pa.types.is_large_binary(f.type)
+            or (pa.types.is_dictionary(f.type) and pa.types.is_string(f.type.value_type))
+        ]
+        if not text_cols:
+            return False
+        for rg in range(min(pf.num_row_groups, max_row_groups or pf.num_row_groups)):
+            table = pf.read_row_group(rg, columns=text_cols)
+            for column in table.columns:
+                if pa.types.is_dictionary(column.type):
+                    column = column.cast(pa.string())
+                if _column_has_pii(pc, column):
+                    return True
+    except Exception as e:
+        log.debug("Could not scan parquet %s: %s", file_path, e)
+    return False
+
+
+def _scan_parquet_for_pii_pandas(file_path: Path) -> bool:
+    """pandas fallback for _scan_parquet_for_pii: scan text columns only, stopping at the first hit."""
     try:
         import pandas as pd
     except ImportError:
@@ -339,39 +613,45 @@ def _scan_parquet_for_pii(file_path: Path) -> bool:
         df = pd.read_parquet(file_path)
     except Exception:
         return False
-    # Concatenate string representation of all columns and scan
-    text = df.astype(str).to_string()
-    return _text_has_pii(text)
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        if df[col].map(lambda v: isinstance(v, str) and _text_has_pii(v)).any():
+            return True
+    return False
+
+
+# Data file extension -> PII scanner (True = has PII).
+_DATA_PII_SCANNERS: dict[str, Callable[[Path], bool]] = {
+    "json": _scan_json_or_csv_for_pii,
+    "csv": _scan_csv_for_pii,
+    "parquet": _scan_parquet_for_pii,
+}
 
 
-def _no_pii_in_medallion_data_files(repo_path: Path) -> bool:
+def _no_pii_in_medallion_data_files(index: RepoIndex) -> bool:
     """Return True if no email or phone PII is found in non-gitignored JSON/CSV/Parquet under data/raw, bronze, silver, gold."""
-    patterns = _load_gitignore_patterns(repo_path)
-    medallion_dirs = ["raw", "bronze", "silver", "gold"]
-    data_dir = repo_path / "data"
-    if not data_dir.is_dir():
-        return True
-    for layer in medallion_dirs:
-        layer_dir = data_dir / layer
-        if not layer_dir.is_dir():
+    for layer in MEDALLION_LAYERS:
+        if not index.data_suffixes_by_layer.get(layer, set()) & _DATA_PII_SCANNERS.keys():
             continue
-        for ext in ("*.json", "*.csv", "*.parquet"):
-            for f in layer_dir.rglob(ext):
-                if not f.is_file():
-                    continue
-                if _is_gitignored(repo_path, f, patterns):
-                    continue
-                if f.suffix.lower() == ".json" or f.suffix.lower() == ".csv":
-                    if _scan_json_or_csv_for_pii(f):
-                        return False
-                elif f.suffix.lower() == ".parquet":
-                    if _scan_parquet_for_pii(f):
-                        return False
+        for rel in index.data_files_by_layer[layer]:
+            name = rel.rpartition("/")[2]
+            scan = _DATA_PII_SCANNERS.get(name.rpartition(".")[2].lower()) if "." in name else None
+            if scan is None:
+                continue
+            f = index.root / rel
+            if _is_gitignored(index.root, f, index.gitignore):
+                continue
+            if scan is _scan_parquet_for_pii and layer == "raw":
+                # Raw dumps repeat the same shape throughout; the first row group is a fair sample.
+                has_pii = _scan_parquet_for_pii(f, max_row_groups=1)
+            else:
+                has_pii = scan(f)
+            if has_pii:
+                return False
     return True
 
 
 # Map check_id -> detector function
-DETECTORS: dict[str, Callable[[Path], bool]] = {
+DETECTORS: dict[str, Callable[[RepoIndex], bool]] = {
     "has_raw_layer": _has_raw_layer,
     "has_bronze_layer": _has_bronze_layer,
     "has_silver_layer": _has_silver_layer,
@@ -446,35 +726,48 @@ def build_suggested_improvements(check_results: dict[str, bool]) -> list[str]:
 
 
 def run_checks(repo_path: Path) -> dict[str, bool]:
-    """Run all registered checks; return {check_id: passed}."""
-    repo_path = Path(repo_path)
+    """Run all registered checks against a single index of the repo; return {check_id: passed}."""
+    index = build_repo_index(repo_path)
+    cached = _CHECK_RESULTS_CACHE.get(index.fingerprint)
+    if cached is not None:
+        return dict(cached)
+    check_ids = list(dict.fromkeys(check_id for _dim, check_id, _weight in CHECK_REGISTRY))
+    # The index is built up front, so workers only read files and match strings.
+    with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as pool:
+        futures = {
+            check_id: pool.submit(DETECTORS[check_id], index)
+            for check_id in check_ids
+            if check_id in DETECTORS
+        }
     result = {}
-    for _dim, check_id, _weight in CHECK_REGISTRY:
-        if check_id in result:
-            continue
-        fn = DETECTORS.get(check_id)
-        if fn is None:
+    for check_id in check_ids:
+        future = futures.get(check_id)
+        if future is None:
             result[check_id] = False
             continue
         try:
-            result[check_id] = bool(fn(repo_path))
+            result[check_id] = bool(future.result())
         except Exception as e:
             log.debug("Check %s failed: %s", check_id, e)
             result[check_id] = False
+    _CHECK_RESULTS_CACHE[index.fingerprint] = dict(result)
     return result
 
 
+def _dimension_check_results(check_results: dict[str, bool]) -> dict[str, list[tuple[str, bool]]]:
+    """Group check outcomes by dimension in CHECK_REGISTRY order."""
+    return {
+        dim: [(check_id, check_results.get(check_id, False)) for check_id, _w in checks]
+        for dim, checks in _CHECKS_BY_DIMENSION.items()
+    }
+
+
 def compute_dimension_scores(check_results: dict[str, bool]) -> dict[str, int]:
     """Compute 0-100 score per dimension from check results using fixed weights."""
-    dimension_totals: dict[str, int] = {}
-    dimension_earned: dict[str, int] = {}
-    for dimension, check_id, weight in CHECK_REGISTRY:
-        dimension_totals[dimension] = dimension_totals.get(dimension, 0) + weight
-        if check_results.get(check_id, False):
-            dimension_earned[dimension] = dimension_earned.get(dimension, 0) + weight
     out = {}
-    for dim, total in dimension_totals.items():
-        earned = dimension_earned.get(dim, 0)
+    for dim, checks in _CHECKS_BY_DIMENSION.items():
+        total = _DIMENSION_TOTALS[dim]
+        earned = sum(weight for check_id, weight in checks if check_results.get(check_id, False))
         out[dim] = round(100 * earned / total) if total else 0
     # If any PII is found, sensitive_data_exposure_score must be 0 (not 50).
     if out.get("sensitive_data_exposure_score", 100) < 100:
@@ -526,9 +819,7 @@ def build_deterministic_evaluation_report(
     lines.append("")
 
     # Group checks by dimension
-    dim_checks: dict[str, list[tuple[str, bool]]] = {}
-    for dimension, check_id, _weight in CHECK_REGISTRY:
-        dim_checks.setdefault(dimension, []).append((check_id, check_results.get(check_id, False)))
+    dim_checks = _dimension_check_results(check_results)
 
     lines.append("## Architecture (medallion layers)")
     lines.append("")
@@ -622,11 +913,15 @@ def build_deterministic_evaluation_report_compact(
     passed = sum(1 for v in check_results.values() if v)
     total_checks = len(check_results)
 
+    total_len = 0
+
     def add(text: str) -> bool:
         """Append line(s) if total would stay <= max_chars. Returns True if added."""
-        candidate = "\n".join(parts + [text]) if parts else text
-        if len(candidate) <= max_chars:
+        nonlocal total_len
+        new_len = total_len + (1 if parts else 0) + len(text)
+        if new_len <= max_chars:
             parts.append(text)
+            total_len = new_len
             return True
         return False
 
@@ -635,9 +930,7 @@ def build_deterministic_evaluation_report_compact(
     add("")
 
     # Group checks by dimension (same as full report)
-    dim_checks: dict[str, list[tuple[str, bool]]] = {}
-    for dimension, check_id, _weight in CHECK_REGISTRY:
-        dim_checks.setdefault(dimension, []).append((check_id, check_results.get(check_id, False)))
+    dim_checks = _dimension_check_results(check_results)
 
     section_titles = [
         ("medallion_architecture", "Medallion"),
@@ -0,0 +1,125 @@
+"""
+Evaluation reports through the OpenAI Batch API: one uploaded JSONL for the whole run, polled until done.
+Half the price of live requests and not subject to per-request rate limits, at the cost of latency.
+Enabled with LLM_BATCH_API=1 (off by default).
+"""
+
+import json
+import os
+import time
+from typing import Any, Optional
+
+from . import llm_cache
+from .llm_evaluator import PROMPT_CACHE_KEY, _get_client, _summary_request
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SEC = 30
+_BATCH_DONE_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def batch_api_enabled() -> bool:
+    """True when LLM_BATCH_API is 1/true/yes."""
+    return os.environ.get("LLM_BATCH_API", "").strip().lower() in ("1", "true", "yes")
+
+
+def build_batch_jsonl(requests: dict[int, dict[str, Any]]) -> bytes:
+    """One Batch API request line per item index (its custom_id)."""
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {**request, "prompt_cache_key": PROMPT_CACHE_KEY},
+            }
+        )
+        for i, request in requests.items()
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_batch_output(text: str, count: int) -> list[Optional[str]]:
+    """Summaries by item index from a Batch API output file; None for failed or missing items."""
+    out: list[Optional[str]] = [None] * count
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            index = int(record["custom_id"])
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            content = (response["body"]["choices"][0]["message"]["content"] or "").strip()
+        except (ValueError, KeyError, IndexError, TypeError):
+            continue
+        if 0 <= index < count and content:
+            out[index] = content
+    return out
+
+
+def generate_evaluation_summaries_batch_api(
+    items: list[dict[str, Any]],
+    max_chars: int,
+    poll_interval: float = BATCH_POLL_INTERVAL_SEC,
+) -> list[Optional[str]]:
+    """
+    Evaluation summaries for all items via one Batch API job (items as for generate_evaluation_summary_llm_batch).
+    Blocks until the job finishes. One entry per item, in order; None where the job gave no summary or on error
+    (caller falls back to the deterministic report). With LLM_CACHE, requests are keyed exactly like the live
+    ones: cached summaries are not resubmitted and new ones are stored.
+    """
+    if not items:
+        return []
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        log.warning("OPENAI_API_KEY not set, skipping LLM evaluation summary")
+        return [None] * len(items)
+    requests = {
+        i: _summary_request(item["check_results"], item["scores"], max_chars, item.get("docker_results"))
+        for i, item in enumerate(items)
+    }
+    out: list[Optional[str]] = [None] * len(items)
+    keys = {}
+    if llm_cache.cache_enabled():
+        keys = {i: llm_cache.request_key(**request) for i, request in requests.items()}
+    for i, key in keys.items():
+        out[i] = llm_cache.get(key)
+    pending = {i: request for i, request in requests.items() if out[i] is None}
+    if not pending:
+        return out
+    results = _run_batch(_get_client(api_key), pending, len(items), poll_interval)
+    for i in pending:
+        out[i] = results[i]
+        if results[i] and i in keys:
+            llm_cache.put(keys[i], results[i])
+    return out
+
+
+def _run_batch(
+    client: Any, requests: dict[int, dict[str, Any]], count: int, poll_interval: float
+) -> list[Optional[str]]:
+    """Submit requests as one batch job, wait for it, and return the summaries by item index."""
+    try:
+        jsonl = build_batch_jsonl(requests)
+        upload = client.files.create(file=("evaluation_reports.jsonl", jsonl), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=upload.id, endpoint=BATCH_ENDPOINT, completion_window=BATCH_COMPLETION_WINDOW
+        )
+        log.info("Submitted %s evaluation reports as batch %s", len(requests), batch.id)
+        while batch.status not in _BATCH_DONE_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            log.warning("Batch %s ended with status %s", batch.id, batch.status)
+        # Expired or cancelled batches still return the requests that did complete.
+        if not batch.output_file_id:
+            return [None] * count
+        return parse_batch_output(client.files.content(batch.output_file_id).text, count)
+    except Exception as e:
+        log.warning("Batch API evaluation reports failed: %s", e)
+        return [None] * count
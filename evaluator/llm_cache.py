@@ -0,0 +1,93 @@
+"""
+On-disk cache of LLM completions, keyed by a SHA-256 of the full request.
+Enabled with LLM_CACHE=1 (off by default: temperature > 0 calls are not deterministic).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .logger import get_logger
+from .utils import get_project_root
+
+log = get_logger(__name__)
+
+CACHE_TTL_SEC = 7 * 86400
+
+
+def cache_enabled() -> bool:
+    """True when LLM_CACHE is 1/true/yes."""
+    return os.environ.get("LLM_CACHE", "").strip().lower() in ("1", "true", "yes")
+
+
+def get_cache_path() -> Path:
+    """SQLite file holding cached completions (LLM_CACHE_PATH, default .llm_cache/responses.sqlite3)."""
+    path = os.environ.get("LLM_CACHE_PATH")
+    if path:
+        return Path(path).resolve()
+    return get_project_root() / ".llm_cache" / "responses.sqlite3"
+
+
+def request_key(**request: Any) -> str:
+    """Stable hash of a chat.completions request (model, messages, sampling params)."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    path = get_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)")
+    return conn
+
+
+def get(key: str) -> Optional[str]:
+    """Cached completion text for key, or None if missing or older than CACHE_TTL_SEC."""
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute("SELECT value, created FROM completions WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        log.debug("LLM cache read failed: %s", e)
+        return None
+    if row is None or time.time() - row[1] > CACHE_TTL_SEC:
+        return None
+    return row[0]
+
+
+def put(key: str, value: str) -> None:
+    """Store completion text for key (errors are logged and ignored)."""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO completions (key, value, created) VALUES (?, ?, ?)", (key, value, time.time()))
+    except sqlite3.Error as e:
+        log.debug("LLM cache write failed: %s", e)
+
+
+def _completion_text(response: Any) -> str:
+    """First choice's text of a chat completion; streaming wrappers may already return the text."""
+    if isinstance(response, str):
+        return response
+    return response.choices[0].message.content or ""
+
+
+def cached_completion(create: Callable[..., Any], **request: Any) -> str:
+    """
+    Call create(**request) (a chat.completions.create) and return the first choice's text.
+    With the cache enabled, identical requests are answered from disk; empty answers are not stored.
+    """
+    if not cache_enabled():
+        return _completion_text(create(**request))
+    key = request_key(**request)
+    hit = get(key)
+    if hit is not None:
+        return hit
+    content = _completion_text(create(**request))
+    if content.strip():
+        put(key, content)
+    return content
@@ -2,16 +2,37 @@
 
 import json
 import os
-import re
+import random
+import threading
 import time
-from typing import Any, Optional
-
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 LLM_MAX_RETRIES = 3
 LLM_RETRY_DELAY_SEC = 2
+LLM_RETRY_MAX_DELAY_SEC = 30
+# Own generator for retry jitter (not the module-level random instance shared with the rest of the process).
+# Unseeded on purpose: a fixed seed would give every worker process the same jitter sequence.
+_JITTER_RNG = random.Random()
+# APITimeoutError subclasses APIConnectionError; listed for clarity.
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+try:  # optional, faster parser for the (multi-KB) JSON-mode responses
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from .context_collector import context_to_string
+from .llm_cache import cached_completion
 from .logger import get_logger
 
 log = get_logger(__name__)
@@ -27,6 +48,11 @@ LLM_KEYS = [
 ]
 SUMMARY_KEY = "summary"
 
+# OpenAI caches prompt prefixes of 1024+ tokens, so the system prompts below must stay static and come
+# first: keep evidence, scores and flags in the user message (apart from the per-run max_chars).
+# Requests also share PROMPT_CACHE_KEY so the same prefix is routed to the same cache.
+PROMPT_CACHE_KEY = "jiraflow-eval"
+
 SYSTEM_PROMPT = """You are a senior Data Engineering reviewer.
 Evaluate this Python repository implementing a Medallion Architecture pipeline.
 Use only the provided evidence.
@@ -163,6 +189,10 @@ REPORT_USER_TEMPLATE = """Based on the repository evidence below and the scores
 
 REPORT_MAX_TOKENS = 2500
 REPORT_MAX_CHARS = 12000  # cap for Excel cell
+REPORT_EVIDENCE_MAX_CHARS = 28000
+# gpt-4o-mini has a 128k-token window; stay below it so oversized evidence is trimmed instead of rejected.
+LLM_CONTEXT_TOKENS = 120_000
+SCORING_RESPONSE_TOKENS = 1000  # reserved for the JSON scores (evaluate_with_llm sets no max_tokens)
 
 # --- Evaluation summary (Excel-safe; limit enforced in prompt, no truncation) ---
 SUMMARY_DEFAULT_MAX_CHARS = 1800
@@ -193,19 +223,92 @@ Docker results:
 
 Write the evaluation summary (with a short Docker validation section) and then a "## Suggested Improvements" section based only on the failed flags above. Maximum {max_chars} characters. Do not change any scores or invent results."""
 
+# --- Combined call: scores + detailed report + summary in one request (evidence sent once) ---
+COMBINED_USER_TEMPLATE = """Use only the provided evidence below. In a single answer:
+1. Score the repository according to the scoring rules (0-5 per dimension).
+2. Write the detailed technical evaluation report described in the report instructions.
+3. Write the evaluation summary described in the summary instructions (maximum {max_chars} characters).
+
+Return ONLY a JSON object with no other text:
+{{
+  "scores": {{
+    "medallion_architecture": 0-5,
+    "sla_logic": 0-5,
+    "pipeline_organization": 0-5,
+    "readme_clarity": 0-5,
+    "code_quality": 0-5,
+    "cloud_ingestion": 0-5,
+    "naming_conventions_score": 0-5,
+    "summary": "short technical summary"
+  }},
+  "detailed_report": "markdown report",
+  "summary": "evaluation summary with a ## Suggested Improvements section"
+}}
+
+Scores already assigned (0-100 scale):
+{scores}
+
+Detected flags:
+{flags}
+
+Docker results:
+{docker_results}
+
+Evidence:
+
+{evidence}
+"""
+
+# Batched variant: several repositories in one request, answered as a JSON object.
+SUMMARY_BATCH_SYSTEM_SUFFIX = """
+- You will receive several repositories. Evaluate each one independently, using only its own data.
+- Answer with a JSON object: {"summaries": [{"id": <repository id>, "summary": "<evaluation summary text>"}]}, exactly one entry per repository."""
+
+SUMMARY_BATCH_ITEM_TEMPLATE = """### Repository {id}
+Scores:
+{scores}
+
+Detected flags:
+{flags}
+
+Docker results:
+{docker_results}"""
+
+SUMMARY_BATCH_USER_TEMPLATE = """{items}
+
+For each repository above, write the evaluation summary (with a short Docker validation section) and then a "## Suggested Improvements" section based only on its failed flags. Maximum {max_chars} characters per summary. Do not change any scores or invent results. Return the JSON object described in the instructions."""
+
+
+_SCORE_KEY_ORDER = (
+    "final_score",
+    "medallion_architecture",
+    "sla_logic",
+    "pipeline_organization",
+    "readme_clarity",
+    "code_quality",
+    "naming_conventions_score",
+    "cloud_ingestion",
+    "security_practices_score",
+    "sensitive_data_exposure_score",
+)
+
+
+def _yes_no_score(value: Any) -> str:
+    return "Yes" if value in (True, 100) else "No"
+
 
 def _format_scores_for_prompt(scores: dict[str, Any]) -> str:
-    lines = []
-    for k in ["final_score", "medallion_architecture", "sla_logic", "pipeline_organization", "readme_clarity", "code_quality", "naming_conventions_score", "cloud_ingestion", "security_practices_score", "sensitive_data_exposure_score"]:
-        if k in scores:
-            lines.append(f"- {k}: {scores[k]}")
-    lines.append(f"- pipeline_runs: {'Yes' if scores.get('pipeline_runs') in (True, 100) else 'No'}")
-    lines.append(f"- gold_generated: {'Yes' if scores.get('gold_generated') in (True, 100) else 'No'}")
-    return "\n".join(lines) if lines else "(none)"
+    return "\n".join(
+        [f"- {k}: {scores[k]}" for k in _SCORE_KEY_ORDER if k in scores]
+        + [
+            f"- pipeline_runs: {_yes_no_score(scores.get('pipeline_runs'))}",
+            f"- gold_generated: {_yes_no_score(scores.get('gold_generated'))}",
+        ]
+    )
 
 
 def _format_flags_for_prompt(check_results: dict[str, bool]) -> str:
-    return "\n".join(f"- {k}: {'Pass' if v else 'Fail'}" for k, v in sorted(check_results.items())) or "(none)"
+    return "\n".join(f"- {k}: {'Pass' if check_results[k] else 'Fail'}" for k in sorted(check_results)) or "(none)"
 
 
 def format_docker_results_for_summary(run_result: dict[str, Any] | None, max_len: int = 1500) -> str:
@@ -227,10 +330,6 @@ def format_docker_results_for_summary(run_result: dict[str, Any] | None, max_len
     return text[:max_len] + ("..." if len(text) > max_len else "")
 
 
-def _format_docker_results(run_result: dict[str, Any] | None, max_len: int = 1500) -> str:
-    return format_docker_results_for_summary(run_result, max_len)
-
-
 def _summary_system_prompt(max_chars: int) -> str:
     return SUMMARY_SYSTEM_PROMPT.format(max_chars=max_chars)
 
@@ -249,6 +348,26 @@ def _summary_user_prompt(
     )
 
 
+def _summary_request(
+    check_results: dict[str, bool],
+    scores: dict[str, Any],
+    max_chars: int,
+    docker_results: str | None,
+) -> dict[str, Any]:
+    """Chat completion parameters for one repo's evaluation summary (live request or Batch API line)."""
+    docker_text = docker_results if docker_results is not None else format_docker_results_for_summary(None)
+    # ~4 chars per token; cap tokens so model is unlikely to exceed limit
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _summary_system_prompt(max_chars)},
+            {"role": "user", "content": _summary_user_prompt(check_results, scores, max_chars, docker_text)},
+        ],
+        "temperature": 0.2,
+        "max_tokens": min(2048, (max_chars // 3) + 50),
+    }
+
+
 def generate_evaluation_summary_llm(
     check_results: dict[str, bool],
     scores: dict[str, Any],
@@ -266,66 +385,194 @@ def generate_evaluation_summary_llm(
         log.warning("OPENAI_API_KEY not set, skipping LLM evaluation summary")
         return None
 
-    docker_text = docker_results if docker_results is not None else _format_docker_results(None)
-    system_prompt = _summary_system_prompt(max_chars)
-    user_prompt = _summary_user_prompt(check_results, scores, max_chars, docker_text)
-    # ~4 chars per token; cap tokens so model is unlikely to exceed limit
-    max_tokens = min(2048, (max_chars // 3) + 50)
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "generate_evaluation_summary_llm",
+            _bounded_create(client),
+            **_summary_request(check_results, scores, max_chars, docker_results),
+        )
+    except Exception as e:
+        log.warning("generate_evaluation_summary_llm failed: %s", e)
+        return None
+    content = content.strip()
+    if not content:
+        return None
+    # Do not slice: limit is enforced by prompt only
+    return content
 
-    client = OpenAI(api_key=api_key)
-    last_error = None
-    for attempt in range(1, LLM_MAX_RETRIES + 1):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-                max_tokens=max_tokens,
-            )
-            content = (response.choices[0].message.content or "").strip()
-            if not content:
-                return None
-            # Do not slice: limit is enforced by prompt only
-            return content
-        except Exception as e:
-            last_error = e
-            if _is_retryable_error(e) and attempt < LLM_MAX_RETRIES:
-                log.warning("generate_evaluation_summary_llm attempt %s/%s failed (retrying): %s", attempt, LLM_MAX_RETRIES, e)
-                time.sleep(LLM_RETRY_DELAY_SEC)
-            else:
-                log.warning("generate_evaluation_summary_llm failed: %s", e)
-                return None
-    return None
+
+def generate_evaluation_summary_llm_batch(
+    items: list[dict[str, Any]],
+    max_chars: int = SUMMARY_DEFAULT_MAX_CHARS,
+) -> list[Optional[str]]:
+    """
+    Generate evaluation summaries for several repos in one LLM request (amortizes prefill and round-trips).
+    Each item has check_results, scores and docker_results (as for generate_evaluation_summary_llm).
+    Returns one entry per item, in order; None where the model gave no summary or on error
+    (caller should fall back to the deterministic summary for those).
+    """
+    if not items:
+        return []
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        log.warning("OPENAI_API_KEY not set, skipping LLM evaluation summary")
+        return [None] * len(items)
+
+    system_prompt = _summary_system_prompt(max_chars) + SUMMARY_BATCH_SYSTEM_SUFFIX
+    item_texts = [
+        SUMMARY_BATCH_ITEM_TEMPLATE.format(
+            id=i,
+            scores=_format_scores_for_prompt(item["scores"]),
+            flags=_format_flags_for_prompt(item["check_results"]),
+            docker_results=item.get("docker_results") or format_docker_results_for_summary(None),
+        )
+        for i, item in enumerate(items, start=1)
+    ]
+    user_prompt = SUMMARY_BATCH_USER_TEMPLATE.format(items="\n\n".join(item_texts), max_chars=max_chars)
+    max_tokens = min(16000, len(items) * ((max_chars // 3) + 50) + 50)
+
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "generate_evaluation_summary_llm_batch",
+            _bounded_create(client),
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.2,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+    except Exception as e:
+        log.warning("generate_evaluation_summary_llm_batch failed: %s", e)
+        return [None] * len(items)
+    parsed = _extract_json(content)
+    summaries: list[Optional[str]] = [None] * len(items)
+    entries = parsed.get("summaries") if isinstance(parsed, dict) else None
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        idx, text = entry.get("id"), entry.get("summary")
+        if isinstance(idx, int) and 1 <= idx <= len(items) and isinstance(text, str) and text.strip():
+            summaries[idx - 1] = text.strip()
+    return summaries
+
+
+# One client (and HTTP connection pool) per API key, shared by all threads.
+_CLIENTS: dict[str, OpenAI] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str) -> OpenAI:
+    """Return the shared OpenAI client for api_key, creating it on first use."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = OpenAI(api_key=api_key)
+        return client
+
+
+def _max_inflight() -> int:
+    """Process-wide cap on in-flight OpenAI requests (LLM_MAX_INFLIGHT, default 8)."""
+    try:
+        return max(1, int(os.environ.get("LLM_MAX_INFLIGHT", "8")))
+    except ValueError:
+        return 8
+
+
+# Report jobs, the concurrent report/summary calls inside each job and README lookups all share this,
+# so a large --jobs value cannot fan out past the account's rate limit. Cache hits do not take a slot.
+_INFLIGHT = threading.BoundedSemaphore(_max_inflight())
+
+
+def _bounded_create(client: OpenAI) -> Callable[..., Any]:
+    """client.chat.completions.create, run while holding one of the in-flight request slots."""
+
+    def create(**request: Any) -> Any:
+        request.setdefault("prompt_cache_key", PROMPT_CACHE_KEY)
+        with _INFLIGHT:
+            return client.chat.completions.create(**request)
+
+    return create
+
+
+def _streamed_create(client: OpenAI, stop_after: int) -> Callable[..., str]:
+    """
+    Like _bounded_create, but streams the completion and returns its text. Once more than stop_after
+    characters have arrived the stream is closed, which cancels generation of the unused tail.
+    """
+
+    def create(**request: Any) -> str:
+        request.setdefault("prompt_cache_key", PROMPT_CACHE_KEY)
+        with _INFLIGHT:
+            stream = client.chat.completions.create(stream=True, **request)
+            parts: list[str] = []
+            size = 0
+            try:
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    piece = chunk.choices[0].delta.content or ""
+                    parts.append(piece)
+                    size += len(piece)
+                    if size > stop_after:
+                        break
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            return "".join(parts)
+
+    return create
 
 
 def _extract_json(text: str) -> Optional[dict]:
-    """Try to parse JSON from model output (allow markdown code block)."""
-    text = text.strip()
-    # Strip optional markdown code block
-    m = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-    if m:
-        text = m.group(1).strip()
+    """Parse the model's JSON-mode output; None if it is not a JSON object."""
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        parsed = _json_loads(text)
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
         return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def _is_retryable_error(e: Exception) -> bool:
     """True for rate limit, server errors, timeouts, connection issues."""
-    err_str = str(e).lower()
-    if "429" in err_str or "rate" in err_str:
-        return True
-    if "503" in err_str or "502" in err_str or "500" in err_str:
-        return True
-    if "timeout" in err_str or "timed out" in err_str:
-        return True
-    if "connection" in err_str or "connect" in err_str:
-        return True
-    return False
+    return isinstance(e, _RETRYABLE_ERRORS)
+
+
+def _retry_delay(attempt: int, e: Exception) -> float:
+    """
+    Seconds to wait before the next attempt: the server's Retry-After on rate limits when present,
+    otherwise exponential backoff (capped) plus jitter so parallel workers do not retry in lockstep.
+    """
+    if isinstance(e, RateLimitError):
+        headers = getattr(getattr(e, "response", None), "headers", None) or {}
+        try:
+            retry_after = float(headers.get("retry-after"))
+        except (TypeError, ValueError, AttributeError):
+            retry_after = None
+        if retry_after is not None and retry_after >= 0:
+            return min(retry_after, 2 * LLM_RETRY_MAX_DELAY_SEC) + _JITTER_RNG.uniform(0, 0.5)
+    return min(LLM_RETRY_MAX_DELAY_SEC, LLM_RETRY_DELAY_SEC * (2 ** (attempt - 1))) + _JITTER_RNG.uniform(0, 0.5)
+
+
+def _complete_with_retry(label: str, create: Callable[..., Any], **request: Any) -> str:
+    """
+    cached_completion(create, **request) with up to LLM_MAX_RETRIES attempts. Transient errors are
+    retried after _retry_delay; any other error (or the last transient one) is raised to the caller.
+    """
+    for attempt in range(1, LLM_MAX_RETRIES):
+        try:
+            return cached_completion(create, **request)
+        except Exception as e:
+            if not _is_retryable_error(e):
+                raise
+            log.warning("%s attempt %s/%s failed (retrying): %s", label, attempt, LLM_MAX_RETRIES, e)
+            time.sleep(_retry_delay(attempt, e))
+    return cached_completion(create, **request)
 
 
 def get_run_command_from_readme(readme: str) -> Optional[str]:
@@ -341,34 +588,75 @@ def get_run_command_from_readme(readme: str) -> Optional[str]:
         return None
     readme_trimmed = readme[:8000].strip()
     prompt = README_RUN_COMMAND_PROMPT.format(readme=readme_trimmed)
-    client = OpenAI(api_key=api_key)
-    last_error = None
-    for attempt in range(1, LLM_MAX_RETRIES + 1):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=100,
-            )
-            content = (response.choices[0].message.content or "").strip()
-            if not content or content.upper() == "UNKNOWN":
-                return None
-            if "python" not in content.lower():
-                return None
-            return content
-        except Exception as e:
-            last_error = e
-            if _is_retryable_error(e) and attempt < LLM_MAX_RETRIES:
-                log.warning("get_run_command_from_readme attempt %s/%s failed (retrying): %s", attempt, LLM_MAX_RETRIES, e)
-                time.sleep(LLM_RETRY_DELAY_SEC)
-            else:
-                log.warning("get_run_command_from_readme failed: %s", e)
-                return None
-    return None
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "get_run_command_from_readme",
+            _bounded_create(client),
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=100,
+        )
+    except Exception as e:
+        log.warning("get_run_command_from_readme failed: %s", e)
+        return None
+    content = content.strip()
+    if not content or content.upper() == "UNKNOWN":
+        return None
+    if "python" not in content.lower():
+        return None
+    return content
 
 
-def evaluate_with_llm(context: dict[str, Any]) -> dict[str, Any]:
+def _evidence_for(context: dict[str, Any]) -> tuple[str, str]:
+    """
+    Return (full, report) evidence strings for the context. Both are rendered once and kept on the
+    context (under '_rendered' / '_report_evidence') so repeated LLM calls and retries reuse them.
+    """
+    full = context_to_string(context)
+    context["_rendered"] = full
+    report = context.get("_report_evidence")
+    if report is None:
+        report = full
+        if len(full) > REPORT_EVIDENCE_MAX_CHARS:
+            report = full[:REPORT_EVIDENCE_MAX_CHARS] + "\n\n... [evidence truncated for report]"
+        context["_report_evidence"] = report
+    return full, report
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> Any:
+    """tiktoken encoding for the model, or None when tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _fit_evidence(evidence: str, system_prompt: str, max_tokens: int) -> str:
+    """
+    Trim evidence so system prompt + evidence + response fit in LLM_CONTEXT_TOKENS (500 tokens spare
+    for the template). Counts tokens with tiktoken when available, else assumes 3 chars per token.
+    """
+    enc = _token_encoding()
+    if enc is None:
+        budget = (LLM_CONTEXT_TOKENS - len(system_prompt) // 3 - max_tokens - 500) * 3
+        if len(evidence) <= budget:
+            return evidence
+        return evidence[: max(0, budget)] + "\n\n... [evidence truncated to fit the model context]"
+    budget = LLM_CONTEXT_TOKENS - len(enc.encode(system_prompt)) - max_tokens - 500
+    tokens = enc.encode(evidence)
+    if len(tokens) <= budget:
+        return evidence
+    return enc.decode(tokens[: max(0, budget)]) + "\n\n... [evidence truncated to fit the model context]"
+
+
+def evaluate_with_llm(context: dict[str, Any], evidence: str | None = None) -> dict[str, Any]:
     """
     Send context to OpenAI; return dict with medallion_architecture, sla_logic,
     pipeline_organization, readme_clarity, code_quality (0-5), and summary.
@@ -379,36 +667,34 @@ def evaluate_with_llm(context: dict[str, Any]) -> dict[str, Any]:
         log.error("OPENAI_API_KEY not set")
         return _default_llm_result("OPENAI_API_KEY not set")
 
-    evidence = context_to_string(context)
-    user_prompt = USER_PROMPT_TEMPLATE.format(evidence=evidence)
-    client = OpenAI(api_key=api_key)
-    last_error = None
-    for attempt in range(1, LLM_MAX_RETRIES + 1):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-            )
-            content = (response.choices[0].message.content or "").strip()
-            if not content:
-                return _default_llm_result("Empty LLM response")
-            parsed = _extract_json(content)
-            if not parsed:
-                return _default_llm_result(f"Invalid JSON in response: {content[:200]}")
-            return _normalize_llm_result(parsed)
-        except Exception as e:
-            last_error = e
-            if _is_retryable_error(e) and attempt < LLM_MAX_RETRIES:
-                log.warning("evaluate_with_llm attempt %s/%s failed (retrying): %s", attempt, LLM_MAX_RETRIES, e)
-                time.sleep(LLM_RETRY_DELAY_SEC)
-            else:
-                log.exception("LLM call failed")
-                return _default_llm_result(str(e))
-    return _default_llm_result(str(last_error) if last_error else "Unknown error")
+    if evidence is None:
+        evidence = _evidence_for(context)[0]
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        evidence=_fit_evidence(evidence, SYSTEM_PROMPT, SCORING_RESPONSE_TOKENS)
+    )
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "evaluate_with_llm",
+            _bounded_create(client),
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.2,
+            response_format={"type": "json_object"},
+        )
+    except Exception as e:
+        log.exception("LLM call failed")
+        return _default_llm_result(str(e))
+    content = content.strip()
+    if not content:
+        return _default_llm_result("Empty LLM response")
+    parsed = _extract_json(content)
+    if not parsed:
+        return _default_llm_result(f"Invalid JSON in response: {content[:200]}")
+    return _normalize_llm_result(parsed)
 
 
 def _default_llm_result(error_message: str) -> dict[str, Any]:
@@ -430,7 +716,9 @@ def _normalize_llm_result(parsed: dict) -> dict[str, Any]:
     return out
 
 
-def generate_detailed_report(context: dict[str, Any], scores: dict[str, Any]) -> str:
+def generate_detailed_report(
+    context: dict[str, Any], scores: dict[str, Any], evidence: str | None = None
+) -> str:
     """
     Generate a detailed technical evaluation report (senior data engineer code review style).
     Uses the same evidence as scoring plus the assigned scores to produce a structured report
@@ -442,9 +730,8 @@ def generate_detailed_report(context: dict[str, Any], scores: dict[str, Any]) ->
         log.warning("OPENAI_API_KEY not set, skipping detailed report")
         return "Detailed report not generated (OPENAI_API_KEY not set)."
 
-    evidence = context_to_string(context)
-    if len(evidence) > 28000:
-        evidence = evidence[:28000] + "\n\n... [evidence truncated for report]"
+    if evidence is None:
+        evidence = _evidence_for(context)[1]
 
     lines = []
     for k, v in sorted(scores.items()):
@@ -459,31 +746,121 @@ def generate_detailed_report(context: dict[str, Any], scores: dict[str, Any]) ->
     scores_text = "\n".join(lines) if lines else "(no scores)"
 
     user_prompt = REPORT_USER_TEMPLATE.format(evidence=evidence, scores_text=scores_text)
-    client = OpenAI(api_key=api_key)
-    last_error = None
-    for attempt in range(1, LLM_MAX_RETRIES + 1):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": REPORT_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                max_tokens=REPORT_MAX_TOKENS,
-            )
-            content = (response.choices[0].message.content or "").strip()
-            if not content:
-                return "Detailed report could not be generated (empty model response)."
-            if len(content) > REPORT_MAX_CHARS:
-                content = content[:REPORT_MAX_CHARS] + "\n\n... [report truncated]"
-            return content
-        except Exception as e:
-            last_error = e
-            if _is_retryable_error(e) and attempt < LLM_MAX_RETRIES:
-                log.warning("generate_detailed_report attempt %s/%s failed (retrying): %s", attempt, LLM_MAX_RETRIES, e)
-                time.sleep(LLM_RETRY_DELAY_SEC)
-            else:
-                log.warning("generate_detailed_report failed: %s", e)
-                return f"Detailed report could not be generated: {str(e)[:200]}."
-    return f"Detailed report could not be generated: {str(last_error)[:200]}." if last_error else "Detailed report could not be generated."
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "generate_detailed_report",
+            _streamed_create(client, REPORT_MAX_CHARS),
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": REPORT_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.3,
+            max_tokens=REPORT_MAX_TOKENS,
+        )
+    except Exception as e:
+        log.warning("generate_detailed_report failed: %s", e)
+        return f"Detailed report could not be generated: {str(e)[:200]}."
+    content = content.strip()
+    if not content:
+        return "Detailed report could not be generated (empty model response)."
+    if len(content) > REPORT_MAX_CHARS:
+        content = content[:REPORT_MAX_CHARS] + "\n\n... [report truncated]"
+    return content
+
+
+def _combined_system_prompt(max_chars: int) -> str:
+    return "\n\n---\n\n".join(
+        [
+            "# Scoring rules\n\n" + SYSTEM_PROMPT,
+            "# Report instructions\n\n" + REPORT_SYSTEM_PROMPT,
+            "# Summary instructions\n\n" + _summary_system_prompt(max_chars),
+        ]
+    )
+
+
+def evaluate_and_report(
+    context: dict[str, Any],
+    check_results: dict[str, bool],
+    scores: dict[str, Any],
+    max_chars: int = SUMMARY_DEFAULT_MAX_CHARS,
+    docker_results: str | None = None,
+) -> dict[str, Any]:
+    """
+    Same result as run_full_evaluation, but from one request: the evidence is sent once and the
+    model returns scores, detailed report and summary together as JSON. Falls back to
+    run_full_evaluation when the combined answer cannot be parsed.
+    """
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        log.warning("OPENAI_API_KEY not set, skipping combined LLM evaluation")
+        return run_full_evaluation(context, check_results, scores, max_chars, docker_results)
+
+    system_prompt = _combined_system_prompt(max_chars)
+    max_tokens = REPORT_MAX_TOKENS + min(2048, (max_chars // 3) + 50) + 300
+    user_prompt = COMBINED_USER_TEMPLATE.format(
+        max_chars=max_chars,
+        scores=_format_scores_for_prompt(scores),
+        flags=_format_flags_for_prompt(check_results),
+        docker_results=docker_results if docker_results is not None else format_docker_results_for_summary(None),
+        evidence=_fit_evidence(_evidence_for(context)[0], system_prompt, max_tokens),
+    )
+    client = _get_client(api_key)
+    try:
+        content = _complete_with_retry(
+            "evaluate_and_report",
+            _bounded_create(client),
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.2,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+    except Exception as e:
+        log.warning("evaluate_and_report failed: %s", e)
+        return {
+            "llm": _default_llm_result(str(e)),
+            "evaluation_report": f"Detailed report could not be generated: {str(e)[:200]}.",
+            "summary": None,
+        }
+    parsed = _extract_json(content)
+    llm_scores = parsed.get("scores") if parsed else None
+    report = parsed.get("detailed_report") if parsed else None
+    if not isinstance(llm_scores, dict) or not isinstance(report, str) or not report.strip():
+        log.warning("Combined LLM answer incomplete; falling back to separate calls")
+        return run_full_evaluation(context, check_results, scores, max_chars, docker_results)
+    report = report.strip()
+    if len(report) > REPORT_MAX_CHARS:
+        report = report[:REPORT_MAX_CHARS] + "\n\n... [report truncated]"
+    summary = parsed.get("summary")
+    return {
+        "llm": _normalize_llm_result(llm_scores),
+        "evaluation_report": report,
+        "summary": summary.strip() if isinstance(summary, str) and summary.strip() else None,
+    }
+
+
+def run_full_evaluation(
+    context: dict[str, Any],
+    check_results: dict[str, bool],
+    scores: dict[str, Any],
+    max_chars: int = SUMMARY_DEFAULT_MAX_CHARS,
+    docker_results: str | None = None,
+) -> dict[str, Any]:
+    """
+    Score the repo with the LLM, then generate the detailed report and the summary concurrently
+    (both only depend on the scores). Returns {"llm": ..., "evaluation_report": ..., "summary": ...};
+    summary is None when the LLM summary is unavailable.
+    """
+    # Without a key every call returns early, so skip rendering/trimming the evidence altogether.
+    full_evidence, report_evidence = _evidence_for(context) if os.environ.get("OPENAI_API_KEY") else (None, None)
+    llm_result = evaluate_with_llm(context, full_evidence)
+    merged = {**scores, **{k: llm_result[k] for k in LLM_KEYS}}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        report = pool.submit(generate_detailed_report, context, merged, report_evidence)
+        summary = pool.submit(generate_evaluation_summary_llm, check_results, merged, max_chars, docker_results)
+        return {"llm": llm_result, "evaluation_report": report.result(), "summary": summary.result()}
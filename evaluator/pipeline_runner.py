@@ -1,12 +1,24 @@
 """Run pipeline in repo: Docker only (production-like), install deps, run entrypoint; verify data/gold has CSV."""
 
+import atexit
+import hashlib
+import itertools
+import mmap
 import os
 import re
+import shlex
+import shutil
+import stat
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .logger import get_logger
+from .utils import SKIP_DIRS, iter_repo_files
 
 log = get_logger(__name__)
 
@@ -14,6 +26,7 @@ PIPELINE_TIMEOUT = 180
 MAX_FILE_SIZE = 4000
 DOCKER_IMAGE = "python:3.12-slim"
 DEFAULT_RAW_INPUT_FILENAME = "tickets_raw.json"
+DOCKER_NOT_FOUND = "Docker not found. Docker is required to run candidate pipelines; please install Docker."
 
 # Env vars to pass into the pipeline container. Main set: Azure credentials + blob config (see .env.example).
 # Optional: RAW_INPUT_FILENAME. Only vars that are set and non-empty are passed.
@@ -36,6 +49,11 @@ ROOT_ENTRYPOINTS = ["main.py", "run_pipeline.py"]
 # Module entry points (run as module: python -m src.main)
 MODULE_ENTRYPOINTS = ["src/main.py", "src/run_pipeline.py"]
 GOLD_DIR = Path("data/gold")
+# Resource caps per pipeline, so one runaway candidate cannot starve the host or other jobs.
+DOCKER_CPUS = 2
+DOCKER_MEMORY_GB = 2
+DOCKER_PIDS_LIMIT = 512
+DOCKER_RESOURCE_ARGS = (f"--cpus={DOCKER_CPUS}", f"--memory={DOCKER_MEMORY_GB}g", f"--pids-limit={DOCKER_PIDS_LIMIT}")
 
 # Patterns to detect Azure/cloud ingestion in repo code
 AZURE_INGESTION_MARKERS = (
@@ -45,65 +63,177 @@ AZURE_INGESTION_MARKERS = (
     "DefaultAzureCredential",
     "azure-storage-blob",
 )
+SCAN_WORKERS = min(8, os.cpu_count() or 4)
+MMAP_MIN_SIZE = 64 * 1024  # smaller files are cheaper to read() than to map
+SCAN_PARALLEL_MIN_FILES = 32  # below this a pool costs more than it overlaps
+
+
+def _minimal_markers(markers: tuple[str, ...]) -> tuple[str, ...]:
+    """Drop markers that contain another marker (case-insensitively); any text they match is matched by the shorter one."""
+    lowered = [m.lower() for m in markers]
+    return tuple(
+        m for m, low in zip(markers, lowered) if not any(other != low and other in low for other in lowered)
+    )
+
+
+# One case-insensitive pass over the raw bytes instead of decode + lower() + a substring scan per marker.
+# Only the minimal marker set goes into the alternation ("azure" already covers most of the others).
+_AZURE_MARKERS_RE = re.compile(
+    b"|".join(re.escape(m.encode()) for m in _minimal_markers(AZURE_INGESTION_MARKERS)), re.IGNORECASE
+)
+
+# Python default for the raw input file: getenv("RAW_INPUT_FILENAME", "something")
+_GETENV_RAW_INPUT_RE = re.compile(rb'getenv\s*\(\s*["\']RAW_INPUT_FILENAME["\']\s*,\s*["\']([^"\']+)["\']\s*\)', re.IGNORECASE)
+# .env.example: RAW_INPUT_FILENAME=value (optionally quoted, optional trailing # comment)
+_ENV_RAW_INPUT_RE = re.compile(rb'^[ \t]*RAW_INPUT_FILENAME[ \t]*=[ \t]*["\']?([^"\'#\r\n]*)', re.MULTILINE)
+
+
+def _is_regular_file(path: str | Path) -> bool:
+    """Path.is_file() without building a Path: one stat (symlinks followed, as before), no exceptions."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _python_tree_key(repo_path: Path) -> str:
+    """
+    Digest of the paths, sizes and mtimes of the repo's .py files and env examples: everything the Azure and
+    raw-filename lookups read. Stat-only, so repeated lookups on an unchanged repo skip reading the files.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(repo_path.resolve()).encode())
+    for entry in iter_repo_files(repo_path, suffixes=(".py",)):
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        h.update(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    for name in (".env.example", ".env.sample"):
+        try:
+            st = (repo_path / name).stat()
+            h.update(f"{name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            h.update(f"{name}\0-\n".encode())
+    return h.hexdigest()
 
 
 def _repo_uses_azure_ingestion(repo_path: Path) -> bool:
     """Return True if the repo appears to use Azure/cloud ingestion (so raw file check is skipped)."""
-    search_dirs = [
-        repo_path / "src" / "ingestion",
-        repo_path / "ingestion",
-        repo_path / "src",
-    ]
-    search_files = [repo_path / ".env.example", repo_path / "config.py", repo_path / "src" / "utils" / "config.py"]
+    repo_path = Path(repo_path)
+    return _uses_azure_cached(repo_path, _python_tree_key(repo_path))
+
+
+@lru_cache(maxsize=256)
+def _uses_azure_cached(repo_path: Path, tree_key: str) -> bool:
+    # Plain string paths throughout: DirEntry.path for the walk, os.path for the fixed files.
+    root = os.fspath(repo_path)
     paths_to_check = []
-    for d in search_dirs:
-        if d.is_dir():
-            paths_to_check.extend(d.rglob("*.py"))
-    for f in search_files:
-        if f.is_file():
-            paths_to_check.append(f)
-    for path in paths_to_check:
+    # src/ already covers src/ingestion
+    for d in ("ingestion", "src"):
+        paths_to_check.extend(entry.path for entry in iter_repo_files(os.path.join(root, d), suffixes=(".py",)))
+    for rel in (".env.example", "config.py", os.path.join("src", "utils", "config.py")):
+        path = os.path.join(root, rel)
+        if _is_regular_file(path):
+            paths_to_check.append(path)
+    return _any_file_matches(paths_to_check, _AZURE_MARKERS_RE)
+
+
+def _any_file_matches(paths: list[str], pattern: re.Pattern[bytes]) -> bool:
+    """
+    True if any file contains pattern. Large file sets are scanned on a small thread pool so reads overlap;
+    the first hit cancels the scans that have not started yet.
+    """
+    if len(paths) <= SCAN_PARALLEL_MIN_FILES:
+        return any(_file_matches(path, pattern) for path in paths)
+    pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+    try:
+        futures = [pool.submit(_file_matches, path, pattern) for path in paths]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _file_matches(path: str | Path, pattern: re.Pattern[bytes]) -> bool:
+    """True if the bytes pattern occurs in the file; the file is memory-mapped rather than read into memory."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return pattern.search(mm) is not None
+            except (OSError, ValueError):
+                return pattern.search(f.read()) is not None
+    except OSError:
+        return False
+
+
+def _file_search_group(path: str, pattern: re.Pattern[bytes]) -> Optional[bytes]:
+    """First match's group 1 in the file's bytes (memory-mapped from MMAP_MIN_SIZE up), or None."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                m = pattern.search(f.read())
+                return m.group(1) if m else None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                m = pattern.search(mm)
+                value = m.group(1) if m else None
+                del m  # the match holds a view of the map; release it before the map closes
+                return value
+    except (OSError, ValueError):
+        return None
+
+
+def _get_repo_raw_input_filename(repo_path: Path) -> str:
+    """Resolve expected raw input filename: evaluator env, then .env.example, then Python getenv default, then default."""
+    # The evaluator's RAW_INPUT_FILENAME is passed into the container, where it wins over any getenv default or
+    # unloaded .env.example value; checking it first also skips all file I/O.
+    env_override = os.environ.get("RAW_INPUT_FILENAME", "").strip()
+    if env_override:
+        return env_override
+    repo_path = Path(repo_path)
+    return _raw_input_filename_cached(repo_path, _python_tree_key(repo_path))
+
+
+def _iter_py_files_by_priority(repo_path: Path) -> Iterator[os.DirEntry]:
+    """.py files under src/, then ingestion/, then the rest of the repo; each file is visited once."""
+    root = os.fspath(repo_path)
+    yield from iter_repo_files(os.path.join(root, "src"), suffixes=(".py",))
+    yield from iter_repo_files(os.path.join(root, "ingestion"), suffixes=(".py",))
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
         try:
-            text = path.read_text(encoding="utf-8", errors="replace").lower()
-        except Exception:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and entry.name not in ("src", "ingestion"):
+                    yield from iter_repo_files(entry.path, suffixes=(".py",))
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith(".py"):
+                yield entry
+        except OSError:
             continue
-        for marker in AZURE_INGESTION_MARKERS:
-            if marker.lower() in text:
-                return True
-    return False
 
 
-def _get_repo_raw_input_filename(repo_path: Path) -> str:
-    """Resolve expected raw input filename: .env.example, then Python getenv default, then evaluator env, then default."""
+@lru_cache(maxsize=256)
+def _raw_input_filename_cached(repo_path: Path, tree_key: str) -> str:
     # .env.example: RAW_INPUT_FILENAME=...
     for env_name in [".env.example", ".env.sample"]:
-        p = repo_path / env_name
-        if p.is_file():
-            try:
-                for line in p.read_text(encoding="utf-8", errors="replace").splitlines():
-                    line = line.strip()
-                    if line.startswith("RAW_INPUT_FILENAME="):
-                        value = line.split("=", 1)[1].strip().strip("'\"").split("#")[0].strip()
-                        if value:
-                            return value
-            except Exception:
-                pass
-    # Python: getenv("RAW_INPUT_FILENAME", "something")
-    getenv_re = re.compile(r'getenv\s*\(\s*["\']RAW_INPUT_FILENAME["\']\s*,\s*["\']([^"\']+)["\']\s*\)', re.IGNORECASE)
-    for base in (repo_path / "src", repo_path / "ingestion", repo_path):
-        if not base.is_dir():
+        try:
+            data = (repo_path / env_name).read_bytes()
+        except OSError:
             continue
-        for f in base.rglob("*.py"):
-            try:
-                m = getenv_re.search(f.read_text(encoding="utf-8", errors="replace"))
-                if m:
-                    return m.group(1).strip()
-            except Exception:
-                pass
-    # Evaluator env override
-    ev = os.environ.get("RAW_INPUT_FILENAME", "").strip()
-    if ev:
-        return ev
+        for m in _ENV_RAW_INPUT_RE.finditer(data):
+            value = m.group(1).strip()
+            if value:
+                return value.decode("utf-8", errors="replace")
+    # Python: getenv("RAW_INPUT_FILENAME", "something")
+    for entry in _iter_py_files_by_priority(repo_path):
+        value = _file_search_group(entry.path, _GETENV_RAW_INPUT_RE)
+        if value is not None:
+            return value.strip().decode("utf-8", errors="replace")
     return DEFAULT_RAW_INPUT_FILENAME
 
 
@@ -134,7 +264,7 @@ def _require_raw_input_file_exists(repo_path: Path) -> Optional[str]:
         return None
     filename = _get_repo_raw_input_filename(repo_path)
     raw_path = repo_path / filename
-    if raw_path.is_file():
+    if _is_regular_file(raw_path):
         return None
     if _seed_minimal_raw_file(repo_path, filename):
         return None
@@ -144,27 +274,33 @@ def _require_raw_input_file_exists(repo_path: Path) -> Optional[str]:
     )
 
 
+def _file_names(directory: Path) -> set[str]:
+    """Names of the regular files (symlinks followed) directly in directory; empty if it is not a directory."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return set()
+
+
 def _find_entrypoint(repo_path: Path) -> Optional[tuple[Path, bool]]:
     """Return (entry_path, is_module). is_module True => run with python -m <module>."""
+    root_names = _file_names(repo_path)
     for name in ROOT_ENTRYPOINTS:
-        p = repo_path / name
-        if p.is_file():
-            return (p, False)
+        if name in root_names:
+            return (repo_path / name, False)
+    names_by_dir: dict[str, set[str]] = {}
     for rel in MODULE_ENTRYPOINTS:
-        p = repo_path / rel
-        if p.is_file():
-            return (p, True)
+        parent, _, name = rel.rpartition("/")
+        if parent not in names_by_dir:
+            names_by_dir[parent] = _file_names(repo_path / parent)
+        if name in names_by_dir[parent]:
+            return (repo_path / rel, True)
     return None
 
 
 def _gold_has_csv(repo_path: Path) -> bool:
-    gold = repo_path / GOLD_DIR
-    if not gold.is_dir():
-        return False
-    for f in gold.rglob("*.csv"):
-        if f.is_file():
-            return True
-    return False
+    return any(True for _ in iter_repo_files(os.path.join(repo_path, GOLD_DIR), suffixes=(".csv",)))
 
 
 def _entrypoint_to_cmd_string(entry_path: Path, repo_path: Path, is_module: bool) -> str:
@@ -176,6 +312,12 @@ def _entrypoint_to_cmd_string(entry_path: Path, repo_path: Path, is_module: bool
     return f"python {entry_path.name}"
 
 
+@lru_cache(maxsize=1)
+def _docker_bin() -> Optional[str]:
+    """Absolute path of the docker CLI, resolved once per process (None if it is not on PATH)."""
+    return shutil.which("docker")
+
+
 def _docker_env_args() -> list[str]:
     """Build -e VAR=value args for Azure (and similar) env vars set on the host."""
     args = []
@@ -186,8 +328,323 @@ def _docker_env_args() -> list[str]:
     return args
 
 
+def _docker_network_args(installs_at_run_time: bool) -> list[str]:
+    """
+    --network=none when the container needs no network: no Azure credentials to reach blob storage and no
+    pip install at run time. Skipping the bridge/veth setup shortens container start.
+    """
+    if installs_at_run_time:
+        return []
+    if any((os.environ.get(name) or "").strip() for name in AZURE_ENV_VARS if name != "RAW_INPUT_FILENAME"):
+        return []
+    return ["--network=none"]
+
+
+def _drain_tail(stream, buf: bytearray) -> None:
+    """Read stream to EOF, keeping (roughly) only its last MAX_FILE_SIZE bytes in buf."""
+    for chunk in iter(lambda: stream.read(4096), b""):
+        buf += chunk
+        if len(buf) > 2 * MAX_FILE_SIZE:
+            del buf[:-MAX_FILE_SIZE]
+    stream.close()
+
+
+def _run_capped(cmd: list[str], timeout: int, cwd: Optional[Path] = None) -> tuple[int, str, str]:
+    """
+    Like subprocess.run(capture_output=True) but both pipes are drained continuously and only the last
+    MAX_FILE_SIZE bytes of each are kept, so chatty pipelines neither block on a full pipe nor fill memory.
+    The tail is kept because that is where tracebacks end up. Raises subprocess.TimeoutExpired (after kill).
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd)
+    out_buf, err_buf = bytearray(), bytearray()
+    readers = [
+        threading.Thread(target=_drain_tail, args=(proc.stdout, out_buf), daemon=True),
+        threading.Thread(target=_drain_tail, args=(proc.stderr, err_buf), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        code = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+    return (
+        code,
+        out_buf[-MAX_FILE_SIZE:].decode("utf-8", errors="replace"),
+        err_buf[-MAX_FILE_SIZE:].decode("utf-8", errors="replace"),
+    )
+
+
+RUNNER_CONTAINER_PREFIX = "jfe-runner"
+RUNNER_DEPS_DIR = "/deps"  # inside the runner; one site dir per requirements hash (with DOCKER_DEPS_CACHE)
+# Inside the runner: <id>/repo is a docker cp of the repo, <id>/work holds the run's HOME, TMPDIR and site dir.
+RUNNER_RUNS_DIR = "/runs"
+# Each run executes as its own unprivileged uid, so it cannot read other runs' copies (mode 700), cannot write the
+# image's site-packages or the root-owned deps cache, and everything it leaves behind can be found by owner.
+RUNNER_UID_BASE = 20000
+# World-writable places in the image where a run could leave files for later runs; cleaned by owner after each run.
+RUNNER_SHARED_TMP_DIRS = ("/tmp", "/var/tmp", "/dev/shm")
+RUNNER_STEP_TIMEOUT = 120
+# Warm runner (DOCKER_WARM_RUNNER): container name; None until started.
+_runner: Optional[str] = None
+_runner_failed = False
+_runner_lock = threading.Lock()
+_runner_ids = itertools.count(1)
+# Pipelines the warm runner runs at once (evaluate --jobs); its CPU, memory and pids caps are scaled by this.
+_runner_slots = 1
+
+
+def set_runner_slots(slots: int) -> None:
+    """Size the warm runner for this many concurrent pipelines (call before the first run)."""
+    global _runner_slots
+    _runner_slots = max(1, slots)
+
+
+def _runner_resource_args() -> tuple[str, ...]:
+    """
+    DOCKER_RESOURCE_ARGS times the number of slots. CPU and memory are one pool shared by the concurrent runs
+    (a runaway run is the likely OOM victim); the process cap is also applied per run (ulimit -u on its uid).
+    """
+    return (
+        f"--cpus={DOCKER_CPUS * _runner_slots}",
+        f"--memory={DOCKER_MEMORY_GB * _runner_slots}g",
+        f"--pids-limit={DOCKER_PIDS_LIMIT * _runner_slots}",
+    )
+
+
+def _warm_runner_enabled() -> bool:
+    return os.environ.get("DOCKER_WARM_RUNNER", "").strip().lower() in ("1", "true", "yes")
+
+
+def _stop_runner_container(name: str) -> None:
+    try:
+        subprocess.run([_docker_bin() or "docker", "rm", "-f", name], capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def _ensure_runner_container() -> Optional[str]:
+    """
+    Start (once per process) a long-lived container and return its name; None if it cannot be started
+    (caller falls back to docker run). Nothing is mounted: each run gets its repo copied in (_run_in_runner).
+    """
+    global _runner, _runner_failed
+    with _runner_lock:
+        if _runner is not None:
+            return _runner
+        if _runner_failed:
+            return None
+        name = f"{RUNNER_CONTAINER_PREFIX}-{os.getpid()}"
+        docker_cmd = [_docker_bin(), "run", "-d", "--rm", "--name", name]
+        docker_cmd.extend(["-e", "PYTHONUNBUFFERED=1", *_runner_resource_args()])
+        docker_cmd.extend(_docker_env_args())
+        # Other uids may pass through /runs and /deps but not list them.
+        setup = f"mkdir -p -m 711 {RUNNER_RUNS_DIR} {RUNNER_DEPS_DIR} && exec sleep infinity"
+        docker_cmd.extend([DOCKER_IMAGE, "bash", "-c", setup])
+        try:
+            proc = subprocess.run(docker_cmd, capture_output=True, text=True, timeout=120)
+            error = (proc.stderr or "").strip() if proc.returncode != 0 else None
+        except (OSError, subprocess.SubprocessError) as e:
+            error = str(e)
+        if error is not None:
+            log.warning("Could not start warm Docker runner, using docker run per repo: %s", error)
+            _runner_failed = True
+            return None
+        _runner = name
+        atexit.register(_stop_runner_container, name)
+        return name
+
+
+def _runner_install_script(work: str, requirements: bytes) -> str:
+    """Install requirements.txt into <work>/site (skipped when the deps cache already has this hash)."""
+    install = f"pip install -q --target {work}/site -r requirements.txt 2>/dev/null"
+    if not _deps_cache_enabled():
+        return install
+    cached = f"{RUNNER_DEPS_DIR}/{_requirements_digest(requirements)}"
+    return f'if [ ! -f {cached}/.complete ]; then {install} && touch {work}/site/.complete; fi'
+
+
+def _runner_publish_script(work: str, requirements: bytes) -> str:
+    """
+    Run as root before the pipeline starts: move a complete install into the deps cache, owned by root so no
+    later run can alter it. A concurrent publish of the same hash wins the rename; this copy is then left for
+    this run only (also root-owned by then).
+    """
+    cached = f"{RUNNER_DEPS_DIR}/{_requirements_digest(requirements)}"
+    return (
+        f'if [ -f {work}/site/.complete ] && [ ! -e {cached} ]; then '
+        f'chown -R "$(id -u):$(id -g)" {work}/site && mv -T {work}/site {cached} 2>/dev/null; fi; true'
+    )
+
+
+def _runner_pipeline_script(work: str, requirements: Optional[bytes], cmd_str: str) -> str:
+    """The pipeline command with the run's site dir (or the cached one) on PYTHONPATH."""
+    if requirements is None:
+        return cmd_str
+    site = f"{work}/site"
+    if _deps_cache_enabled():
+        cached = f"{RUNNER_DEPS_DIR}/{_requirements_digest(requirements)}"
+        site = f'$([ -f {cached}/.complete ] && echo {cached} || echo {work}/site)'
+    return f'PYTHONPATH="{site}${{PYTHONPATH:+:$PYTHONPATH}}" bash -c {shlex.quote(cmd_str)}'
+
+
+def _runner_cleanup_script(run_dir: str, uid: int) -> str:
+    """Run as root after each run: kill the run's leftover processes and delete everything it owned."""
+    tmp_dirs = " ".join(RUNNER_SHARED_TMP_DIRS)
+    return (
+        f'for p in /proc/[0-9]*; do [ "$(stat -c %u "$p" 2>/dev/null)" = {uid} ] && '
+        'kill -9 "${p#/proc/}" 2>/dev/null; done; '
+        f"rm -rf {run_dir}; find {tmp_dirs} -user {uid} -delete 2>/dev/null; true"
+    )
+
+
+def _run_in_runner(repo_path: Path, cmd_str: str) -> Optional[tuple[int, str, str]]:
+    """
+    Run the pipeline in the warm runner; None if the runner is unavailable.
+    The repo is copied (docker cp) into a scratch dir of its own and run there as a per-run uid, so a pipeline
+    sees no other repo's files or packages. Outputs are copied back to repo_path afterwards, then the scratch
+    dir, the run's leftover processes and its files in shared temp dirs are removed.
+    """
+    name = _ensure_runner_container()
+    if name is None:
+        return None
+    docker = _docker_bin()
+    run_id = next(_runner_ids)
+    uid = RUNNER_UID_BASE + run_id
+    run_dir = f"{RUNNER_RUNS_DIR}/{run_id}"
+    work = f"{run_dir}/work"
+    requirements = _read_requirements(repo_path)
+
+    def root_exec(script: str) -> tuple[int, str, str]:
+        return _run_capped([docker, "exec", name, "bash", "-c", script], timeout=RUNNER_STEP_TIMEOUT)
+
+    def user_exec(script: str) -> tuple[int, str, str]:
+        docker_cmd = [docker, "exec", "-u", f"{uid}:{uid}", "-w", f"{run_dir}/repo"]
+        docker_cmd.extend(["-e", f"HOME={work}/home", "-e", f"TMPDIR={work}/tmp", name])
+        # timeout (inside the container) signals the whole process group, so nothing outlives the run.
+        # RLIMIT_NPROC counts the run's own uid only, so a fork bomb cannot use up the other runs' pids.
+        script = f"ulimit -u {DOCKER_PIDS_LIMIT} 2>/dev/null; {script}"
+        docker_cmd.extend(["timeout", str(PIPELINE_TIMEOUT), "bash", "-c", script])
+        return _run_capped(docker_cmd, timeout=PIPELINE_TIMEOUT + 30)
+
+    try:
+        code, _, err = root_exec(f"mkdir -p {work}/home {work}/tmp")
+        if code == 0:
+            code, _, err = _run_capped([docker, "cp", f"{repo_path}/.", f"{name}:{run_dir}/repo"], RUNNER_STEP_TIMEOUT)
+        if code == 0:
+            code, _, err = root_exec(f"chown -R {uid}:{uid} {run_dir} && chmod 700 {run_dir}")
+        if code != 0:
+            return (-1, "", f"Could not prepare the warm runner: {err.strip()}")
+        script = _runner_pipeline_script(work, requirements, cmd_str)
+        if requirements is not None:
+            install = _runner_install_script(work, requirements)
+            if _deps_cache_enabled():
+                # Published before the pipeline runs, so repo code never gets to touch what later runs reuse.
+                user_exec(install)
+                root_exec(_runner_publish_script(work, requirements))
+            else:
+                script = f"{install}; {script}"
+        code, out, err = user_exec(script)
+    except subprocess.TimeoutExpired:
+        code, out, err = (124, "", "")
+    except Exception as e:
+        code, out, err = (-1, "", str(e))
+    finally:
+        try:
+            _run_capped([docker, "cp", f"{name}:{run_dir}/repo/.", str(repo_path)], RUNNER_STEP_TIMEOUT)
+        except Exception as e:
+            log.debug("Could not copy pipeline outputs back for %s: %s", repo_path.name, e)
+        try:
+            root_exec(_runner_cleanup_script(run_dir, uid))
+        except Exception as e:
+            log.debug("Warm runner cleanup failed for %s: %s", repo_path.name, e)
+    if code == 124:
+        return (-1, out, f"Pipeline execution timed out ({PIPELINE_TIMEOUT}s)")
+    return (code, out, err)
+
+
+DEPS_IMAGE_REPO = "jfe-deps"
+DEPS_BUILD_TIMEOUT = 600
+# BuildKit cache mount: wheels downloaded for one requirements set are reused by builds for the others.
+_DEPS_DOCKERFILE = f"""# syntax=docker/dockerfile:1
+FROM {DOCKER_IMAGE}
+COPY requirements.txt /tmp/requirements.txt
+RUN --mount=type=cache,target=/root/.cache/pip,sharing=locked pip install -q --no-compile -r /tmp/requirements.txt
+"""
+# Per-tag locks so concurrent jobs with the same requirements build the image once; failed tags are not retried.
+_deps_image_locks: dict[str, threading.Lock] = {}
+_deps_image_locks_guard = threading.Lock()
+_deps_image_failed: set[str] = set()
+
+
+def _read_requirements(repo_path: Path) -> Optional[bytes]:
+    """Raw requirements.txt of the repo, or None if it has none."""
+    try:
+        return (Path(repo_path) / "requirements.txt").read_bytes()
+    except OSError:
+        return None
+
+
+def _requirements_digest(requirements: bytes) -> str:
+    """Short hash of base image + requirements; identical requirements share installed dependencies."""
+    return hashlib.sha256(DOCKER_IMAGE.encode() + b"\0" + requirements).hexdigest()[:12]
+
+
+def _deps_cache_enabled() -> bool:
+    return os.environ.get("DOCKER_DEPS_CACHE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _ensure_deps_image(repo_path: Path) -> Optional[str]:
+    """
+    Return the tag of an image with the repo's requirements.txt preinstalled, building it on first use.
+    Tagged by a hash of base image + requirements, so repos (and reruns) with identical requirements share it.
+    None when there is no requirements.txt or the build fails (caller installs at run time instead).
+    """
+    requirements = _read_requirements(repo_path)
+    if requirements is None:
+        return None
+    tag = f"{DEPS_IMAGE_REPO}:{_requirements_digest(requirements)}"
+    with _deps_image_locks_guard:
+        lock = _deps_image_locks.setdefault(tag, threading.Lock())
+    with lock:
+        if tag in _deps_image_failed:
+            return None
+        try:
+            if subprocess.run([_docker_bin(), "image", "inspect", tag], capture_output=True, timeout=30).returncode == 0:
+                return tag
+            with tempfile.TemporaryDirectory() as build_dir:
+                (Path(build_dir) / "requirements.txt").write_bytes(requirements)
+                (Path(build_dir) / "Dockerfile").write_text(_DEPS_DOCKERFILE, encoding="utf-8")
+                proc = subprocess.run(
+                    [_docker_bin(), "build", "-q", "-t", tag, build_dir],
+                    capture_output=True,
+                    timeout=DEPS_BUILD_TIMEOUT,
+                    env={**os.environ, "DOCKER_BUILDKIT": "1"},
+                )
+            # Build logs can be long: keep bytes, decode only the tail that is logged.
+            error = proc.stderr[-400:].decode("utf-8", errors="replace").strip() if proc.returncode != 0 else None
+        except (OSError, subprocess.SubprocessError) as e:
+            error = str(e)
+        if error is not None:
+            log.warning("Dependency image build failed for %s, installing at run time: %s", repo_path.name, error)
+            _deps_image_failed.add(tag)
+            return None
+        return tag
+
+
 def _run_in_docker(repo_path: Path, cmd_str: str) -> tuple[int, str, str]:
     """Run pip install + cmd_str inside a container with repo mounted. Return (returncode, stdout, stderr)."""
+    docker = _docker_bin()
+    if docker is None:
+        return (-1, "", DOCKER_NOT_FOUND)
+    if _warm_runner_enabled():
+        warm = _run_in_runner(repo_path, cmd_str)
+        if warm is not None:
+            return warm
     # When evaluator runs inside Docker (e.g. CI), repo_path is like /app/temp_repos/RepoName; the host path
     # is different. Set HOST_TEMP_REPOS_DIR to the host's temp_repos path so the volume mount is correct.
     host_repos = os.environ.get("HOST_TEMP_REPOS_DIR")
@@ -196,9 +653,15 @@ def _run_in_docker(repo_path: Path, cmd_str: str) -> tuple[int, str, str]:
     else:
         mount_src = repo_path.resolve()
     mount = f"{mount_src}:/app"
-    script = f"pip install -q -r requirements.txt 2>/dev/null; {cmd_str}"
+    # Nothing to install without requirements.txt; with a deps image the install is already baked in
+    # (its tag is the requirements hash, so unchanged requirements never reinstall).
+    has_requirements = _is_regular_file(os.path.join(repo_path, "requirements.txt"))
+    image = _ensure_deps_image(repo_path) if has_requirements and _deps_cache_enabled() else None
+    installs_at_run_time = has_requirements and not image
+    script = f"pip install -q -r requirements.txt 2>/dev/null; {cmd_str}" if installs_at_run_time else cmd_str
+    image = image or DOCKER_IMAGE
     docker_cmd = [
-        "docker",
+        docker,
         "run",
         "--rm",
         "-v",
@@ -207,22 +670,17 @@ def _run_in_docker(repo_path: Path, cmd_str: str) -> tuple[int, str, str]:
         "/app",
         "-e",
         "PYTHONUNBUFFERED=1",
+        *DOCKER_RESOURCE_ARGS,
     ]
+    docker_cmd.extend(_docker_network_args(installs_at_run_time))
     docker_cmd.extend(_docker_env_args())
-    docker_cmd.extend([DOCKER_IMAGE, "bash", "-c", script])
+    docker_cmd.extend([image, "bash", "-c", script])
     try:
-        proc = subprocess.run(
-            docker_cmd,
-            capture_output=True,
-            text=True,
-            timeout=PIPELINE_TIMEOUT,
-            cwd=repo_path,
-        )
-        return (proc.returncode, proc.stdout or "", proc.stderr or "")
+        return _run_capped(docker_cmd, timeout=PIPELINE_TIMEOUT, cwd=repo_path)
     except subprocess.TimeoutExpired:
         return (-1, "", "Pipeline execution timed out (180s)")
     except FileNotFoundError:
-        return (-1, "", "Docker not found. Docker is required to run candidate pipelines; please install Docker.")
+        return (-1, "", DOCKER_NOT_FOUND)
     except Exception as e:
         return (-1, "", str(e))
 
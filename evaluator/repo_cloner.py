@@ -1,36 +1,45 @@
 """Clone repositories into temp_repos/<repo_name>. Skip or pull if exists."""
 
+import os
 import re
 import shutil
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from .logger import get_logger
-from .utils import get_temp_repos_dir
+from .utils import get_temp_repos_dir, iter_repo_files
 
 log = get_logger(__name__)
 
 CLONE_MAX_RETRIES = 3
 CLONE_RETRY_DELAY_SEC = 2
+# Only the tip commit's working tree is ever read or run, so history and unused blobs can be skipped.
+SHALLOW_CLONE_ARGS = ["--depth=1", "--single-branch", "--filter=blob:none"]
+# https://github.com/user/repo or git@github.com:user/repo.git
+_OWNER_REPO_RE = re.compile(r"(?:/|:)([^/]+)/([^/]+?)(?:\.git)?$")
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^\w\-.]")
 
 
+@lru_cache(maxsize=4096)
 def repo_name_from_url(url: str) -> str:
     """Derive a safe directory name from repo URL (e.g. user/project1 -> user_project1)."""
     url = str(url).strip().rstrip("/")
     # https://github.com/user/repo or git@github.com:user/repo.git
-    match = re.search(r"(?:/|:)([^/]+)/([^/]+?)(?:\.git)?$", url)
+    match = _OWNER_REPO_RE.search(url)
     if match:
         return f"{match.group(1)}_{match.group(2)}"
     # fallback: sanitize last segment
     name = url.split("/")[-1].replace(".git", "")
-    return re.sub(r"[^\w\-.]", "_", name) or "repo"
+    return _UNSAFE_NAME_CHARS_RE.sub("_", name) or "repo"
 
 
-def clone_repo(repo_url: str, pull_if_exists: bool = True) -> Optional[Path]:
+def clone_repo(repo_url: str, pull_if_exists: bool = True, shallow: bool = False) -> Optional[Path]:
     """
     Clone repo into temp_repos/<repo_name>. If directory exists, pull latest when pull_if_exists.
+    With shallow=True, fetch only the tip commit (--depth=1 --filter=blob:none), also when updating.
     Return local path or None on error.
     """
     base = get_temp_repos_dir()
@@ -39,44 +48,55 @@ def clone_repo(repo_url: str, pull_if_exists: bool = True) -> Optional[Path]:
     dest = base / name
 
     if dest.exists() and (dest / ".git").exists():
+        # Touch so cache eviction treats this clone as recently used.
+        os.utime(dest)
         if pull_if_exists:
+            remote_sha = _remote_head_sha(repo_url)
+            if remote_sha and remote_sha == _local_head_sha(dest):
+                log.debug("clone up to date, skipping pull: %s", dest)
+                return dest
             try:
-                subprocess.run(
-                    ["git", "pull", "--quiet"],
-                    cwd=dest,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
+                if shallow:
+                    _update_shallow(dest)
+                else:
+                    subprocess.run(
+                        ["git", "pull", "--quiet"],
+                        cwd=dest,
+                        capture_output=True,
+                        text=True,
+                        timeout=60,
+                    )
             except subprocess.TimeoutExpired:
                 log.warning("git pull timed out for %s", dest)
             except Exception as e:
                 log.warning("git pull failed for %s: %s", dest, e)
         return dest
 
+    # Clone into a hidden sibling and rename into place, so an interrupted clone never looks like a cached one.
+    partial = base / f".{name}.partial"
+    clone_args = ["git", "clone", "--quiet", *(SHALLOW_CLONE_ARGS if shallow else []), repo_url, str(partial)]
     last_error = None
     for attempt in range(1, CLONE_MAX_RETRIES + 1):
+        _remove_dir(partial)
         try:
             subprocess.run(
-                ["git", "clone", "--quiet", repo_url, str(dest)],
+                clone_args,
                 check=True,
                 capture_output=True,
                 text=True,
                 timeout=120,
             )
+            _remove_dir(dest)
+            os.rename(partial, dest)
             return dest
         except subprocess.CalledProcessError as e:
             last_error = e
             log.warning("clone attempt %s/%s failed url=%s stderr=%s", attempt, CLONE_MAX_RETRIES, repo_url, (e.stderr or "")[:200])
             if attempt < CLONE_MAX_RETRIES:
-                if dest.exists():
-                    try:
-                        shutil.rmtree(dest)
-                    except Exception as rm_e:
-                        log.warning("could not remove partial clone %s: %s", dest, rm_e)
                 time.sleep(CLONE_RETRY_DELAY_SEC)
         except subprocess.TimeoutExpired:
             log.error("clone timed out url=%s (attempt %s/%s)", repo_url, attempt, CLONE_MAX_RETRIES)
+            _remove_dir(partial)
             return None
         except Exception as e:
             last_error = e
@@ -84,7 +104,115 @@ def clone_repo(repo_url: str, pull_if_exists: bool = True) -> Optional[Path]:
             if attempt < CLONE_MAX_RETRIES:
                 time.sleep(CLONE_RETRY_DELAY_SEC)
 
+    _remove_dir(partial)
     if last_error:
         stderr = getattr(last_error, "stderr", None) or str(last_error)
         log.error("clone failed after %s attempts url=%s last_error=%s", CLONE_MAX_RETRIES, repo_url, stderr[:300])
     return None
+
+
+def _update_shallow(dest: Path) -> None:
+    """
+    Move a clone to the remote HEAD fetching only that commit. A plain pull would merge with local history,
+    which a depth-1 clone does not have (and fails outright if the branch was force-pushed).
+    """
+    fetch = subprocess.run(
+        ["git", "fetch", "--quiet", "--depth=1", "origin", "HEAD"],
+        cwd=dest,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if fetch.returncode != 0:
+        log.warning("git fetch failed for %s: %s", dest, (fetch.stderr or "")[:200])
+        return
+    subprocess.run(["git", "reset", "--quiet", "--hard", "FETCH_HEAD"], cwd=dest, capture_output=True, text=True, timeout=60)
+
+
+def _remove_dir(path: Path) -> None:
+    """Remove a directory tree if present; log instead of raising."""
+    if not path.exists():
+        return
+    try:
+        shutil.rmtree(path)
+    except Exception as e:
+        log.warning("could not remove %s: %s", path, e)
+
+
+def _remote_head_sha(repo_url: str) -> Optional[str]:
+    """Return the remote HEAD commit via `git ls-remote` (no objects transferred), or None on error."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", repo_url, "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except Exception as e:
+        log.debug("git ls-remote failed url=%s: %s", repo_url, e)
+        return None
+    parts = result.stdout.split() if result.returncode == 0 else []
+    return parts[0] if parts else None
+
+
+def _local_head_sha(repo_path: Path) -> Optional[str]:
+    """Return the checked-out commit of a local clone, or None on error."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _dir_size(path: Path) -> int:
+    # Every file counts here (.git, venv, ...), so nothing is pruned; symlinks are not followed.
+    total = 0
+    for entry in iter_repo_files(path, skip_dirs=frozenset()):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
+
+def evict_clone_cache(max_bytes: Optional[int] = None) -> list[Path]:
+    """
+    Delete least recently used clones in temp_repos/ until the total size is under max_bytes.
+    max_bytes defaults to CLONE_CACHE_MAX_GB from env; no limit when unset. Return removed paths.
+    Call before a batch starts: clones in use by a running evaluation must not be evicted.
+    """
+    if max_bytes is None:
+        raw = os.environ.get("CLONE_CACHE_MAX_GB", "").strip()
+        if not raw:
+            return []
+        try:
+            max_bytes = int(float(raw) * 1024**3)
+        except ValueError:
+            log.warning("invalid CLONE_CACHE_MAX_GB=%r; skipping eviction", raw)
+            return []
+    base = get_temp_repos_dir()
+    if not base.is_dir():
+        return []
+    clones = []
+    for entry in base.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            clones.append((entry.stat().st_mtime, _dir_size(entry), entry))
+    total = sum(size for _, size, _ in clones)
+    removed = []
+    for _, size, path in sorted(clones, key=lambda c: c[0]):
+        if total <= max_bytes:
+            break
+        _remove_dir(path)
+        total -= size
+        removed.append(path)
+    if removed:
+        log.info("evicted %s cached clone(s) from %s", len(removed), base)
+    return removed
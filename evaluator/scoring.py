@@ -1,5 +1,6 @@
 """Load scoring config from YAML; compute weighted final score. No hardcoded weights."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -7,6 +8,9 @@ import yaml
 
 from .utils import get_config_path
 
+# libyaml-backed loader when PyYAML was built with it; same safe subset, much faster than the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 DEFAULT_WEIGHTS = {
     "pipeline_runs": 3,
     "gold_generated": 2,
@@ -26,7 +30,9 @@ DEFAULT_SUMMARY_MAX_CHARS = 1800
 SCORE_SCALE_0_5_TO_100 = 20  # 5 * 20 = 100
 
 # All metrics are 0-5 scale internally; booleans mapped to 0 or 5
-BOOL_METRICS = ("pipeline_runs", "gold_generated")
+BOOL_METRICS = frozenset(("pipeline_runs", "gold_generated"))
+# Raw values that count as "true" for a bool metric (True == 1, so True is included).
+_TRUE_VALUES = (1, "true", "True", "yes")
 
 # Column scores in the final output (0-100 each). Final score = average of these.
 FINAL_SCORE_AVERAGE_KEYS = (
@@ -45,8 +51,21 @@ FINAL_SCORE_AVERAGE_KEYS = (
 
 
 def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
-    """Load scoring.yaml; return weights and normalization. Use defaults if missing."""
-    path = config_path or get_config_path()
+    """
+    Load scoring.yaml; return weights and normalization. Use defaults if missing.
+    Parsed once per path, modification time and size, so edits to the file are picked up on the next call.
+    """
+    path = Path(config_path or get_config_path()).resolve()
+    try:
+        st = path.stat()
+        version: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        version = None
+    cached = _load_config_cached(path, version)
+    return {"weights": dict(cached["weights"]), "normalization": dict(cached["normalization"])}
+
+
+def _load_config_uncached(path: Path, version: Optional[tuple[int, int]] = None) -> dict[str, Any]:
     if not path.exists():
         return {
             "weights": dict(DEFAULT_WEIGHTS),
@@ -54,7 +73,7 @@ def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
         }
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
         weights = data.get("weights") or {}
         norm = data.get("normalization") or {}
         return {
@@ -71,17 +90,20 @@ def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
         }
 
 
+# Keyed by resolved path (not a single slot) so SCORING_CONFIG_PATH changes are still honoured,
+# and by (mtime_ns, size) so an edited file is reparsed even on filesystems with coarse mtimes;
+# version itself is only part of the key.
+_load_config_cached = lru_cache(maxsize=8)(_load_config_uncached)
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
 def metric_value(raw: Any, key: str) -> float:
     """
     Convert raw value to 0-5 scale for weighted average.
     Booleans -> 0 or 5. Dimension scores may be 0-100 (stored directly); >5 treated as 0-100 and scaled to 0-5.
     """
     if key in BOOL_METRICS:
-        if isinstance(raw, bool):
-            return 5.0 if raw else 0.0
-        if raw in (1, "true", "True", "yes"):
-            return 5.0
-        return 0.0
+        return 5.0 if raw in _TRUE_VALUES else 0.0
     if isinstance(raw, (int, float)):
         v = float(raw)
         if v > 5:
@@ -99,6 +121,8 @@ def compute_final_score(
     final_score = sum(metric * weight) / sum(weights), then normalize to max_score.
     Metrics are 0-5 internally; result is in [0, max_score] (default 0-100).
     """
+    if not any(metrics.get(key) for key in weights):  # every weighted metric maps to 0 (e.g. failed evaluations)
+        return 0.0
     weighted_sum = 0.0
     total_weight = 0.0
     for key, w in weights.items():
@@ -119,6 +143,8 @@ def compute_final_score_as_average(metrics: dict[str, Any], max_score: float = 1
     Final score as the arithmetic mean of the output score columns (0-100 each).
     So the final score equals the average of the column scores shown in the report.
     """
+    if not any(metrics.get(key) for key in FINAL_SCORE_AVERAGE_KEYS):  # every column scores 0 (e.g. failed rows)
+        return 0.0
     total = 0.0
     count = 0
     for key in FINAL_SCORE_AVERAGE_KEYS:
@@ -126,7 +152,7 @@ def compute_final_score_as_average(metrics: dict[str, Any], max_score: float = 1
             continue
         raw = metrics[key]
         if key in BOOL_METRICS:
-            v = max_score if raw in (True, 1, "true", "True", "yes") else 0.0
+            v = max_score if raw in _TRUE_VALUES else 0.0
         else:
             v = float(raw) if isinstance(raw, (int, float)) else 0.0
             v = max(0.0, min(max_score, v))
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from .logger import get_logger
+from .utils import iter_repo_files
+
+try:  # optional: SIMD multi-pattern scanner; the combined regexes below are the fallback
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 log = get_logger(__name__)
 
@@ -30,6 +40,9 @@ HARDCODED_PATTERNS = [
     re.compile(r'\bsk-[a-zA-Z0-9]{20,}\b'),  # OpenAI-style key
 ]
 
+# key: value entries in config files that look like a secret
+CONFIG_SECRET_VALUE_PATTERN = re.compile(r'(?:password|secret|api_key|token|key):\s*["\']?[a-zA-Z0-9_\-]{8,}', re.IGNORECASE)
+
 # Patterns that suggest environment variable usage (good)
 ENV_VAR_PATTERNS = [
     re.compile(r'\bos\.getenv\s*\(', re.IGNORECASE),
@@ -37,37 +50,127 @@ ENV_VAR_PATTERNS = [
     re.compile(r'\bos\.environ\.get\s*\(', re.IGNORECASE),
 ]
 
+# Files scanned for credentials / env usage; directories never scanned (dot-directories are pruned too)
+SCANNED_SUFFIXES = (".py", ".yml", ".yaml", ".json")
+SCAN_SKIP_DIRS = frozenset({"__pycache__", "venv", ".venv", "node_modules", "env"})
+# Generated lockfiles (never hand-written credentials, often megabytes) and files too large to be hand-written
+SCAN_SKIP_NAMES = frozenset({"package-lock.json", "npm-shrinkwrap.json", "pnpm-lock.yaml"})
+SCAN_MAX_FILE_BYTES = 512_000
+# File reads overlap across threads; below this many files the pool costs more than it saves.
+SCAN_WORKERS = min(8, os.cpu_count() or 4)
+PARALLEL_SCAN_MIN_FILES = 8
+# Root files read directly (not through the scan walk): gitignore, .env presence, config files.
+CONFIG_FILE_NAMES = ("config.yaml", "config.yml", "config.json", "configuration.yaml", "configuration.json")
+_ROOT_FILES_READ = (".gitignore", ".env") + CONFIG_FILE_NAMES
+
+# Snapshot digest (path, mtime_ns, size of every file the score depends on) -> score.
+_SCORE_CACHE: dict[str, int] = {}
+
+
+def _union(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    """One alternation equivalent to searching each pattern: one pass over the text instead of one per pattern."""
+    parts = [f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})" for p in patterns]
+    # MULTILINE only changes ^/$, which just the line-anchored patterns use (and they are compiled with it).
+    return re.compile("|".join(parts), re.MULTILINE)
+
+
+def _union_bytes(patterns: list[re.Pattern[str]]) -> re.Pattern[bytes]:
+    """_union for raw file bytes (the patterns are ASCII), so scanned files need no decoding."""
+    return re.compile(_union(patterns).pattern.encode("ascii"), re.MULTILINE)
+
+
+_HARDCODED_RE = _union(HARDCODED_PATTERNS)
+_ENV_VAR_RE = _union(ENV_VAR_PATTERNS)
+_HARDCODED_BYTES_RE = _union_bytes(HARDCODED_PATTERNS)
+_ENV_VAR_BYTES_RE = _union_bytes(ENV_VAR_PATTERNS)
+
+
+def _hyperscan_db():
+    """Hyperscan database of HARDCODED_PATTERNS then ENV_VAR_PATTERNS (ids in that order); None if unavailable."""
+    if hyperscan is None:
+        return None
+    patterns = HARDCODED_PATTERNS + ENV_VAR_PATTERNS
+    flags = [
+        hyperscan.HS_FLAG_SINGLEMATCH
+        | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+        | (hyperscan.HS_FLAG_MULTILINE if p.flags & re.MULTILINE else 0)
+        for p in patterns
+    ]
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+        return db
+    except Exception as e:
+        log.debug("hyperscan unavailable, using regex scan: %s", e)
+        return None
+
+
+_HS_DB = _hyperscan_db()
+
+
+def _scan(content: bytes) -> tuple[bool, bool]:
+    """(hardcoded credentials found, env vars used) in one pass over a file's raw bytes."""
+    if _HS_DB is None:
+        return _HARDCODED_BYTES_RE.search(content) is not None, _ENV_VAR_BYTES_RE.search(content) is not None
+    found = [False, False]
+    n_hardcoded = len(HARDCODED_PATTERNS)
+
+    def on_match(pattern_id, start, end, flags, context):
+        found[pattern_id >= n_hardcoded] = True
+        return all(found)  # truthy stops the scan
+
+    try:
+        _HS_DB.scan(content, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return found[0], found[1]
+
+
 # .gitignore entries that improve security (presence = good)
 GITIGNORE_SECURITY_ENTRIES = [".env", "secrets.json", "credentials.json", "*.key", "*.pem", ".env.local", ".env.*.local"]
 
 
 def _has_hardcoded_credentials(content: str) -> bool:
     """True if content matches any hardcoded credential pattern."""
-    for pat in HARDCODED_PATTERNS:
-        if pat.search(content):
-            return True
-    return False
+    return _HARDCODED_RE.search(content) is not None
 
 
 def _uses_env_vars(content: str) -> bool:
     """True if content uses os.getenv or os.environ."""
-    for pat in ENV_VAR_PATTERNS:
-        if pat.search(content):
-            return True
-    return False
+    return _ENV_VAR_RE.search(content) is not None
 
 
 def _read_file_safe(path: Path, max_size: int = 100_000) -> str:
+    """First max_size characters of a regular file ("" on error); only that prefix is read from disk."""
     try:
         if not path.is_file():
             return ""
-        text = path.read_text(encoding="utf-8", errors="replace")
-        return text[:max_size] if len(text) > max_size else text
+        # 4 bytes per char is the UTF-8 worst case, so this is always enough for max_size chars.
+        with open(path, "rb") as f:
+            data = f.read(max_size * 4)
+        # Newlines normalized as text-mode reading would, so ^-anchored patterns see the same lines.
+        return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")[:max_size]
     except Exception as e:
         log.debug("Could not read %s: %s", path, e)
         return ""
 
 
+def _read_file_bytes_safe(path: Path, max_size: int = 100_000) -> bytes:
+    """First max_size bytes of a file (b"" on error), newlines normalized like _read_file_safe; not decoded."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read(max_size)
+        return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    except Exception as e:
+        log.debug("Could not read %s: %s", path, e)
+        return b""
+
+
 def _gitignore_lines(repo_path: Path) -> list[str]:
     """Return normalized .gitignore lines (stripped, no comments)."""
     p = repo_path / ".gitignore"
@@ -82,21 +185,18 @@ def _gitignore_lines(repo_path: Path) -> list[str]:
     return lines
 
 
-def _env_ignored_properly(repo_path: Path) -> bool:
-    """True if .env does not exist, or .env exists and is in .gitignore."""
+def _env_ignored_properly(repo_path: Path, gitignore_lines: Optional[list[str]] = None) -> bool:
+    """True if .env does not exist, or .env exists and is in .gitignore (lines passed in if already read)."""
     env_file = repo_path / ".env"
     if not env_file.exists():
         return True
-    lines = _gitignore_lines(repo_path)
-    for line in lines:
-        if line.strip() == ".env" or line.strip().startswith(".env"):
-            return True
-    return False
+    lines = _gitignore_lines(repo_path) if gitignore_lines is None else gitignore_lines
+    return any(line.startswith(".env") for line in lines)
 
 
 def _config_has_secrets(repo_path: Path) -> bool:
     """True if config.yaml or config.json contain credential-like content."""
-    for name in ["config.yaml", "config.yml", "config.json", "configuration.yaml", "configuration.json"]:
+    for name in CONFIG_FILE_NAMES:
         p = repo_path / name
         if not p.is_file():
             continue
@@ -104,22 +204,7 @@ def _config_has_secrets(repo_path: Path) -> bool:
         if _has_hardcoded_credentials(content):
             return True
         # Also check for key: value that looks like a secret
-        if re.search(r'(?:password|secret|api_key|token|key):\s*["\']?[a-zA-Z0-9_\-]{8,}', content, re.IGNORECASE):
-            return True
-    return False
-
-
-def _skip_path(repo_path: Path, f: Path) -> bool:
-    """True if path should be skipped (venv, cache, hidden dirs)."""
-    try:
-        rel = f.relative_to(repo_path)
-    except ValueError:
-        return True
-    parts = str(rel).replace("\\", "/").split("/")
-    for seg in parts:
-        if seg.startswith(".") and seg != ".env":
-            return True
-        if seg in ("__pycache__", "venv", ".venv", "node_modules", "env"):
+        if CONFIG_SECRET_VALUE_PATTERN.search(content):
             return True
     return False
 
@@ -134,37 +219,73 @@ def compute_security_score(repo_path: Path) -> int:
     - Safe config files (10)
     """
     repo_path = Path(repo_path)
+    # One walk for all scanned types, pruning skipped directories instead of filtering every file under them.
+    # Only stat() here; the files are read only if this snapshot has not been scored before.
+    scanned: list[str] = []
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(repo_path.resolve()).encode())
+    for entry in iter_repo_files(repo_path, suffixes=SCANNED_SUFFIXES, skip_dirs=SCAN_SKIP_DIRS, skip_hidden=True):
+        if entry.name.startswith(".") or entry.name in SCAN_SKIP_NAMES:
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        if st.st_size > SCAN_MAX_FILE_BYTES:
+            continue
+        scanned.append(entry.path)
+        digest.update(f"\0{entry.path}\0{st.st_mtime_ns}\0{st.st_size}".encode())
+    for name in _ROOT_FILES_READ:
+        try:
+            st = os.stat(repo_path / name)
+            digest.update(f"\0/{name}\0{st.st_mtime_ns}\0{st.st_size}".encode())
+        except OSError:
+            digest.update(f"\0/{name}\0-".encode())
+    key = digest.hexdigest()
+    if key not in _SCORE_CACHE:
+        _SCORE_CACHE[key] = _score_snapshot(repo_path, scanned)
+    return _SCORE_CACHE[key]
+
+
+def _scan_file(path: str) -> tuple[bool, bool]:
+    """_scan over one file's leading bytes; (False, False) for binary files."""
+    content = _read_file_bytes_safe(path)
+    if b"\0" in content[:512]:  # binary despite the extension
+        return False, False
+    return _scan(content)
+
+
+def _score_snapshot(repo_path: Path, scanned: list[str]) -> int:
+    """compute_security_score for the given candidate files (already filtered by name and size)."""
     hardcoded_found = False
     env_used = False
-    for ext in ["*.py", "*.yml", "*.yaml", "*.json"]:
-        for f in repo_path.rglob(ext):
-            if _skip_path(repo_path, f):
-                continue
-            content = _read_file_safe(f)
-            if _has_hardcoded_credentials(content):
-                hardcoded_found = True
-            if _uses_env_vars(content):
-                env_used = True
-        if hardcoded_found:
-            break
+    pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS) if len(scanned) >= PARALLEL_SCAN_MIN_FILES else None
+    try:
+        for hardcoded, env in (pool.map(_scan_file, scanned) if pool else map(_scan_file, scanned)):
+            hardcoded_found = hardcoded_found or hardcoded
+            env_used = env_used or env
+            if hardcoded_found and env_used:
+                break
+    finally:
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     score = 0
     if not hardcoded_found:
         score += POINTS_NO_HARDCODED
     if env_used:
         score += POINTS_ENV_VARS
-    if _env_ignored_properly(repo_path):
-        score += POINTS_ENV_IGNORED
-    security_entries_found = 0
     lines = _gitignore_lines(repo_path)
-    for entry in GITIGNORE_SECURITY_ENTRIES:
-        for line in lines:
-            if line == entry or (entry.startswith("*") and (line == entry or line.endswith(entry[1:]))):
-                security_entries_found += 1
-                break
-            if entry in line:
-                security_entries_found += 1
-                break
+    if _env_ignored_properly(repo_path, lines):
+        score += POINTS_ENV_IGNORED
+    # An entry counts if some line contains it (or, for "*.ext", ends with ".ext"). Entries have no newline,
+    # so substring tests on the newline-joined text answer that for all lines at once.
+    gitignore_text = "\n".join(lines) + "\n"
+    security_entries_found = sum(
+        1
+        for entry in GITIGNORE_SECURITY_ENTRIES
+        if entry in gitignore_text or (entry.startswith("*") and entry[1:] + "\n" in gitignore_text)
+    )
     score += min(POINTS_GITIGNORE_SECURITY, security_entries_found * 5)
     if not _config_has_secrets(repo_path):
         score += POINTS_SAFE_CONFIG
@@ -1,16 +1,17 @@
 """Excel input/output. Read spreadsheet with repo_url; write results preserving columns."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
 
 from .logger import get_logger
 
 REPO_URL_COL = "repo_url"
 REQUIRED_COLUMNS = [REPO_URL_COL]
 
-RESULT_COLUMNS = [
+RESULT_COLUMNS = (
     "pipeline_runs",
     "gold_generated",
     "medallion_architecture",
@@ -25,45 +26,158 @@ RESULT_COLUMNS = [
     "final_score",
     "summary",
     "evaluation_report",
-]
+)
 
 log = get_logger(__name__)
 
 
-def load_input(file_path: Path) -> pd.DataFrame:
-    """Load Excel file; require repo_url column. Raise if missing or empty."""
+def _header_names(raw: tuple) -> List[str]:
+    """Column names as pandas would give them: blank -> 'Unnamed: i', duplicates -> 'name.1', 'name.2'."""
+    names: List[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(raw):
+        name = f"Unnamed: {i}" if value is None or str(value).strip() == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_input_rows(file_path: Path) -> tuple[List[str], Iterator[dict]]:
+    """
+    Open the first sheet and validate the header (python-calamine when installed, else openpyxl read-only).
+    Return (columns, row iterator); rows are dicts keyed by column, streamed from the file
+    (fully blank rows skipped). Raise like load_input if the file or repo_url column is missing.
+    """
     if not file_path.exists():
         raise FileNotFoundError(f"Input file not found: {file_path}")
-    df = pd.read_excel(file_path, engine="openpyxl")
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        values, close = _open_sheet_openpyxl(file_path)
+    else:
+        values, close = _open_sheet_calamine(CalamineWorkbook, file_path)
+    header = next(values, None)
+    columns = _header_names(header) if header else []
     for col in REQUIRED_COLUMNS:
-        if col not in df.columns:
+        if col not in columns:
+            close()
             raise ValueError(f"Missing required column: {col}")
-    return df
+
+    def rows() -> Iterator[dict]:
+        try:
+            width = len(columns)
+            for raw in values:
+                if all(v is None for v in raw):
+                    continue
+                padded = tuple(raw[:width]) + (None,) * (width - len(raw))
+                yield dict(zip(columns, padded))
+        finally:
+            close()
+
+    return columns, rows()
+
+
+def _open_sheet_openpyxl(file_path: Path) -> tuple[Iterator[tuple], Callable[[], None]]:
+    """First sheet's rows as value tuples (empty cells None), streamed in read-only mode, and a close callback."""
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    return wb.worksheets[0].iter_rows(values_only=True), wb.close
+
+
+def _open_sheet_calamine(CalamineWorkbook, file_path: Path) -> tuple[Iterator[tuple], Callable[[], None]]:
+    """Same as _open_sheet_openpyxl via python-calamine (Rust parser); calamine's "" for empty cells becomes None."""
+    wb = CalamineWorkbook.from_path(str(file_path))
+    sheet = wb.get_sheet_by_index(0).to_python(skip_empty_area=False)
+    values = (tuple(None if v == "" else v for v in raw) for raw in sheet)
+    return values, getattr(wb, "close", lambda: None)
 
 
-def get_repo_rows(df: pd.DataFrame) -> List[dict]:
-    """Yield rows as dicts; only rows with non-empty repo_url."""
+def load_input(file_path: Path) -> pd.DataFrame:
+    """Load Excel file; require repo_url column. Raise if missing or empty."""
+    columns, rows = iter_input_rows(file_path)
+    return pd.DataFrame.from_records(list(rows), columns=columns)
+
+
+def get_repo_rows(source: Union[pd.DataFrame, Iterable[dict]]) -> List[dict]:
+    """Return rows as dicts (from a DataFrame or a row iterator); only rows with non-empty repo_url."""
+    if isinstance(source, pd.DataFrame):
+        # Filter with a column mask before building dicts, so skipped rows are never materialized.
+        if REPO_URL_COL not in source.columns:
+            return []
+        urls = source[REPO_URL_COL]
+        return source.loc[urls.notna() & urls.astype(str).str.strip().ne("")].to_dict("records")
     out = []
-    for _, row in df.iterrows():
+    for row in source:
         url = row.get(REPO_URL_COL)
-        if pd.isna(url) or not str(url).strip():
+        if url is None or pd.isna(url) or not str(url).strip():
             continue
-        out.append(row.to_dict())
+        out.append(row)
     return out
 
 
 def build_result_row(original_row: dict, result: dict) -> dict:
     """Merge original row with result columns; result keys override."""
     row = dict(original_row)
-    for col in RESULT_COLUMNS:
-        row[col] = result.get(col, None)
+    row.update(zip(RESULT_COLUMNS, map(result.get, RESULT_COLUMNS)))
     return row
 
 
-def write_results(rows: List[dict], output_path: Path) -> None:
-    """Write list of row dicts to Excel. Creates parent dirs if needed."""
+def _cell_value(value):
+    """Excel-safe cell value: NaN/NaT become empty cells (as DataFrame.to_excel does)."""
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def write_results(rows: Iterable[dict], output_path: Path) -> None:
+    """
+    Write row dicts to Excel. Creates parent dirs if needed.
+    Rows are streamed to the file as they are produced (rows may be a generator); the header is taken
+    from the first row. Uses the native opensheet-core writer when installed, otherwise openpyxl write-only.
+    """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df = pd.DataFrame(rows)
-    df.to_excel(output_path, index=False, engine="openpyxl")
-    log.info("Wrote results to %s", output_path)
+    try:
+        import opensheet_core
+    except ImportError:
+        count = _write_rows_openpyxl(rows, output_path)
+    else:
+        count = _write_rows_opensheet(opensheet_core, rows, output_path)
+    log.info("Wrote %s result rows to %s", count, output_path)
+
+
+def _write_rows_opensheet(opensheet_core, rows: Iterable[dict], output_path: Path) -> int:
+    """Stream rows with opensheet-core (Rust XLSX writer, no per-cell Python objects)."""
+    header: Optional[List[str]] = None
+    count = 0
+    with opensheet_core.XlsxWriter(str(output_path)) as writer:
+        writer.add_sheet("Sheet1")
+        for row in rows:
+            if header is None:
+                header = list(row)
+                writer.write_row(header)
+            writer.write_row([_cell_value(row.get(col)) for col in header])
+            count += 1
+    return count
+
+
+def _write_rows_openpyxl(rows: Iterable[dict], output_path: Path) -> int:
+    """Stream rows into an openpyxl write-only workbook; saved once at the end."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    header: Optional[List[str]] = None
+    count = 0
+    for row in rows:
+        if header is None:
+            header = list(row)
+            ws.append(header)
+        ws.append([_cell_value(row.get(col)) for col in header])
+        count += 1
+    wb.save(output_path)
+    return count
@@ -2,6 +2,12 @@
 
 import os
 from pathlib import Path
+from typing import Iterator, Optional
+
+# Directories never worth descending into when scanning a candidate repo.
+SKIP_DIRS = frozenset(
+    {"venv", ".venv", "__pycache__", "node_modules", ".git", ".tox", ".mypy_cache", ".pytest_cache"}
+)
 
 
 def get_project_root() -> Path:
@@ -40,3 +46,32 @@ def ensure_dirs() -> None:
     """Create temp_repos and output directories if they do not exist."""
     get_temp_repos_dir().mkdir(parents=True, exist_ok=True)
     get_output_dir().mkdir(parents=True, exist_ok=True)
+
+
+def iter_repo_files(
+    root: str | Path,
+    suffixes: Optional[tuple[str, ...]] = None,
+    skip_dirs: frozenset[str] = SKIP_DIRS,
+    skip_hidden: bool = False,
+) -> Iterator[os.DirEntry]:
+    """
+    Yield files under root as os.DirEntry (optionally only names ending in suffixes).
+    Directories in skip_dirs (and dot-directories when skip_hidden) are pruned before
+    descending; symlinks are not followed.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs and not (skip_hidden and entry.name.startswith(".")):
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and (suffixes is None or entry.name.endswith(suffixes)):
+                    yield entry
+            except OSError:
+                continue
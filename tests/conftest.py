@@ -9,18 +9,30 @@ import pytest
 from evaluator.spreadsheet import REPO_URL_COL, RESULT_COLUMNS
 
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: end-to-end tests that read and write real spreadsheets")
+
+
 @pytest.fixture
 def temp_dir(tmp_path):
     """A temporary directory for test files."""
     return tmp_path
 
 
-@pytest.fixture
-def sample_excel_path(tmp_path):
-    """Path to a minimal valid Excel file with repo_url column."""
-    path = tmp_path / "repos.xlsx"
+@pytest.fixture(scope="session")
+def sample_excel_bytes(tmp_path_factory):
+    """Bytes of a minimal valid Excel file with repo_url column (written with openpyxl once per session)."""
+    path = tmp_path_factory.mktemp("samples") / "repos.xlsx"
     df = pd.DataFrame([{REPO_URL_COL: "https://github.com/user/repo1"}, {REPO_URL_COL: "https://github.com/org/repo2"}])
     df.to_excel(path, index=False, engine="openpyxl")
+    return path.read_bytes()
+
+
+@pytest.fixture
+def sample_excel_path(tmp_path, sample_excel_bytes):
+    """Path to a fresh copy of the sample Excel file in this test's tmp_path."""
+    path = tmp_path / "repos.xlsx"
+    path.write_bytes(sample_excel_bytes)
     return path
 
 
@@ -58,3 +70,7 @@ def isolate_env(tmp_path, monkeypatch):
         encoding="utf-8",
     )
     monkeypatch.setenv("SCORING_CONFIG_PATH", str(config_dir / "scoring.yaml"))
+    # The evaluator's RAW_INPUT_FILENAME takes precedence over repo files; tests set it explicitly when needed.
+    monkeypatch.delenv("RAW_INPUT_FILENAME", raising=False)
+    # Tests patch OpenAI; never hand them a client built by an earlier test.
+    monkeypatch.setattr("evaluator.llm_evaluator._CLIENTS", {})
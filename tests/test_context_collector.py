@@ -50,3 +50,59 @@ def test_collect_context_finds_main_pipeline(tmp_path):
     (tmp_path / "main.py").write_text("print('hi')", encoding="utf-8")
     ctx = collect_context(tmp_path, {})
     assert "print" in ctx["main_pipeline"]
+
+
+def test_collect_context_naming_audit_skips_excluded_dirs(tmp_path):
+    """Naming audit lists repo .py files but not files under venv, node_modules or __pycache__."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "transform.py").write_text("", encoding="utf-8")
+    (tmp_path / "main.py").write_text("", encoding="utf-8")
+    for excluded in [".venv/lib", "venv/lib", "node_modules/x", "src/__pycache__"]:
+        (tmp_path / excluded).mkdir(parents=True)
+        (tmp_path / excluded / "skipped.py").write_text("", encoding="utf-8")
+    audit = collect_context(tmp_path, {})["naming_audit"]
+    assert "src/pkg/transform.py" in audit
+    assert "  main.py" in audit
+    assert "skipped.py" not in audit
+
+
+def test_collect_context_tree_is_bounded(tmp_path, monkeypatch):
+    """Walk stops at MAX_FS_ENTRIES and does not descend into heavy build/dependency dirs."""
+    monkeypatch.setattr("evaluator.context_collector.MAX_FS_ENTRIES", 20)
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.py").write_text("", encoding="utf-8")
+    for i in range(50):
+        (tmp_path / f"file_{i:02d}.py").write_text("", encoding="utf-8")
+    ctx = collect_context(tmp_path, {})
+    assert "node_modules" in ctx["project_tree"]
+    assert "index.py" not in ctx["project_tree"]
+    assert "index.py" not in ctx["naming_audit"]
+    assert "truncated after 20 entries" in ctx["project_tree"]
+    assert "file_49.py" not in ctx["naming_audit"]
+
+
+def test_collect_context_truncates_long_readme(tmp_path):
+    """Files longer than MAX_CHARS_PER_FILE are cut and marked; multi-byte text is counted in chars."""
+    (tmp_path / "README.md").write_text("é" * 5000, encoding="utf-8")
+    (tmp_path / "main.py").write_text("é" * 4000, encoding="utf-8")
+    ctx = collect_context(tmp_path, {})
+    assert ctx["readme"] == "é" * 4000 + "\n... [truncated]"
+    assert ctx["main_pipeline"] == "é" * 4000
+
+
+def test_collect_context_finds_nested_sla_and_src_main(tmp_path):
+    """sla_calculation and main pipeline are found under src/ from the walk's file listing."""
+    (tmp_path / "src" / "sla").mkdir(parents=True)
+    (tmp_path / "src" / "sla" / "sla_calculation.py").write_text("def sla(): ...", encoding="utf-8")
+    (tmp_path / "src" / "main.py").write_text("run()", encoding="utf-8")
+    ctx = collect_context(tmp_path, {})
+    assert ctx["sla_calculation"] == "def sla(): ..."
+    assert ctx["main_pipeline"] == "run()"
+
+
+def test_collect_context_prerenders_string(tmp_path):
+    """collect_context caches the rendered prompt text; context_to_string returns it."""
+    (tmp_path / "README.md").write_text("Cached readme.", encoding="utf-8")
+    ctx = collect_context(tmp_path, {"pipeline_runs": True})
+    assert "Cached readme." in ctx["_rendered"]
+    assert context_to_string(ctx) is ctx["_rendered"]
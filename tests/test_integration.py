@@ -1,5 +1,7 @@
 """Integration test: full evaluate flow with mocked clone, pipeline, and LLM."""
 
+import importlib.util
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,8 +9,14 @@ import pandas as pd
 import pytest
 
 from evaluator.cli import evaluate
+from evaluator.repo_cloner import repo_name_from_url
 from evaluator.spreadsheet import REPO_URL_COL, RESULT_COLUMNS
 
+pytestmark = pytest.mark.slow
+
+# Output workbooks are only read back here; python-calamine (Rust) parses them much faster than openpyxl.
+_READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
 
 @pytest.fixture
 def minimal_repo(tmp_path):
@@ -30,7 +38,7 @@ def test_evaluate_integration_mocked(
     output_name = "test_results.xlsx"
     out_path = tmp_path / "output" / output_name
 
-    def fake_clone(url):
+    def fake_clone(url, **kwargs):
         return minimal_repo
 
     def fake_run_pipeline(repo_path, run_command_override=None):
@@ -43,15 +51,14 @@ def test_evaluate_integration_mocked(
             "return_code": 0,
         }
 
-    with (
-        patch("evaluator.cli.clone_repo", side_effect=fake_clone),
-        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
-        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),  # use deterministic compact report
-    ):
-        evaluate(file=sample_excel_path, output_name=output_name)
+    monkeypatch.setattr("evaluator.cli.clone_repo", fake_clone)
+    monkeypatch.setattr("evaluator.cli.run_pipeline", fake_run_pipeline)
+    # No LLM summary -> deterministic compact report
+    monkeypatch.setattr("evaluator.cli.generate_evaluation_summary_llm", lambda *args, **kwargs: None)
+    evaluate(file=sample_excel_path, output_name=output_name)
 
     assert out_path.exists()
-    df = pd.read_excel(out_path, engine="openpyxl")
+    df = pd.read_excel(out_path, engine=_READ_ENGINE)
     for col in RESULT_COLUMNS:
         assert col in df.columns, f"Missing column: {col}"
     assert REPO_URL_COL in df.columns
@@ -66,3 +73,231 @@ def test_evaluate_integration_mocked(
     assert (df["evaluation_report"].str.len() > 0).all()
     assert (df["evaluation_report"].str.len() <= 1800).all(), "evaluation_report must be <= 1800 chars (config default)"
     assert "checks passed" in df["evaluation_report"].iloc[0].lower() or "final score" in df["evaluation_report"].iloc[0].lower()
+
+
+def test_evaluate_parallel_keeps_order_and_isolates_errors(sample_excel_path, minimal_repo, tmp_path):
+    """With --jobs > 1, rows keep input order and an unexpected error only affects its own row."""
+    output_name = "parallel_results.xlsx"
+
+    def fake_clone(url, **kwargs):
+        if url.endswith("repo1"):
+            raise RuntimeError("boom")
+        return minimal_repo
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    with (
+        patch("evaluator.cli.clone_repo", side_effect=fake_clone),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),
+    ):
+        evaluate(file=sample_excel_path, output_name=output_name, jobs=2)
+
+    df = pd.read_excel(tmp_path / "output" / output_name, engine=_READ_ENGINE)
+    assert list(df[REPO_URL_COL]) == ["https://github.com/user/repo1", "https://github.com/org/repo2"]
+    assert df["summary"].iloc[0].startswith("Evaluation failed")
+    assert df["final_score"].iloc[0] == 0
+    assert bool(df["pipeline_runs"].iloc[1]) is True
+
+
+def test_evaluate_sequential_prefetches_next_clone(sample_excel_path, minimal_repo):
+    """In sequential mode the next repo is cloned while the current repo's pipeline runs."""
+    second_clone_started = threading.Event()
+    overlapped = []
+
+    def fake_clone(url, **kwargs):
+        if url.endswith("repo2"):
+            second_clone_started.set()
+        return minimal_repo
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        if not overlapped:
+            overlapped.append(second_clone_started.wait(timeout=5))
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    with (
+        patch("evaluator.cli.clone_repo", side_effect=fake_clone),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),
+    ):
+        evaluate(file=sample_excel_path, output_name="prefetch_results.xlsx")
+
+    assert overlapped == [True]
+
+
+def test_evaluate_llm_report_overlaps_next_repo(sample_excel_path, minimal_repo, tmp_path):
+    """The first repo's LLM report call runs while the second repo's pipeline runs."""
+    pipeline_calls = []
+    second_pipeline_started = threading.Event()
+    overlapped = []
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        pipeline_calls.append(repo_path)
+        if len(pipeline_calls) == 2:
+            second_pipeline_started.set()
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    def fake_llm_summary(*args, **kwargs):
+        if not overlapped:
+            overlapped.append(second_pipeline_started.wait(timeout=5))
+        return "LLM report"
+
+    with (
+        patch("evaluator.cli.clone_repo", return_value=minimal_repo),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm", side_effect=fake_llm_summary),
+    ):
+        evaluate(file=sample_excel_path, output_name="overlap_results.xlsx")
+
+    assert overlapped == [True]
+    df = pd.read_excel(tmp_path / "output" / "overlap_results.xlsx", engine=_READ_ENGINE)
+    assert (df["evaluation_report"] == "LLM report").all()
+
+
+def test_evaluate_batches_llm_reports(sample_excel_path, minimal_repo, tmp_path, monkeypatch):
+    """With LLM_SUMMARY_BATCH_SIZE=2 both repos share one LLM request; missing entries fall back."""
+    monkeypatch.setenv("LLM_SUMMARY_BATCH_SIZE", "2")
+    batches = []
+
+    def fake_batch(items, max_chars):
+        batches.append(len(items))
+        return ["Batched report", None]
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    with (
+        patch("evaluator.cli.clone_repo", return_value=minimal_repo),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm_batch", side_effect=fake_batch),
+    ):
+        evaluate(file=sample_excel_path, output_name="batched_results.xlsx")
+
+    assert batches == [2]
+    df = pd.read_excel(tmp_path / "output" / "batched_results.xlsx", engine=_READ_ENGINE)
+    assert df["evaluation_report"].iloc[0] == "Batched report"
+    assert df["evaluation_report"].iloc[1] != "Batched report"
+    assert len(df["evaluation_report"].iloc[1]) > 0
+
+
+def test_evaluate_duplicate_urls_evaluated_once(minimal_repo, tmp_path):
+    """Rows repeating a repo URL reuse one evaluation but keep their own columns."""
+    path = tmp_path / "dupes.xlsx"
+    pd.DataFrame(
+        [
+            {REPO_URL_COL: "https://github.com/user/repo1", "candidate": "A"},
+            {REPO_URL_COL: "https://github.com/org/repo2", "candidate": "B"},
+            {REPO_URL_COL: "https://github.com/user/repo1.git", "candidate": "C"},
+        ]
+    ).to_excel(path, index=False, engine="openpyxl")
+    cloned = []
+
+    def fake_clone(url, **kwargs):
+        cloned.append(url)
+        return minimal_repo
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    with (
+        patch("evaluator.cli.clone_repo", side_effect=fake_clone),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),
+    ):
+        evaluate(file=path, output_name="dupes_results.xlsx")
+
+    assert cloned == ["https://github.com/user/repo1", "https://github.com/org/repo2"]
+    df = pd.read_excel(tmp_path / "output" / "dupes_results.xlsx", engine=_READ_ENGINE)
+    assert list(df["candidate"]) == ["A", "B", "C"]
+    assert df[REPO_URL_COL].iloc[2] == "https://github.com/user/repo1.git"
+    assert df["final_score"].iloc[2] == df["final_score"].iloc[0]
+
+
+def test_evaluate_static_stage_in_process_pool(sample_excel_path, minimal_repo, tmp_path, monkeypatch):
+    """STATIC_ANALYSIS_WORKERS runs checks/scoring in worker processes with the same results."""
+    monkeypatch.setenv("STATIC_ANALYSIS_WORKERS", "2")
+
+    def fake_run_pipeline(repo_path, run_command_override=None):
+        return {"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": "", "return_code": 0}
+
+    with (
+        patch("evaluator.cli.clone_repo", return_value=minimal_repo),
+        patch("evaluator.cli.run_pipeline", side_effect=fake_run_pipeline),
+        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),
+    ):
+        evaluate(file=sample_excel_path, output_name="process_results.xlsx")
+
+    df = pd.read_excel(tmp_path / "output" / "process_results.xlsx", engine=_READ_ENGINE)
+    assert len(df) == 2
+    assert (df["pipeline_organization"] > 0).all()
+    assert (df["cloud_ingestion"] == 0).all()
+
+
+def test_evaluate_sequential_clones_ahead_in_parallel(tmp_path, minimal_repo, monkeypatch):
+    """Upcoming repos clone concurrently, but two repos sharing a clone dir never clone at the same time."""
+    import time
+
+    monkeypatch.setenv("CLONE_WORKERS", "3")
+    path = tmp_path / "many.xlsx"
+    # The first two share the clone dir a_repo (different hosts, same owner/name).
+    urls = [
+        "https://github.com/a/repo",
+        "https://gitlab.com/a/repo",
+        "https://github.com/c/other",
+        "https://github.com/d/third",
+    ]
+    pd.DataFrame([{REPO_URL_COL: u} for u in urls]).to_excel(path, index=False, engine="openpyxl")
+    lock = threading.Lock()
+    active: list[str] = []
+    peak = []
+
+    def fake_clone(url, **kwargs):
+        name = repo_name_from_url(url)
+        with lock:
+            assert name not in active
+            active.append(name)
+            peak.append(len(active))
+        time.sleep(0.2)
+        with lock:
+            active.remove(name)
+        return minimal_repo
+
+    with (
+        patch("evaluator.cli.clone_repo", side_effect=fake_clone),
+        patch(
+            "evaluator.cli.run_pipeline",
+            return_value={"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": ""},
+        ),
+        patch("evaluator.cli.generate_evaluation_summary_llm", return_value=None),
+    ):
+        evaluate(file=path, output_name="clone_ahead.xlsx")
+
+    assert len(peak) == 4
+    assert max(peak) >= 2
+
+
+def test_evaluate_batch_api_submits_all_reports_once(sample_excel_path, minimal_repo, tmp_path, monkeypatch):
+    """With LLM_BATCH_API every repo's report goes into one Batch API call made after the last repo."""
+    monkeypatch.setenv("LLM_BATCH_API", "1")
+    calls = []
+
+    def fake_batch_api(items, max_chars):
+        calls.append(len(items))
+        return ["report one", None]
+
+    with (
+        patch("evaluator.cli.clone_repo", return_value=minimal_repo),
+        patch(
+            "evaluator.cli.run_pipeline",
+            return_value={"pipeline_runs": True, "gold_generated": False, "error": None, "stdout": "", "stderr": ""},
+        ),
+        patch("evaluator.cli.generate_evaluation_summaries_batch_api", side_effect=fake_batch_api),
+        patch("evaluator.cli.generate_evaluation_summary_llm", side_effect=AssertionError("live call")),
+    ):
+        evaluate(file=sample_excel_path, output_name="batch_api.xlsx")
+
+    assert calls == [2]
+    df = pd.read_excel(tmp_path / "output" / "batch_api.xlsx", engine=_READ_ENGINE)
+    assert df["evaluation_report"].iloc[0] == "report one"
+    assert isinstance(df["evaluation_report"].iloc[1], str) and df["evaluation_report"].iloc[1]
@@ -0,0 +1,86 @@
+"""Unit tests for evaluator.llm_batch (Batch API evaluation reports)."""
+
+import json
+from types import SimpleNamespace
+
+from evaluator import llm_batch
+
+ITEMS = [
+    {"check_results": {"has_readme": True}, "scores": {"final_score": 80}, "docker_results": "ok"},
+    {"check_results": {"has_readme": False}, "scores": {"final_score": 20}, "docker_results": None},
+]
+
+
+def _output_line(custom_id: str, content: str, status: int = 200) -> str:
+    body = {"choices": [{"message": {"content": content}}]}
+    return json.dumps({"custom_id": custom_id, "response": {"status_code": status, "body": body}})
+
+
+def test_build_batch_jsonl_one_request_per_item():
+    """Each line targets chat completions with the live summary request and its index as custom_id."""
+    requests = {
+        i: llm_batch._summary_request(it["check_results"], it["scores"], 500, it["docker_results"])
+        for i, it in enumerate(ITEMS)
+    }
+    lines = [json.loads(line) for line in llm_batch.build_batch_jsonl(requests).decode().splitlines()]
+    assert [line["custom_id"] for line in lines] == ["0", "1"]
+    assert all(line["url"] == llm_batch.BATCH_ENDPOINT and line["method"] == "POST" for line in lines)
+    assert lines[0]["body"]["model"] == "gpt-4o-mini"
+    assert lines[0]["body"]["messages"][0]["role"] == "system"
+
+
+def test_parse_batch_output_skips_failed_and_unknown_items():
+    """Non-200 responses, blank content and out-of-range ids leave None."""
+    text = "\n".join([_output_line("1", " second "), _output_line("0", "x", status=500), _output_line("7", "y"), "junk"])
+    assert llm_batch.parse_batch_output(text, 2) == [None, "second"]
+
+
+def test_generate_summaries_batch_api_polls_until_done(monkeypatch):
+    """Uploads the JSONL, polls the batch until it finishes and maps results back by index."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    statuses = iter(["in_progress", "completed"])
+    uploaded = {}
+
+    def retrieve(batch_id):
+        return SimpleNamespace(id=batch_id, status=next(statuses), output_file_id="out-1")
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=lambda file, purpose: uploaded.update(file=file, purpose=purpose) or SimpleNamespace(id="in-1"),
+            content=lambda file_id: SimpleNamespace(text=_output_line("0", "first") + "\n" + _output_line("1", "second")),
+        ),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="b-1", status="validating", output_file_id=None),
+            retrieve=retrieve,
+        ),
+    )
+    monkeypatch.setattr(llm_batch, "_get_client", lambda api_key: client)
+    assert llm_batch.generate_evaluation_summaries_batch_api(ITEMS, 500, poll_interval=0) == ["first", "second"]
+    assert uploaded["purpose"] == "batch"
+
+
+def test_generate_summaries_batch_api_without_key(monkeypatch):
+    """No API key: every item falls back (None) without touching the API."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    assert llm_batch.generate_evaluation_summaries_batch_api(ITEMS, 500) == [None, None]
+
+
+def test_generate_summaries_batch_api_uses_llm_cache(monkeypatch, tmp_path):
+    """Cached summaries are not resubmitted; fresh batch results are stored under the live request key."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_CACHE", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    first = llm_batch._summary_request(ITEMS[0]["check_results"], ITEMS[0]["scores"], 500, ITEMS[0]["docker_results"])
+    llm_batch.llm_cache.put(llm_batch.llm_cache.request_key(**first), "cached first")
+    submitted = []
+
+    def fake_run_batch(client, requests, count, poll_interval):
+        submitted.append(sorted(requests))
+        return [None, "fresh second"]
+
+    monkeypatch.setattr(llm_batch, "_get_client", lambda api_key: object())
+    monkeypatch.setattr(llm_batch, "_run_batch", fake_run_batch)
+    assert llm_batch.generate_evaluation_summaries_batch_api(ITEMS, 500) == ["cached first", "fresh second"]
+    assert submitted == [[1]]
+    assert llm_batch.generate_evaluation_summaries_batch_api(ITEMS, 500) == ["cached first", "fresh second"]
+    assert submitted == [[1]]
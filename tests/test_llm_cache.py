@@ -0,0 +1,66 @@
+"""Unit tests for evaluator.llm_cache (on-disk completion cache)."""
+
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from evaluator import llm_cache
+from evaluator.llm_cache import cached_completion, get_cache_path, request_key
+
+
+def _fake_create(text):
+    create = MagicMock()
+    create.return_value.choices = [MagicMock()]
+    create.return_value.choices[0].message.content = text
+    return create
+
+
+def test_request_key_ignores_kwarg_order():
+    """Same request in a different keyword order hashes the same; any change hashes differently."""
+    messages = [{"role": "user", "content": "hi"}]
+    a = request_key(model="m", messages=messages, temperature=0.2)
+    b = request_key(temperature=0.2, messages=messages, model="m")
+    assert a == b
+    assert a != request_key(model="m", messages=messages, temperature=0.3)
+
+
+def test_cached_completion_disabled_by_default(monkeypatch):
+    """Without LLM_CACHE every call reaches the API and nothing is written."""
+    monkeypatch.delenv("LLM_CACHE", raising=False)
+    create = _fake_create("answer")
+    assert cached_completion(create, model="m", messages=[]) == "answer"
+    assert cached_completion(create, model="m", messages=[]) == "answer"
+    assert create.call_count == 2
+    assert not get_cache_path().exists()
+
+
+def test_cached_completion_serves_repeat_requests_from_disk(monkeypatch, tmp_path):
+    """With LLM_CACHE=1 an identical request is answered from the SQLite cache."""
+    monkeypatch.setenv("LLM_CACHE", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    create = _fake_create("answer")
+    assert cached_completion(create, model="m", messages=[{"role": "user", "content": "x"}]) == "answer"
+    assert cached_completion(create, model="m", messages=[{"role": "user", "content": "x"}]) == "answer"
+    assert create.call_count == 1
+    cached_completion(create, model="m", messages=[{"role": "user", "content": "y"}])
+    assert create.call_count == 2
+
+
+def test_cache_connections_are_closed(monkeypatch, tmp_path):
+    """get/put close their SQLite connection instead of leaving it to garbage collection."""
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    opened = []
+    real_connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        opened.append(real_connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(llm_cache.sqlite3, "connect", tracking_connect)
+    llm_cache.put("k", "v")
+    assert llm_cache.get("k") == "v"
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
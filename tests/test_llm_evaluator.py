@@ -7,6 +7,9 @@ import pytest
 from evaluator.llm_evaluator import (
     generate_detailed_report,
     format_docker_results_for_summary,
+    generate_evaluation_summary_llm_batch,
+    run_full_evaluation,
+    evaluate_and_report,
     SUMMARY_USER_TEMPLATE,
 )
 
@@ -20,6 +23,11 @@ def test_generate_detailed_report_no_api_key(monkeypatch):
     assert "not generated" in out.lower() or "OPENAI_API_KEY" in out
 
 
+def _stream_of(text, size=8):
+    """Fake streaming response: chunks whose delta carries consecutive slices of text."""
+    return [MagicMock(choices=[MagicMock(delta=MagicMock(content=text[i : i + size]))]) for i in range(0, len(text), size)]
+
+
 def test_generate_detailed_report_success(monkeypatch):
     """When API returns content, returns report text."""
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
@@ -31,13 +39,11 @@ def test_generate_detailed_report_success(monkeypatch):
     with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
         mock_client = MagicMock()
         mock_openai.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = fake_content
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _stream_of(fake_content)
 
         out = generate_detailed_report(context, scores)
 
+    assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
     assert "Executive summary" in out
     assert "Medallion" in out
 
@@ -73,3 +79,239 @@ def test_summary_user_template_includes_sections():
     assert "{max_chars}" in SUMMARY_USER_TEMPLATE
     assert "Docker" in SUMMARY_USER_TEMPLATE
     assert "Do not change" in SUMMARY_USER_TEMPLATE or "do not" in SUMMARY_USER_TEMPLATE.lower()
+
+
+def test_generate_evaluation_summary_llm_batch_maps_ids(monkeypatch):
+    """Batched summaries are matched to items by id; missing ids come back as None."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    items = [
+        {"check_results": {"has_readme": True}, "scores": {"final_score": 80}, "docker_results": "ok"},
+        {"check_results": {"has_readme": False}, "scores": {"final_score": 20}, "docker_results": "failed"},
+    ]
+    with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
+        mock_client = MagicMock()
+        mock_openai.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '{"summaries": [{"id": 2, "summary": "Second repo."}]}'
+        mock_client.chat.completions.create.return_value = mock_response
+
+        out = generate_evaluation_summary_llm_batch(items, max_chars=500)
+
+    assert out == [None, "Second repo."]
+    prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert "### Repository 1" in prompt and "### Repository 2" in prompt
+
+
+def test_run_full_evaluation_runs_report_and_summary_after_scoring(monkeypatch):
+    """Scoring happens first; report and summary both see the LLM scores."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    seen = []
+
+    def fake_create(**kwargs):
+        system = kwargs["messages"][0]["content"]
+        user = kwargs["messages"][-1]["content"]
+        seen.append(user)
+        if "JSON" in system and "medallion_architecture" in system and "detailed" not in system:
+            content = '{"medallion_architecture": 4, "sla_logic": 3, "summary": "ok"}'
+        else:
+            content = "text"
+        if kwargs.get("stream"):
+            return _stream_of(content)
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = content
+        return response
+
+    with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create.side_effect = fake_create
+        out = run_full_evaluation({"readme": "Hi"}, {"has_readme": True}, {"final_score": 50})
+
+    assert out["llm"]["medallion_architecture"] == 4
+    assert out["evaluation_report"] == "text"
+    assert out["summary"] == "text"
+    assert len(seen) == 3
+    assert all("medallion_architecture: 4" in prompt for prompt in seen[1:])
+
+
+def test_openai_client_is_reused_across_calls(monkeypatch):
+    """Successive LLM calls with the same key share one client (and its connection pool)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value.choices = [MagicMock(message=MagicMock(content="r"))]
+        generate_detailed_report({"readme": "a"}, {"final_score": 1})
+        generate_detailed_report({"readme": "b"}, {"final_score": 2})
+    assert mock_openai.call_count == 1
+
+
+def test_evaluate_and_report_uses_one_request(monkeypatch):
+    """Scores, report and summary come back from a single JSON-mode request."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    answer = (
+        '{"scores": {"medallion_architecture": 5, "sla_logic": 2, "summary": "s"},'
+        ' "detailed_report": "## Executive summary", "summary": "Short summary."}'
+    )
+    with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value.choices = [MagicMock(message=MagicMock(content=answer))]
+        out = evaluate_and_report({"readme": "Hi"}, {"has_readme": True}, {"final_score": 60}, max_chars=400)
+
+    assert create.call_count == 1
+    assert create.call_args.kwargs["response_format"] == {"type": "json_object"}
+    assert create.call_args.kwargs["prompt_cache_key"] == "jiraflow-eval"
+    assert out["llm"]["medallion_architecture"] == 5 and out["llm"]["code_quality"] == 0
+    assert out["evaluation_report"] == "## Executive summary"
+    assert out["summary"] == "Short summary."
+
+
+def test_evidence_rendered_once_and_trimmed_for_report(monkeypatch):
+    """The evidence is rendered once per context; the report copy is capped."""
+    from evaluator import llm_evaluator
+
+    calls = []
+
+    def fake_render(ctx):
+        if "_rendered" in ctx:
+            return ctx["_rendered"]
+        calls.append(1)
+        return "x" * (llm_evaluator.REPORT_EVIDENCE_MAX_CHARS + 10)
+
+    monkeypatch.setattr(llm_evaluator, "context_to_string", fake_render)
+    context: dict = {}
+    full, report = llm_evaluator._evidence_for(context)
+    llm_evaluator._evidence_for(context)
+
+    assert len(calls) == 1
+    assert len(full) == llm_evaluator.REPORT_EVIDENCE_MAX_CHARS + 10
+    assert report.startswith("x" * llm_evaluator.REPORT_EVIDENCE_MAX_CHARS)
+    assert report.endswith("[evidence truncated for report]")
+    assert context["_report_evidence"] is report
+
+
+def test_retryable_errors_are_classified_by_type():
+    """Only transient OpenAI errors are retried; messages mentioning '429' are not."""
+    import openai
+
+    from evaluator.llm_evaluator import _is_retryable_error
+
+    rate_limited = openai.RateLimitError("slow down", response=MagicMock(status_code=429), body=None)
+    auth = openai.AuthenticationError("bad key", response=MagicMock(status_code=401), body=None)
+    assert _is_retryable_error(rate_limited)
+    assert _is_retryable_error(openai.APIConnectionError(request=MagicMock()))
+    assert not _is_retryable_error(auth)
+    assert not _is_retryable_error(ValueError("got 429 rate limit in an unrelated message"))
+
+
+def test_retry_delay_backs_off_and_honours_retry_after():
+    """Delays grow per attempt (capped), and a rate limit's Retry-After header wins."""
+    import openai
+
+    from evaluator.llm_evaluator import LLM_RETRY_MAX_DELAY_SEC, _retry_delay
+
+    err = ValueError("boom")
+    assert 2 <= _retry_delay(1, err) < 2.5
+    assert 8 <= _retry_delay(3, err) < 8.5
+    assert _retry_delay(10, err) < LLM_RETRY_MAX_DELAY_SEC + 0.5
+
+    response = MagicMock(status_code=429, headers={"retry-after": "12"})
+    rate_limited = openai.RateLimitError("slow down", response=response, body=None)
+    assert 12 <= _retry_delay(1, rate_limited) < 12.5
+
+
+def test_bounded_create_limits_concurrent_requests(monkeypatch):
+    """No more than the configured number of requests are in flight at once."""
+    import threading
+    import time as _time
+
+    from evaluator import llm_evaluator
+
+    monkeypatch.setattr(llm_evaluator, "_INFLIGHT", threading.BoundedSemaphore(2))
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def slow_create(**request):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        _time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = slow_create
+    create = llm_evaluator._bounded_create(client)
+    threads = [threading.Thread(target=create, kwargs={"model": "m"}) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client.chat.completions.create.call_count == 6
+    assert 1 <= peak[0] <= 2
+
+
+def test_detailed_report_stream_stops_at_cap(monkeypatch):
+    """Streaming stops (and the stream is closed) once the report exceeds REPORT_MAX_CHARS."""
+    from evaluator import llm_evaluator
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(llm_evaluator, "REPORT_MAX_CHARS", 20)
+    chunks = _stream_of("abcdefgh" * 100)
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(chunks)
+    with patch("evaluator.llm_evaluator.OpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value = stream
+        out = generate_detailed_report({"readme": "Hi"}, {"final_score": 1})
+
+    stream.close.assert_called_once()
+    assert out.startswith("abcdefgh" * 2 + "abcd")
+    assert out.endswith("[report truncated]")
+
+
+def test_run_full_evaluation_without_key_skips_evidence(monkeypatch):
+    """With no API key nothing is rendered: every LLM step falls back immediately."""
+    from evaluator import llm_evaluator
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    render = MagicMock(return_value="evidence")
+    monkeypatch.setattr(llm_evaluator, "context_to_string", render)
+    out = run_full_evaluation({"readme": "Hi"}, {"has_readme": True}, {"final_score": 50})
+
+    render.assert_not_called()
+    assert out["summary"] is None
+    assert "OPENAI_API_KEY" in out["evaluation_report"]
+
+
+def test_fit_evidence_trims_to_context_budget(monkeypatch):
+    """Evidence beyond the model window is trimmed (char heuristic when tiktoken is absent)."""
+    from evaluator import llm_evaluator
+
+    monkeypatch.setattr(llm_evaluator, "_token_encoding", lambda: None)
+    monkeypatch.setattr(llm_evaluator, "LLM_CONTEXT_TOKENS", 2000)
+    assert llm_evaluator._fit_evidence("short", "sys", 100) == "short"
+
+    out = llm_evaluator._fit_evidence("y" * 10_000, "sys", 100)
+    assert out.startswith("y" * ((2000 - 1 - 100 - 500) * 3))
+    assert out.endswith("[evidence truncated to fit the model context]")
+    assert len(out) < 10_000
+
+
+def test_complete_with_retry_retries_only_transient_errors(monkeypatch):
+    """Transient errors are retried (up to LLM_MAX_RETRIES); others propagate at once."""
+    import openai
+
+    from evaluator import llm_evaluator
+
+    monkeypatch.setattr(llm_evaluator.time, "sleep", lambda s: None)
+    ok = MagicMock(choices=[MagicMock(message=MagicMock(content="done"))])
+    flaky = MagicMock(side_effect=[openai.APIConnectionError(request=MagicMock()), ok])
+    assert llm_evaluator._complete_with_retry("t", flaky, model="m") == "done"
+    assert flaky.call_count == 2
+
+    down = MagicMock(side_effect=openai.APIConnectionError(request=MagicMock()))
+    with pytest.raises(openai.APIConnectionError):
+        llm_evaluator._complete_with_retry("t", down, model="m")
+    assert down.call_count == llm_evaluator.LLM_MAX_RETRIES
+
+    broken = MagicMock(side_effect=ValueError("bad request"))
+    with pytest.raises(ValueError):
+        llm_evaluator._complete_with_retry("t", broken, model="m")
+    assert broken.call_count == 1
@@ -1,5 +1,7 @@
 """Unit tests for evaluator.pipeline_runner (pure helpers)."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,6 +10,12 @@ import pytest
 from evaluator import pipeline_runner as pr
 
 
+@pytest.fixture(autouse=True)
+def fake_docker_bin(monkeypatch):
+    """Docker calls are faked in these tests; pretend the CLI is on PATH."""
+    monkeypatch.setattr(pr, "_docker_bin", lambda: "docker")
+
+
 def test_find_entrypoint_root_main_py(tmp_path):
     """Finds main.py at repo root."""
     (tmp_path / "main.py").write_text("", encoding="utf-8")
@@ -103,6 +111,15 @@ def test_repo_uses_azure_ingestion_true(tmp_path):
     assert pr._repo_uses_azure_ingestion(tmp_path) is True
 
 
+def test_repo_uses_azure_ingestion_case_insensitive_and_empty_files(tmp_path):
+    """Markers match in any case (config.py included); empty files are skipped without error."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "empty.py").write_bytes(b"")
+    assert pr._repo_uses_azure_ingestion(tmp_path) is False
+    (tmp_path / "config.py").write_bytes(b"ACCOUNT = os.getenv('Azure_Account_Url')\n")
+    assert pr._repo_uses_azure_ingestion(tmp_path) is True
+
+
 def test_get_repo_raw_input_filename_from_env_example(tmp_path):
     """Read RAW_INPUT_FILENAME from .env.example."""
     (tmp_path / ".env.example").write_text(
@@ -111,6 +128,14 @@ def test_get_repo_raw_input_filename_from_env_example(tmp_path):
     assert pr._get_repo_raw_input_filename(tmp_path) == "issues.json"
 
 
+def test_get_repo_raw_input_filename_quoted_with_comment(tmp_path):
+    """Quotes and trailing comments are dropped; empty assignments are skipped."""
+    (tmp_path / ".env.example").write_text(
+        "RAW_INPUT_FILENAME=\n  RAW_INPUT_FILENAME = \"jira_issues.json\"  # local export\r\n", encoding="utf-8"
+    )
+    assert pr._get_repo_raw_input_filename(tmp_path) == "jira_issues.json"
+
+
 def test_get_repo_raw_input_filename_from_python(tmp_path):
     """Read default from getenv in config."""
     (tmp_path / "src").mkdir()
@@ -122,6 +147,23 @@ def test_get_repo_raw_input_filename_from_python(tmp_path):
     assert pr._get_repo_raw_input_filename(tmp_path) == "tickets_raw.json"
 
 
+def test_get_repo_raw_input_filename_env_wins_without_walk(tmp_path, monkeypatch):
+    """The evaluator's RAW_INPUT_FILENAME (passed into the container) wins and no repo file is read."""
+    (tmp_path / ".env.example").write_text("RAW_INPUT_FILENAME=issues.json\n", encoding="utf-8")
+    monkeypatch.setenv("RAW_INPUT_FILENAME", "from_env.json")
+    monkeypatch.setattr(pr, "_python_tree_key", lambda repo_path: pytest.fail("repo walked"))
+    assert pr._get_repo_raw_input_filename(tmp_path) == "from_env.json"
+
+
+def test_get_repo_raw_input_filename_prefers_src_over_root(tmp_path):
+    """getenv defaults under src/ win over ones elsewhere in the repo."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "tool.py").write_text('getenv("RAW_INPUT_FILENAME", "other.json")', encoding="utf-8")
+    (tmp_path / "src" / "ingest.py").write_text('getenv("RAW_INPUT_FILENAME", "src.json")', encoding="utf-8")
+    assert pr._get_repo_raw_input_filename(tmp_path) == "src.json"
+
+
 def test_get_repo_raw_input_filename_default(tmp_path, monkeypatch):
     """No config and no env -> default filename."""
     monkeypatch.delenv("RAW_INPUT_FILENAME", raising=False)
@@ -175,3 +217,261 @@ def test_run_pipeline_seeds_and_runs_when_raw_file_missing(tmp_path, monkeypatch
     filename = pr._get_repo_raw_input_filename(tmp_path)
     assert (tmp_path / filename).is_file()
     mock_docker.assert_called_once()
+
+
+def test_warm_runner_starts_once_and_execs(tmp_path, monkeypatch):
+    """With DOCKER_WARM_RUNNER the container is started once (nothing mounted); each repo is copied in and execs."""
+    monkeypatch.setenv("DOCKER_WARM_RUNNER", "1")
+    monkeypatch.delenv("DOCKER_DEPS_CACHE", raising=False)
+    monkeypatch.setattr(pr, "_runner", None)
+    monkeypatch.setattr(pr, "_runner_failed", False)
+    monkeypatch.setattr(pr.atexit, "register", lambda *a: None)
+    started = []
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        started.append(cmd)
+        return type("Proc", (), {"returncode": 0, "stdout": "ok", "stderr": ""})()
+
+    monkeypatch.setattr(pr.subprocess, "run", fake_run)
+    monkeypatch.setattr(pr, "_run_capped", lambda cmd, timeout, cwd=None: calls.append(cmd) or (0, "ok", ""))
+    (tmp_path / "repo_a").mkdir()
+    (tmp_path / "repo_a" / "requirements.txt").write_text("pandas\n", encoding="utf-8")
+    (tmp_path / "repo_b").mkdir()
+    for name in ("repo_a", "repo_b"):
+        assert pr._run_in_docker(tmp_path / name, "python main.py") == (0, "ok", "")
+
+    assert len(started) == 1 and started[0][1] == "run" and "-v" not in started[0]
+    assert len(calls) == 12  # per repo: mkdir, cp in, chown, pipeline, cp back, cleanup
+    run_a, run_b = calls[:6], calls[6:]
+    for run, name in ((run_a, "repo_a"), (run_b, "repo_b")):
+        mkdir, copy_in, chown, pipeline, copy_back, cleanup = run
+        assert copy_in[1] == "cp" and copy_in[2] == f"{tmp_path / name}/."
+        assert copy_back[1] == "cp" and copy_back[3] == str(tmp_path / name)
+        assert pipeline[1:3] == ["exec", "-u"] and "chown" in chown[-1] and "rm -rf" in cleanup[-1]
+    uid_a, uid_b = run_a[3][3], run_b[3][3]
+    assert uid_a != uid_b and f"chown -R {uid_a}" in run_a[2][-1]
+    assert "--target" in run_a[3][-1] and "python main.py" in run_a[3][-1]
+    assert run_b[3][-1] == f"ulimit -u {pr.DOCKER_PIDS_LIMIT} 2>/dev/null; python main.py"
+
+
+def test_warm_runner_caps_scale_with_slots(monkeypatch):
+    """The shared runner gets the per-pipeline caps times the number of concurrent jobs."""
+    monkeypatch.setattr(pr, "_runner_slots", 1)
+    assert pr._runner_resource_args() == pr.DOCKER_RESOURCE_ARGS
+    pr.set_runner_slots(3)
+    assert pr._runner_resource_args() == (
+        f"--cpus={pr.DOCKER_CPUS * 3}",
+        f"--memory={pr.DOCKER_MEMORY_GB * 3}g",
+        f"--pids-limit={pr.DOCKER_PIDS_LIMIT * 3}",
+    )
+
+
+def test_warm_runner_copies_back_and_cleans_up_on_failure(tmp_path, monkeypatch):
+    """A failing pipeline still has its outputs copied back and its scratch dir and leftovers removed."""
+    monkeypatch.setenv("DOCKER_WARM_RUNNER", "1")
+    monkeypatch.setattr(pr, "_ensure_runner_container", lambda: "runner")
+    calls = []
+
+    def fake_capped(cmd, timeout, cwd=None):
+        calls.append(cmd)
+        if "-u" in cmd:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return (0, "", "")
+
+    monkeypatch.setattr(pr, "_run_capped", fake_capped)
+    code, _, err = pr._run_in_runner(tmp_path, "python main.py")
+    assert code == -1 and "timed out" in err
+    assert calls[-2][1] == "cp" and calls[-2][3] == str(tmp_path)
+    assert "kill -9" in calls[-1][-1] and "-delete" in calls[-1][-1]
+
+
+def test_warm_runner_falls_back_to_docker_run(tmp_path, monkeypatch):
+    """If the runner cannot start, the per-repo docker run path is used."""
+    monkeypatch.setenv("DOCKER_WARM_RUNNER", "1")
+    monkeypatch.setattr(pr, "_runner", None)
+    monkeypatch.setattr(pr, "_runner_failed", False)
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return type("Proc", (), {"returncode": 1 if "-d" in cmd else 0, "stdout": "", "stderr": "no daemon"})()
+
+    monkeypatch.setattr(pr.subprocess, "run", fake_run)
+    monkeypatch.setattr(pr, "_run_capped", lambda cmd, timeout, cwd=None: fake_run(cmd) and (0, "ok", ""))
+    code, _, _ = pr._run_in_docker(tmp_path, "python main.py")
+    assert code == 0
+    assert calls[-1][:3] == ["docker", "run", "--rm"]
+    assert pr._runner_failed is True
+
+
+def test_deps_image_built_once_and_used_for_run(tmp_path, monkeypatch):
+    """With DOCKER_DEPS_CACHE the requirements are baked into a tagged image; the run skips pip install."""
+    monkeypatch.setenv("DOCKER_DEPS_CACHE", "1")
+    monkeypatch.delenv("DOCKER_WARM_RUNNER", raising=False)
+    monkeypatch.delenv("HOST_TEMP_REPOS_DIR", raising=False)
+    monkeypatch.setattr(pr, "_deps_image_failed", set())
+    (tmp_path / "requirements.txt").write_text("pandas\n", encoding="utf-8")
+    built = set()
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        code = 0
+        if cmd[1:3] == ["image", "inspect"]:
+            code = 0 if cmd[3] in built else 1
+        elif cmd[1] == "build":
+            built.add(cmd[4])
+            assert "pandas" in (Path(cmd[5]) / "requirements.txt").read_text()
+            assert "--mount=type=cache,target=/root/.cache/pip" in (Path(cmd[5]) / "Dockerfile").read_text()
+            assert kwargs["env"]["DOCKER_BUILDKIT"] == "1"
+        return type("Proc", (), {"returncode": code, "stdout": "", "stderr": ""})()
+
+    monkeypatch.setattr(pr.subprocess, "run", fake_run)
+    monkeypatch.setattr(pr, "_run_capped", lambda cmd, timeout, cwd=None: fake_run(cmd) and (0, "ok", ""))
+    pr._run_in_docker(tmp_path, "python main.py")
+    pr._run_in_docker(tmp_path, "python main.py")
+
+    assert sum(1 for c in calls if c[1] == "build") == 1
+    (tag,) = built
+    assert tag.startswith("jfe-deps:")
+    runs = [c for c in calls if c[1] == "run"]
+    assert all(c[-4:] == [tag, "bash", "-c", "python main.py"] for c in runs) and len(runs) == 2
+
+
+def test_run_capped_keeps_only_output_tail():
+    """Large output is drained while the process runs; only the last MAX_FILE_SIZE bytes are kept."""
+    script = "import sys; sys.stdout.write('a' * 300000 + 'END'); sys.stderr.write('boom')"
+    code, out, err = pr._run_capped([sys.executable, "-c", script], timeout=30)
+    assert code == 0
+    assert len(out) == pr.MAX_FILE_SIZE and out.endswith("aEND")
+    assert err == "boom"
+
+
+def test_run_capped_kills_on_timeout():
+    """A process that outlives the timeout is killed and TimeoutExpired is raised."""
+    with pytest.raises(subprocess.TimeoutExpired):
+        pr._run_capped([sys.executable, "-c", "import time; time.sleep(30)"], timeout=1)
+
+
+def test_azure_lookup_cached_until_python_files_change(tmp_path, monkeypatch):
+    """Repeated lookups on an unchanged repo reuse the result; editing a .py file invalidates it."""
+    (tmp_path / "src").mkdir()
+    ingest = tmp_path / "src" / "ingest.py"
+    ingest.write_text("def ingest(): pass\n", encoding="utf-8")
+    reads = []
+    real = pr._file_matches
+    monkeypatch.setattr(pr, "_file_matches", lambda path, pattern: reads.append(path) or real(path, pattern))
+
+    assert pr._repo_uses_azure_ingestion(tmp_path) is False
+    assert pr._repo_uses_azure_ingestion(tmp_path) is False
+    assert len(reads) == 1
+
+    ingest.write_text("from azure.identity import DefaultAzureCredential\n", encoding="utf-8")
+    assert pr._repo_uses_azure_ingestion(tmp_path) is True
+
+
+def test_any_file_matches_parallel_path(tmp_path):
+    """The pooled scan (many files) finds a single marker file and reports misses."""
+    paths = []
+    for i in range(pr.SCAN_PARALLEL_MIN_FILES + 10):
+        p = tmp_path / f"m{i}.py"
+        p.write_text("x = 1\n", encoding="utf-8")
+        paths.append(p)
+    assert pr._any_file_matches(paths, pr._AZURE_MARKERS_RE) is False
+    paths[-3].write_text("client = BlobServiceClient(url)\n", encoding="utf-8")
+    assert pr._any_file_matches(paths, pr._AZURE_MARKERS_RE) is True
+
+
+def test_docker_run_skips_pip_without_requirements(tmp_path, monkeypatch):
+    """No requirements.txt: the container runs the command directly, with no pip install step."""
+    monkeypatch.delenv("DOCKER_WARM_RUNNER", raising=False)
+    monkeypatch.delenv("DOCKER_DEPS_CACHE", raising=False)
+    calls = []
+    monkeypatch.setattr(pr, "_run_capped", lambda cmd, timeout, cwd=None: calls.append(cmd) or (0, "", ""))
+    pr._run_in_docker(tmp_path, "python main.py")
+    (tmp_path / "requirements.txt").write_text("pandas\n", encoding="utf-8")
+    pr._run_in_docker(tmp_path, "python main.py")
+
+    assert calls[0][-4:] == [pr.DOCKER_IMAGE, "bash", "-c", "python main.py"]
+    assert calls[1][-1].startswith("pip install -q -r requirements.txt")
+
+
+def test_getenv_default_found_in_large_mapped_file(tmp_path):
+    """Files above MMAP_MIN_SIZE are searched through a memory map."""
+    (tmp_path / "src").mkdir()
+    padding = "# filler\n" * (pr.MMAP_MIN_SIZE // 9 + 10)
+    (tmp_path / "src" / "big.py").write_text(
+        padding + 'name = os.getenv("RAW_INPUT_FILENAME", "big_export.json")\n', encoding="utf-8"
+    )
+    assert pr._get_repo_raw_input_filename(tmp_path) == "big_export.json"
+
+
+def test_azure_marker_alternation_drops_redundant_markers():
+    """Markers containing a shorter marker are covered by it and left out of the regex."""
+    assert pr._minimal_markers(pr.AZURE_INGESTION_MARKERS) == ("azure", "BlobServiceClient")
+    assert pr._AZURE_MARKERS_RE.search(b"cred = DefaultAZURECredential()")
+    assert pr._AZURE_MARKERS_RE.search(b"from x import blobserviceclient")
+
+
+def test_run_in_docker_reports_missing_docker_without_spawning(tmp_path, monkeypatch):
+    """Without a docker binary on PATH the run fails fast with the install hint."""
+    monkeypatch.setattr(pr, "_docker_bin", lambda: None)
+    monkeypatch.setattr(pr, "_run_capped", lambda *a, **k: pytest.fail("should not spawn"))
+    code, _, err = pr._run_in_docker(tmp_path, "python main.py")
+    assert code == -1
+    assert "Docker not found" in err
+
+
+def test_warm_runner_deps_cache_installs_once_per_requirements(tmp_path, monkeypatch):
+    """With DOCKER_DEPS_CACHE the first run installs and publishes a per-hash dir; later runs reuse it."""
+    import os
+
+    monkeypatch.setenv("DOCKER_DEPS_CACHE", "1")
+    monkeypatch.setattr(pr, "RUNNER_DEPS_DIR", str(tmp_path / "deps"))
+    (tmp_path / "deps").mkdir()
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    requirements = b"pandas\n"
+    (repo / "requirements.txt").write_bytes(requirements)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    # Called as: pip install -q --target <dir> -r requirements.txt
+    (bin_dir / "pip").write_text('#!/bin/sh\necho x >> "$PIP_LOG"\nmkdir -p "$4"\n', encoding="utf-8")
+    (bin_dir / "pip").chmod(0o755)
+    env = {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}", "PIP_LOG": str(tmp_path / "pip.log")}
+    cached = tmp_path / "deps" / pr._requirements_digest(requirements)
+
+    for run in ("1", "2"):
+        work = str(tmp_path / run / "work")
+        for script in (
+            pr._runner_install_script(work, requirements),
+            pr._runner_publish_script(work, requirements),
+            pr._runner_pipeline_script(work, requirements, 'echo "$PYTHONPATH"'),
+        ):
+            out = subprocess.run(["bash", "-c", script], cwd=repo, env=env, capture_output=True, text=True)
+        assert out.stdout.strip().startswith(str(cached))
+    assert (tmp_path / "pip.log").read_text().count("x") == 1
+    assert [p.name for p in (tmp_path / "deps").iterdir()] == [cached.name]
+
+
+def test_docker_run_isolates_network_only_when_nothing_needs_it(tmp_path, monkeypatch):
+    """--network=none without Azure credentials or a run-time pip install; resource caps always."""
+    for name in pr.AZURE_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv("DOCKER_WARM_RUNNER", raising=False)
+    monkeypatch.delenv("DOCKER_DEPS_CACHE", raising=False)
+    calls = []
+    monkeypatch.setattr(pr, "_run_capped", lambda cmd, timeout, cwd=None: calls.append(cmd) or (0, "", ""))
+
+    pr._run_in_docker(tmp_path, "python main.py")
+    assert "--network=none" in calls[-1] and "--memory=2g" in calls[-1]
+
+    monkeypatch.setenv("AZURE_ACCOUNT_URL", "https://acct.blob.core.windows.net")
+    pr._run_in_docker(tmp_path, "python main.py")
+    assert "--network=none" not in calls[-1]
+
+    monkeypatch.delenv("AZURE_ACCOUNT_URL")
+    (tmp_path / "requirements.txt").write_text("pandas\n", encoding="utf-8")
+    pr._run_in_docker(tmp_path, "python main.py")
+    assert "--network=none" not in calls[-1] and "--memory=2g" in calls[-1]
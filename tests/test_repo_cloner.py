@@ -1,8 +1,13 @@
 """Unit tests for evaluator.repo_cloner."""
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
-from evaluator.repo_cloner import repo_name_from_url
+from evaluator.repo_cloner import SHALLOW_CLONE_ARGS, clone_repo, evict_clone_cache, repo_name_from_url
+from evaluator.utils import get_temp_repos_dir
 
 
 def test_repo_name_from_url_https():
@@ -26,3 +31,65 @@ def test_repo_name_from_url_sanitize():
     name = repo_name_from_url("https://example.com/some/weird.repo.name")
     assert " " not in name
     assert name == "weird.repo.name" or "_" in name
+
+
+def _fake_git_clone(args, **kwargs):
+    """Stand-in for subprocess.run: create the clone target dir instead of running git."""
+    Path(args[-1], ".git").mkdir(parents=True)
+
+
+def test_clone_repo_shallow_flags():
+    """shallow=True passes depth/filter flags to git clone; default clones full history."""
+    base = get_temp_repos_dir()
+    with patch("evaluator.repo_cloner.subprocess.run", side_effect=_fake_git_clone) as run:
+        assert clone_repo("https://github.com/a/b", shallow=True) == base / "a_b"
+        args = run.call_args[0][0]
+        assert all(flag in args for flag in SHALLOW_CLONE_ARGS)
+        assert clone_repo("https://github.com/a/c") == base / "a_c"
+        assert "--depth=1" not in run.call_args[0][0]
+    assert not list(base.glob(".*.partial"))
+
+
+def test_clone_repo_skips_pull_when_up_to_date():
+    """Existing clone whose HEAD matches the remote HEAD is reused without git pull."""
+    base = get_temp_repos_dir()
+    (base / "a_b" / ".git").mkdir(parents=True)
+    with (
+        patch("evaluator.repo_cloner._remote_head_sha", return_value="abc123"),
+        patch("evaluator.repo_cloner._local_head_sha", return_value="abc123"),
+        patch("evaluator.repo_cloner.subprocess.run") as run,
+    ):
+        assert clone_repo("https://github.com/a/b") == base / "a_b"
+    run.assert_not_called()
+
+
+def test_clone_repo_shallow_update_fetches_tip_and_resets():
+    """A stale shallow clone is updated with a depth-1 fetch + hard reset, not git pull."""
+    base = get_temp_repos_dir()
+    (base / "a_b" / ".git").mkdir(parents=True)
+    ok = type("Proc", (), {"returncode": 0, "stderr": ""})()
+    with (
+        patch("evaluator.repo_cloner._remote_head_sha", return_value="new"),
+        patch("evaluator.repo_cloner._local_head_sha", return_value="old"),
+        patch("evaluator.repo_cloner.subprocess.run", return_value=ok) as run,
+    ):
+        assert clone_repo("https://github.com/a/b", shallow=True) == base / "a_b"
+    cmds = [c[0][0] for c in run.call_args_list]
+    assert cmds == [
+        ["git", "fetch", "--quiet", "--depth=1", "origin", "HEAD"],
+        ["git", "reset", "--quiet", "--hard", "FETCH_HEAD"],
+    ]
+
+
+def test_evict_clone_cache_removes_least_recently_used():
+    """Oldest clones are evicted first until the cache fits the limit."""
+    base = get_temp_repos_dir()
+    for i, name in enumerate(["old", "mid", "new"]):
+        repo = base / name
+        repo.mkdir(parents=True)
+        (repo / "data.bin").write_bytes(b"x" * 100)
+        os.utime(repo, (1000 + i, 1000 + i))
+    removed = evict_clone_cache(max_bytes=150)
+    assert [p.name for p in removed] == ["old", "mid"]
+    assert (base / "new").exists()
+    assert evict_clone_cache() == []  # CLONE_CACHE_MAX_GB unset -> no limit
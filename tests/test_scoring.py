@@ -67,6 +67,21 @@ def test_compute_final_score_all_zeros():
     assert score == 0.0
 
 
+def test_final_scores_short_circuit_failed_rows(monkeypatch):
+    """A failed row (all metrics zero, non-empty summary) returns 0 without scoring each metric."""
+    from evaluator import scoring
+    from evaluator.cli import _empty_metrics
+
+    class NoItemAccess(dict):
+        def __getitem__(self, key):
+            raise AssertionError(f"scored {key}")
+
+    metrics = NoItemAccess({**_empty_metrics(), "summary": "Clone failed. Score reflects no evaluation."})
+    monkeypatch.setattr(scoring, "metric_value", lambda raw, key: pytest.fail("metric_value called"))
+    assert compute_final_score(metrics, DEFAULT_WEIGHTS, max_score=100.0) == 0.0
+    assert compute_final_score_as_average(metrics) == 0.0
+
+
 def test_compute_final_score_all_max():
     """All max values -> max_score. Use True for bool metrics, 5 for numeric."""
     weights = {"pipeline_runs": 1, "gold_generated": 1, "code_quality": 1}
@@ -139,3 +154,26 @@ def test_compute_final_score_as_average_equals_column_average():
     # 100 + 0 + 80 + 60 + 100 + 40 + 20 + 0 + 100 + 100 + 0 = 600; 600/11 ≈ 54.55
     assert abs(score - (600 / 11)) < 0.01
     assert score == round(600 / 11, 2)
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path):
+    """Config is parsed once per path, mtime and size; edits are picked up; callers get independent copies."""
+    import os
+    from unittest.mock import patch
+
+    from evaluator import scoring
+
+    path = tmp_path / "scoring.yaml"
+    path.write_text("weights:\n  pipeline_runs: 7\n", encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    first = load_config(config_path=path)
+    first["weights"]["pipeline_runs"] = 99
+    with patch.object(scoring.yaml, "load", side_effect=AssertionError("reparsed")):
+        assert load_config(config_path=path)["weights"]["pipeline_runs"] == 7
+    path.write_text("weights:\n  pipeline_runs: 1\n", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert load_config(config_path=path)["weights"]["pipeline_runs"] == 1
+    # Same mtime, different size (coarse-mtime filesystems): still reparsed.
+    path.write_text("weights:\n  pipeline_runs: 12\n", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert load_config(config_path=path)["weights"]["pipeline_runs"] == 12
@@ -52,3 +52,139 @@ def test_security_score_gitignore_entries(tmp_path):
     score = compute_security_score(tmp_path)
     assert score >= 15  # gitignore security entries
 
+
+def test_security_score_ignores_skipped_and_hidden_dirs(tmp_path):
+    """Secrets under venv/, node_modules/ or dot-directories do not count against the repo."""
+    for d in ("venv/lib", "node_modules/pkg", ".github/scripts"):
+        (tmp_path / d).mkdir(parents=True)
+        (tmp_path / d / "leak.py").write_text('password = "hunter2"', encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "settings.yaml").write_text("x: 1\n", encoding="utf-8")
+    assert compute_security_score(tmp_path) >= 40
+    (tmp_path / "src" / "app.py").write_text('password = "hunter2"', encoding="utf-8")
+    assert compute_security_score(tmp_path) < 40
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'API_KEY = "abc"',
+        "password = ''",
+        "  SECRET_KEY = x",
+        "x = 1\nACCESS_KEY=abc",
+        "key = sk-abcdefghijklmnopqrstuvwx",
+        "key = SK-abcdefghijklmnopqrstuvwx",
+        "token = get_token()",
+        "print('hello')",
+    ],
+)
+def test_hardcoded_union_matches_individual_patterns(text):
+    """The combined regexes (str and bytes) agree with searching each pattern (and its own flags) separately."""
+    from evaluator.security_scorer import HARDCODED_PATTERNS, _has_hardcoded_credentials, _scan
+
+    expected = any(p.search(text) for p in HARDCODED_PATTERNS)
+    assert _has_hardcoded_credentials(text) == expected
+    assert _scan(text.encode())[0] == expected
+
+
+def test_scan_reports_credentials_and_env_usage_together():
+    """_scan answers both questions for one file's content."""
+    from evaluator.security_scorer import _scan
+
+    assert _scan(b'import os\nkey = os.getenv("K")\npassword = "x"') == (True, True)
+    assert _scan(b'import os\nkey = os.environ["K"]') == (False, True)
+    assert _scan(b"print('hi')") == (False, False)
+
+
+def test_read_file_safe_reads_only_the_capped_prefix(tmp_path):
+    """Large files are truncated to max_size characters without reading the rest."""
+    from evaluator.security_scorer import _read_file_safe
+
+    path = tmp_path / "big.json"
+    path.write_bytes(b"a\r\n" + b"x" * 1_000_000)
+    text = _read_file_safe(path, max_size=10)
+    assert text == "a\n" + "x" * 8
+    assert _read_file_safe(tmp_path / "missing.py") == ""
+
+
+def test_gitignore_read_once_per_score(tmp_path, monkeypatch):
+    """compute_security_score parses .gitignore once and shares the lines with the .env check."""
+    from evaluator import security_scorer
+
+    (tmp_path / ".gitignore").write_text(".env\n", encoding="utf-8")
+    (tmp_path / ".env").write_text("KEY=value", encoding="utf-8")
+    calls = []
+    real = security_scorer._gitignore_lines
+    monkeypatch.setattr(security_scorer, "_gitignore_lines", lambda p: calls.append(p) or real(p))
+    assert compute_security_score(tmp_path) >= 15
+    assert len(calls) == 1
+
+
+def test_security_scan_skips_lockfiles_large_and_binary_files(tmp_path, monkeypatch):
+    """Lockfiles, oversized files and NUL-containing files are not scanned for credentials."""
+    from evaluator import security_scorer
+
+    monkeypatch.setattr(security_scorer, "SCAN_MAX_FILE_BYTES", 1000)
+    (tmp_path / "package-lock.json").write_text('{"token": "abc", "x": "token = \'abcdef\'"}', encoding="utf-8")
+    (tmp_path / "big.py").write_text('password = "hunter2"\n' + "#" * 2000, encoding="utf-8")
+    (tmp_path / "blob.json").write_bytes(b"\0\0" + b'password = "hunter2"')
+    assert compute_security_score(tmp_path) >= 40
+    (tmp_path / "small.py").write_text('password = "hunter2"', encoding="utf-8")
+    assert compute_security_score(tmp_path) < 40
+
+
+@pytest.mark.parametrize(
+    ("gitignore", "expected_entries"),
+    [
+        ("", 0),
+        (".env\n", 1),
+        ("config/.env.local\n*.pem\n", 3),  # ".env" and ".env.local" are substrings; "*.pem" exact
+        ("certs/server.key\nsecrets.json.bak\n", 2),  # ends with ".key"; contains "secrets.json"
+        ("foo.keys\n", 0),
+    ],
+)
+def test_gitignore_security_entries_tally(tmp_path, gitignore, expected_entries):
+    """Each security entry counts once when some line contains it (or ends with a glob's extension)."""
+    (tmp_path / ".gitignore").write_text(gitignore, encoding="utf-8")
+    base = compute_security_score(tmp_path)
+    assert base == 40 + 15 + min(15, expected_entries * 5) + 10
+
+
+def test_security_score_cached_until_files_change(tmp_path, monkeypatch):
+    """An unchanged tree is scored from the cache; editing a scanned file or .gitignore rescans."""
+    import os
+
+    from evaluator import security_scorer
+
+    main = tmp_path / "main.py"
+    main.write_text("import os\nkey = os.getenv('KEY')\n", encoding="utf-8")
+    first = compute_security_score(tmp_path)
+
+    def fail_read(path):
+        raise AssertionError("rescanned")
+
+    with monkeypatch.context() as m:
+        m.setattr(security_scorer, "_read_file_bytes_safe", fail_read)
+        assert compute_security_score(tmp_path) == first
+    main.write_text('api_key = "sk-12345678901234567890"\n', encoding="utf-8")
+    os.utime(main, ns=(1_000_000_000, 1_000_000_000))
+    assert compute_security_score(tmp_path) < first
+    before = compute_security_score(tmp_path)
+    (tmp_path / ".gitignore").write_text(".env\n*.pem\n", encoding="utf-8")
+    assert compute_security_score(tmp_path) > before
+
+
+def test_security_score_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    """Repos with many files are scanned in a thread pool with the same outcome as the serial scan."""
+    from evaluator import security_scorer
+
+    for i in range(20):
+        (tmp_path / f"mod_{i}.py").write_text(f"x_{i} = {i}\n", encoding="utf-8")
+    (tmp_path / "mod_7.py").write_text("import os\nkey = os.getenv('KEY')\n", encoding="utf-8")
+    (tmp_path / "mod_13.py").write_text('token = "abc123"\n', encoding="utf-8")
+    parallel = compute_security_score(tmp_path)
+    security_scorer._SCORE_CACHE.clear()
+    monkeypatch.setattr(security_scorer, "PARALLEL_SCAN_MIN_FILES", 10_000)
+    assert compute_security_score(tmp_path) == parallel
+    # Hardcoded token found (no 40), env vars used, no .env file, no config secrets.
+    assert parallel == security_scorer.POINTS_ENV_VARS + security_scorer.POINTS_ENV_IGNORED + security_scorer.POINTS_SAFE_CONFIG
@@ -4,12 +4,14 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
+from openpyxl import Workbook
 
 from evaluator.spreadsheet import (
     REPO_URL_COL,
     RESULT_COLUMNS,
     build_result_row,
     get_repo_rows,
+    iter_input_rows,
     load_input,
     write_results,
 )
@@ -51,6 +53,17 @@ def test_get_repo_rows_from_sample(sample_excel_path):
     assert rows[0][REPO_URL_COL] == "https://github.com/user/repo1"
 
 
+def test_get_repo_rows_dataframe_mask_matches_row_filter():
+    """The DataFrame path drops the same rows (NaN, None, blank) as the row-iterator path."""
+    df = pd.DataFrame(
+        {REPO_URL_COL: ["https://github.com/a/b", None, "   ", float("nan"), "https://github.com/c/d"], "n": range(5)}
+    )
+    rows = get_repo_rows(df)
+    assert [r["n"] for r in rows] == [0, 4]
+    assert rows == get_repo_rows(iter(df.to_dict("records")))
+    assert get_repo_rows(pd.DataFrame({"other": [1]})) == []
+
+
 def test_build_result_row():
     """Original row is merged with result columns."""
     original = {"repo_url": "https://x.com/y", "name": "Alice"}
@@ -76,3 +89,68 @@ def test_write_results_creates_file(tmp_path):
     df = pd.read_excel(out, engine="openpyxl")
     assert "repo_url" in df.columns
     assert len(df) == 1
+
+
+def test_write_results_streams_generator_and_blanks_nan(tmp_path):
+    """write_results accepts a generator; NaN values become empty cells."""
+    out = tmp_path / "out.xlsx"
+
+    def rows():
+        yield {"repo_url": "https://a.com/b", "team": float("nan"), "final_score": 8.0}
+        yield {"repo_url": "https://a.com/c", "team": "x", "final_score": 5.0}
+
+    write_results(rows(), out)
+    df = pd.read_excel(out, engine="openpyxl")
+    assert list(df.columns) == ["repo_url", "team", "final_score"]
+    assert pd.isna(df["team"].iloc[0])
+    assert df["final_score"].tolist() == [8.0, 5.0]
+
+
+def test_iter_input_rows_streams_and_names_columns_like_pandas(tmp_path):
+    """Read-only streaming: blank header -> 'Unnamed: i', duplicate -> 'name.1', blank rows skipped."""
+    path = tmp_path / "repos.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append([REPO_URL_COL, None, "team", "team"])
+    ws.append(["https://github.com/a/b", 1, "x", "y"])
+    ws.append([None, None, None, None])
+    ws.append(["https://github.com/c/d"])
+    wb.save(path)
+
+    columns, rows = iter_input_rows(path)
+    assert columns == [REPO_URL_COL, "Unnamed: 1", "team", "team.1"]
+    rows = list(rows)
+    assert len(rows) == 2
+    assert rows[0] == {REPO_URL_COL: "https://github.com/a/b", "Unnamed: 1": 1, "team": "x", "team.1": "y"}
+    assert rows[1]["team"] is None
+    assert len(get_repo_rows(iter(rows))) == 2
+
+
+def test_iter_input_rows_uses_calamine_when_installed(tmp_path, monkeypatch):
+    """With python-calamine importable its rows are used; empty-string cells become None like openpyxl's."""
+    import sys
+    import types
+
+    from evaluator.spreadsheet import iter_input_rows
+
+    class FakeSheet:
+        def to_python(self, skip_empty_area=True):
+            return [["repo_url", "name"], ["https://github.com/a/b", ""], ["", ""], ["https://github.com/c/d", "x"]]
+
+    class FakeWorkbook:
+        @classmethod
+        def from_path(cls, path):
+            return cls()
+
+        def get_sheet_by_index(self, index):
+            return FakeSheet()
+
+    monkeypatch.setitem(sys.modules, "python_calamine", types.SimpleNamespace(CalamineWorkbook=FakeWorkbook))
+    path = tmp_path / "in.xlsx"
+    path.write_bytes(b"")
+    columns, rows = iter_input_rows(path)
+    assert columns == ["repo_url", "name"]
+    assert list(rows) == [
+        {"repo_url": "https://github.com/a/b", "name": None},
+        {"repo_url": "https://github.com/c/d", "name": "x"},
+    ]